@@ -110,12 +110,15 @@ Write-Log "Validated git repository successfully"
 # =================================================
 Write-Host "Locating release markers for Base: $BaseRelease and Target: $TargetRelease..." -ForegroundColor Yellow
 
-# This uses the exact logic from your 'Old' code which you verified works
-$BaseCommit = git log --oneline --grep="build.properties -> $BaseRelease" -n 1 |
-ForEach-Object { ($_ -split ' ')[0] }
-
-$TargetCommit = git log --oneline --grep="build.properties -> $TargetRelease" -n 1 |
-ForEach-Object { ($_ -split ' ')[0] }
+# Same "build.properties -> <Release>" markers, served from the index
+# release_markers.py keeps in the repository's .git folder
+$MarkerScript = Join-Path $ProjectRoot "python\release_markers.py"
+$Markers = @{}
+python $MarkerScript lookup --repo-path $RepoPath $BaseRelease $TargetRelease 2>$null |
+ForEach-Object { $Name, $Commit = $_ -split '=', 2; $Markers[$Name] = $Commit }
+
+$BaseCommit = $Markers[$BaseRelease]
+$TargetCommit = $Markers[$TargetRelease]
 
 # DEBUG: Check if we actually found them
 if (-not $BaseCommit) { 
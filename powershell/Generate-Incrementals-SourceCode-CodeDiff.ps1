@@ -91,11 +91,15 @@ if ($LASTEXITCODE -ne 0) {
 # =================================================
 Write-Host "Locating release markers..." -ForegroundColor Yellow
 
-$BaseCommit = git log --oneline --grep="build.properties -> $BaseRelease" -n 1 |
-ForEach-Object { ($_ -split ' ')[0] }
-
-$TargetCommit = git log --oneline --grep="build.properties -> $TargetRelease" -n 1 |
-ForEach-Object { ($_ -split ' ')[0] }
+# Same "build.properties -> <Release>" markers, served from the index
+# release_markers.py keeps in the repository's .git folder
+$MarkerScript = Join-Path $ProjectRoot "python\release_markers.py"
+$Markers = @{}
+python $MarkerScript lookup --repo-path $RepoPath $BaseRelease $TargetRelease 2>$null |
+ForEach-Object { $Name, $Commit = $_ -split '=', 2; $Markers[$Name] = $Commit }
+
+$BaseCommit = $Markers[$BaseRelease]
+$TargetCommit = $Markers[$TargetRelease]
 
 if (-not $BaseCommit -or -not $TargetCommit) {
     Write-Error "Base or Target release marker not found."
@@ -1,19 +1,14 @@
 import os
 import subprocess
-import shutil
 import logging
 import sys
-
-# ============================================================
-# ARGUMENTS (called from pipeline runner)
-# ============================================================
-
-if len(sys.argv) != 3:
-    print("Usage: python automate_release.py <RELEASE_VERSION> <BASE_DIR>")
-    sys.exit(1)
-
-RELEASE_VERSION = sys.argv[1]
-BASE_DIR = sys.argv[2]
+import argparse
+import zipfile
+import tempfile
+import time
+import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # ============================================================
 # PROJECT PATH RESOLUTION
@@ -38,124 +33,756 @@ os.makedirs(LOG_DIR, exist_ok=True)
 
 LOG_FILE = os.path.join(LOG_DIR, "zip.log")
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.FileHandler(LOG_FILE, encoding="utf-8"),
-        logging.StreamHandler()
-    ]
-)
 
-logging.info("========== ZIP + PGP Release Automation Started ==========")
-logging.info(f"Release Version: {RELEASE_VERSION}")
-logging.info(f"Base Directory: {BASE_DIR}")
+def setup_logging():
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.FileHandler(LOG_FILE, encoding="utf-8"),
+            logging.StreamHandler()
+        ]
+    )
 
 # ============================================================
-# PGP KEY IMPORT
+# ARGUMENTS (called from pipeline runner)
 # ============================================================
 
-def import_public_key():
-    if not os.path.exists(KEY_PATH):
-        raise Exception(f"Public key file not found at {KEY_PATH}")
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        usage=(
+            "python automate_release.py <RELEASE_VERSION> <BASE_DIR> [--keep-zip] [--workers N] [--force]"
+            " [--compression POLICY] [--level N]"
+        )
+    )
+    parser.add_argument("release_version")
+    parser.add_argument("base_dir")
+    parser.add_argument(
+        "--keep-zip",
+        action="store_true",
+        help="Also write the plaintext .zip next to the .pgp (off by default)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("RELEASE_ZIP_WORKERS", "0")),
+        help="Folders packaged in parallel (default: one per CPU, capped at the folder count)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild every folder even if its manifest says it is unchanged"
+    )
+    add_compression_args(parser)
+    return parser.parse_args(argv)
+
+
+def add_compression_args(parser):
+    parser.add_argument(
+        "--compression",
+        choices=COMPRESSION_POLICIES,
+        default=os.environ.get("RELEASE_ZIP_COMPRESSION", DEFAULT_COMPRESSION),
+        help=(
+            "auto: store already-compressed files, deflate the rest (default); "
+            "store: no compression; deflate: deflate everything; "
+            "zstd: like auto but zstd instead of deflate (Python 3.14+, needs a zstd-aware unzip)"
+        )
+    )
+    parser.add_argument(
+        "--level",
+        type=int,
+        default=None,
+        help="Compression level: deflate 0-9 (default 6), zstd 1-22 (default 3)"
+    )
 
-    logging.info("Importing company public key...")
 
-    # We wrap the KEY_PATH in double quotes to handle spaces in the username
-    subprocess.run(
-        f'gpg --batch --yes --import "{KEY_PATH}"',
-        shell=True,
-        check=True
+def parse_benchmark_args(argv):
+    parser = argparse.ArgumentParser(
+        usage="python automate_release.py benchmark <SAMPLE_FOLDER> [--policies LIST] [--repeat N] [--encrypt]"
+    )
+    parser.add_argument("sample_folder")
+    parser.add_argument(
+        "--policies",
+        default=",".join(BENCHMARK_POLICIES),
+        help="Comma-separated POLICY[:LEVEL] list (default: %(default)s)"
     )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs per policy; the fastest is reported (default: 3)"
+    )
+    parser.add_argument(
+        "--encrypt",
+        action="store_true",
+        help="Include gpg encryption in the timing"
+    )
+    return parser.parse_args(argv)
 
-def validate_key():
-    logging.info("Validating public key fingerprint...")
+# ============================================================
+# PGP KEY VALIDATION
+# ============================================================
+# gpg encrypts straight to keys/pub.asc (--recipient-file), so the
+# key is never imported and the user's keyring is never scanned.
+# The key file is parsed once, its fingerprint checked, and the
+# verdict cached by the file's sha256: later runs with the same key
+# spawn no gpg process for validation at all.
+
+KEY_CACHE_FILE = os.path.join(BASE_PROJECT_DIR, "keys", ".pub.asc.validated.json")
 
+
+def _key_fingerprints(key_path):
     result = subprocess.run(
-        ["gpg", "--list-keys", "--with-colons"],
+        [
+            "gpg", "--batch", "--with-colons",
+            "--import-options", "show-only", "--import", key_path
+        ],
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True,
         check=True
     )
+    return [
+        line.split(":")[9]
+        for line in result.stdout.splitlines()
+        if line.startswith("fpr:")
+    ]
+
+
+def load_release_key():
+    """Validate KEY_PATH against EXPECTED_FINGERPRINT. Returns the key file's sha256."""
+    if not os.path.exists(KEY_PATH):
+        raise Exception(f"Public key file not found at {KEY_PATH}")
 
-    if EXPECTED_FINGERPRINT not in result.stdout:
-        raise Exception("Expected public key fingerprint not found in keyring.")
+    with open(KEY_PATH, "rb") as f:
+        key_sha256 = hashlib.sha256(f.read()).hexdigest()
+
+    try:
+        with open(KEY_CACHE_FILE, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        cached = {}
+
+    if cached.get("keySha256") == key_sha256 and cached.get("fingerprint") == EXPECTED_FINGERPRINT:
+        logging.info("Public key unchanged since last validation, skipping gpg key check.")
+        return key_sha256
+
+    logging.info("Validating public key fingerprint...")
+
+    if EXPECTED_FINGERPRINT not in _key_fingerprints(KEY_PATH):
+        raise Exception(f"Expected public key fingerprint not found in {KEY_PATH}.")
+
+    try:
+        with open(KEY_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump({"keySha256": key_sha256, "fingerprint": EXPECTED_FINGERPRINT}, f)
+    except OSError:
+        logging.warning("Could not cache key validation result.")
 
     logging.info("Public key validated successfully.")
+    return key_sha256
 
 # ============================================================
-# ZIP FUNCTION
+# COMPRESSION POLICIES
 # ============================================================
+# Code_Diff and CSV incrementals shrink several times over, while
+# .ear/.war, images and office files are already compressed and
+# only burn CPU when deflated again. The policy picks the method
+# per file; the zip already compresses, so gpg's own compression
+# pass is switched off.
+
+COMPRESSION_POLICIES = ("auto", "store", "deflate", "zstd")
+DEFAULT_COMPRESSION = "auto"
+
+DEFAULT_LEVELS = {"deflate": 6, "zstd": 3}
+LEVEL_RANGES = {"deflate": (0, 9), "zstd": (1, 22)}
+
+# Stored as-is by the auto and zstd policies
+COMPRESSED_EXTENSIONS = {
+    ".ear", ".war", ".jar", ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".zst",
+    ".png", ".jpg", ".jpeg", ".gif", ".webp",
+    ".pdf", ".docx", ".xlsx", ".pptx",
+    ".pgp", ".gpg",
+}
+
+# zipfile only writes zstd entries from Python 3.14
+ZIP_ZSTANDARD = getattr(zipfile, "ZIP_ZSTANDARD", None)
+
+# zf.open(zinfo, "w") takes the entry's level from the ZipInfo only.
+# The attribute is public (compress_level) from Python 3.13; on 3.7 -
+# 3.12 it is CPython's private _compresslevel. ZipFile.write() would
+# take the level as an argument, but reads the file itself, so the
+# cache hash would cost a second read of every artifact.
+ZIPINFO_LEVEL = next((a for a in ("compress_level", "_compresslevel") if hasattr(zipfile.ZipInfo, a)), None)
+
+
+def compression_settings(policy=DEFAULT_COMPRESSION, level=None):
+    """Validate a policy/level pair. Returns the dict workers and manifests use."""
+    if policy not in COMPRESSION_POLICIES:
+        raise Exception(f"Unknown compression policy: {policy}")
+    if policy == "zstd" and ZIP_ZSTANDARD is None:
+        raise Exception("zstd compression needs Python 3.14+ (zipfile.ZIP_ZSTANDARD)")
+
+    method = "zstd" if policy == "zstd" else "deflate"
+    if policy == "store":
+        level = None
+    elif level is None:
+        level = DEFAULT_LEVELS[method]
+    else:
+        low, high = LEVEL_RANGES[method]
+        if not low <= level <= high:
+            raise Exception(f"{method} level must be between {low} and {high}, got {level}")
+    if level is not None and ZIPINFO_LEVEL is None:
+        raise Exception("This Python's zipfile cannot set a compression level per entry; use --compression store")
+
+    return {"policy": policy, "level": level}
+
+
+def _entry_compression(arcname, compression):
+    """(compress_type, level) for one archive member."""
+    policy = compression["policy"]
+
+    if policy == "store":
+        return zipfile.ZIP_STORED, None
+    if policy != "deflate" and os.path.splitext(arcname)[1].lower() in COMPRESSED_EXTENSIONS:
+        return zipfile.ZIP_STORED, None
+    if policy == "zstd":
+        return ZIP_ZSTANDARD, compression["level"]
+    return zipfile.ZIP_DEFLATED, compression["level"]
+
+# ============================================================
+# STREAMING ZIP + ENCRYPT
+# ============================================================
+# The zip is produced in chunks straight into gpg's stdin, so
+# each artifact is read once and written once (as the .pgp).
+# With --keep-zip the same stream is also teed to a .zip file.
+
+class _TeeWriter:
+    """Write-only, non-seekable stream fanning out to several sinks."""
+
+    def __init__(self, *sinks):
+        self.sinks = sinks
+
+    def write(self, data):
+        for sink in self.sinks:
+            sink.write(data)
+        return len(data)
+
+    def flush(self):
+        for sink in self.sinks:
+            sink.flush()
+
+
+class _HashingSink:
+    """Counts and hashes what goes to the kept .zip, for the cache."""
+
+    def __init__(self):
+        self.size = 0
+        self.digest = hashlib.sha256()
+
+    def write(self, data):
+        self.size += len(data)
+        self.digest.update(data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+
+COPY_CHUNK_BYTES = 1024 * 1024
+
+
+def _write_zip(folder_path, stream, compression):
+    """
+    Same layout as shutil.make_archive(folder_path, "zip", folder_path).
+    Returns the folder manifest, hashing each file as it is zipped so
+    the cache costs no extra read.
+    """
+    manifest = {"dirs": [], "files": {}}
+
+    with zipfile.ZipFile(stream, "w") as zf:
+        for root, dirs, files in os.walk(folder_path):
+            dirs.sort()
+            rel_root = os.path.relpath(root, folder_path)
+
+            for d in dirs:
+                arcname = os.path.normpath(os.path.join(rel_root, d))
+                zf.write(os.path.join(root, d), arcname)
+                manifest["dirs"].append(arcname.replace(os.sep, "/"))
+
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                arcname = os.path.normpath(os.path.join(rel_root, name))
+                st = os.stat(path)
+
+                zinfo = zipfile.ZipInfo.from_file(path, arcname)
+                zinfo.compress_type, level = _entry_compression(arcname, compression)
+                if level is not None:
+                    setattr(zinfo, ZIPINFO_LEVEL, level)
+                digest = hashlib.sha256()
+
+                with open(path, "rb") as src, zf.open(zinfo, "w", force_zip64=zinfo.file_size > zipfile.ZIP64_LIMIT) as dst:
+                    for chunk in iter(lambda: src.read(COPY_CHUNK_BYTES), b""):
+                        digest.update(chunk)
+                        dst.write(chunk)
+
+                manifest["files"][arcname.replace(os.sep, "/")] = {
+                    "size": st.st_size,
+                    "mtime": st.st_mtime_ns,
+                    "sha256": digest.hexdigest(),
+                }
+
+    return manifest
+
 
-def zip_folder(folder_path):
+def zip_and_encrypt(folder_path, keep_zip=False, compression=None, pgp_file=None):
+    """Returns (pgp file, manifest of the zipped folder)."""
+    compression = compression or compression_settings()
+    pgp_file = pgp_file or f"{folder_path}.pgp"
     zip_path = f"{folder_path}.zip"
 
-    logging.info(f"Zipping folder: {folder_path}")
+    logging.info(f"Zipping and encrypting folder: {folder_path}")
+
+    command = [
+        "gpg", "--batch", "--yes", "--trust-model", "always", "--armor",
+        "--compress-algo", "none",
+        "--output", pgp_file,
+        "--encrypt", "--recipient-file", KEY_PATH,
+    ]
+
+    # gpg's messages go to a temp file so they end up in this folder's log block
+    gpg_messages = tempfile.TemporaryFile()
+    process = subprocess.Popen(command, stdin=subprocess.PIPE, stderr=gpg_messages)
+    zip_file = open(zip_path, "wb") if keep_zip else None
+    zip_hash = _HashingSink() if keep_zip else None
+
+    manifest = None
+    broken_pipe = False
+
+    try:
+        sinks = [process.stdin] + ([zip_file, zip_hash] if zip_file else [])
+        manifest = _write_zip(folder_path, _TeeWriter(*sinks), compression)
+        process.stdin.close()
+    except BrokenPipeError:
+        # gpg exited before reading the whole zip; its messages explain why
+        broken_pipe = True
+    except Exception:
+        process.kill()
+        process.wait()
+        gpg_messages.close()
+        _remove_quietly(pgp_file)
+        raise
+    finally:
+        if zip_file:
+            zip_file.close()
+
+    process.wait()
+
+    gpg_messages.seek(0)
+    gpg_lines = gpg_messages.read().decode("utf-8", errors="replace").splitlines()
+    gpg_messages.close()
+    for line in gpg_lines:
+        logging.info(f"gpg: {line}")
+
+    if process.returncode != 0 or broken_pipe:
+        _remove_quietly(pgp_file)
+        if keep_zip:
+            _remove_quietly(zip_path)
+        reason = f"exit code {process.returncode}" + (", stopped reading the zip" if broken_pipe else "")
+        details = "; ".join(gpg_lines) or "no message from gpg"
+        raise Exception(f"gpg encryption failed for {folder_path} ({reason}): {details}")
+
+    if keep_zip:
+        manifest["zip"] = {
+            "size": zip_hash.size,
+            "mtime": os.stat(zip_path).st_mtime_ns,
+            "sha256": zip_hash.digest.hexdigest(),
+        }
+        logging.info(f"ZIP kept: {zip_path}")
+
+    logging.info(f"PGP encryption completed: {pgp_file}")
+    return pgp_file, manifest
 
-    shutil.make_archive(folder_path, "zip", folder_path)
 
-    logging.info(f"ZIP created: {zip_path}")
-    return zip_path
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
 
 # ============================================================
-# ENCRYPT FUNCTION
+# PACKAGE CACHE
 # ============================================================
+# <folder>.pgp.manifest.json records every file's size, mtime and
+# sha256 at the time the .pgp was built, and the same for the .zip
+# when --keep-zip kept one. A folder whose contents still match is not
+# packaged again, unless --keep-zip finds no .zip of that build. Files
+# whose size and mtime are unchanged keep their recorded hash; only
+# touched files are re-hashed.
 
-def pgp_encrypt(zip_file):
-    pgp_file = zip_file.replace(".zip", ".pgp")
+MANIFEST_VERSION = 1
 
-    logging.info(f"Encrypting ZIP: {zip_file}")
 
-    # Using a formatted string with quotes for all file paths
-    command = (
-        f'gpg --batch --yes --trust-model always --armor '
-        f'--output "{pgp_file}" --encrypt --recipient {EXPECTED_FINGERPRINT} "{zip_file}"'
-    )
+def _manifest_path(folder_path):
+    return f"{folder_path}.pgp.manifest.json"
 
-    subprocess.run(command, shell=True, check=True)
 
-    logging.info(f"PGP encryption completed: {pgp_file}")
-    return pgp_file
+def _sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(COPY_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
 
-    logging.info(f"PGP encryption completed: {pgp_file}")
-    return pgp_file
+
+def _load_manifest(folder_path):
+    try:
+        with open(_manifest_path(folder_path), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_manifest(folder_path, manifest):
+    path = _manifest_path(folder_path)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def _package_options(key_sha256, compression):
+    # Anything that changes the produced artifact invalidates the cache
+    return {
+        "version": MANIFEST_VERSION,
+        "fingerprint": EXPECTED_FINGERPRINT,
+        "keySha256": key_sha256,
+        "compression": compression,
+    }
+
+
+def _zip_matches(folder_path, cached):
+    """Whether <folder>.zip is the one written with the cached .pgp."""
+    recorded = cached.get("zip")
+    zip_path = f"{folder_path}.zip"
+    try:
+        st = os.stat(zip_path)
+    except OSError:
+        return False
+    if not recorded or st.st_size != recorded["size"]:
+        return False
+    if st.st_mtime_ns != recorded["mtime"]:
+        if _sha256_file(zip_path) != recorded["sha256"]:
+            return False
+        recorded["mtime"] = st.st_mtime_ns
+        _save_manifest(folder_path, cached)
+    return True
+
+
+def check_cache(folder_path, keep_zip, key_sha256, compression):
+    """
+    Return True when the existing .pgp was built from exactly the
+    current folder contents. Refreshes recorded mtimes of files that
+    were touched without changing.
+    """
+    cached = _load_manifest(folder_path)
+    pgp_file = f"{folder_path}.pgp"
+
+    if not cached or cached.get("options") != _package_options(key_sha256, compression):
+        return False
+    if not os.path.exists(pgp_file) or os.path.getsize(pgp_file) != cached.get("pgpSize"):
+        return False
+    if keep_zip and not _zip_matches(folder_path, cached):
+        return False
+
+    cached_files = cached.get("files", {})
+    dirs = []
+    seen = 0
+    touched = {}
+
+    for root, subdirs, files in os.walk(folder_path):
+        rel_root = os.path.relpath(root, folder_path)
+        dirs.extend(os.path.normpath(os.path.join(rel_root, d)).replace(os.sep, "/") for d in subdirs)
+
+        for name in files:
+            path = os.path.join(root, name)
+            rel = os.path.normpath(os.path.join(rel_root, name)).replace(os.sep, "/")
+            entry = cached_files.get(rel)
+            if entry is None:
+                return False
+
+            st = os.stat(path)
+            if st.st_size != entry["size"]:
+                return False
+            if st.st_mtime_ns != entry["mtime"]:
+                if _sha256_file(path) != entry["sha256"]:
+                    return False
+                touched[rel] = st.st_mtime_ns
+            seen += 1
+
+    if seen != len(cached_files) or sorted(dirs) != sorted(cached.get("dirs", [])):
+        return False
+
+    if touched:
+        for rel, mtime in touched.items():
+            cached_files[rel]["mtime"] = mtime
+        _save_manifest(folder_path, cached)
+
+    return True
+
+
+# ============================================================
+# PER-FOLDER WORKER
+# ============================================================
+# Folders are packaged in a process pool. Each worker buffers its
+# log records and hands them back with the result, so the log
+# shows every folder as one contiguous block instead of
+# interleaved lines from concurrent workers.
+
+class _BufferHandler(logging.Handler):
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        # Resolve args/exc_info now: records must survive pickling
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        self.records.append(record.__dict__.copy())
+
+
+def package_folder(folder_path, keep_zip, key_sha256, compression, force=False):
+    """
+    Zip + encrypt one folder. Never raises: returns a result dict
+    with status, timing, output size and the buffered log records.
+    """
+    root = logging.getLogger()
+    handler = _BufferHandler()
+    saved_handlers = root.handlers[:]
+    root.handlers = [handler]
+    root.setLevel(logging.INFO)
+
+    started = time.time()
+    result = {"folder": os.path.basename(folder_path), "status": None, "error": None, "size": 0}
+
+    try:
+        logging.info(f"Processing directory: {folder_path}")
+
+        if not force and check_cache(folder_path, keep_zip, key_sha256, compression):
+            logging.info(f"Unchanged since last build, reusing: {folder_path}.pgp")
+            result["status"] = "REUSED"
+            result["size"] = os.path.getsize(f"{folder_path}.pgp")
+        else:
+            _remove_quietly(_manifest_path(folder_path))
+            pgp_file, manifest = zip_and_encrypt(folder_path, keep_zip=keep_zip, compression=compression)
+            result["status"] = "REBUILT"
+            result["size"] = os.path.getsize(pgp_file)
+
+            manifest["options"] = _package_options(key_sha256, compression)
+            manifest["pgpSize"] = result["size"]
+            _save_manifest(folder_path, manifest)
+    except Exception as e:
+        logging.exception(f"Packaging failed: {folder_path}")
+        result["status"] = "FAILED"
+        result["error"] = str(e)
+    finally:
+        root.handlers = saved_handlers
+
+    result["elapsed"] = time.time() - started
+    result["records"] = handler.records
+    return result
+
+
+def _replay(result):
+    root = logging.getLogger()
+    for record in result.pop("records"):
+        root.handle(logging.makeLogRecord(record))
+
+
+def _log_summary(results):
+    width = max([len("Folder")] + [len(r["folder"]) for r in results])
+
+    logging.info("Packaging summary:")
+    logging.info(f"  {'Folder':<{width}}  {'Status':<8}  {'Time (s)':>8}  {'PGP size':>12}")
+    for r in sorted(results, key=lambda r: r["folder"]):
+        logging.info(
+            f"  {r['folder']:<{width}}  {r['status']:<8}  {r['elapsed']:>8.1f}  {r['size']:>12,}"
+            + (f"  {r['error']}" if r["error"] else "")
+        )
 
 # ============================================================
 # MAIN PROCESS
 # ============================================================
 
-def process_release():
+def process_release(base_dir, keep_zip=False, workers=0, force=False, compression=None):
+
+    if not os.path.exists(base_dir):
+        raise Exception(f"Base directory not found: {base_dir}")
+
+    compression = compression or compression_settings()
+
+    # Validate the release key once for the whole run
+    key_sha256 = load_release_key()
+
+    logging.info(f"Processing release folders inside: {base_dir}")
+
+    # Only process directories
+    folders = [
+        os.path.join(base_dir, item)
+        for item in sorted(os.listdir(base_dir))
+        if os.path.isdir(os.path.join(base_dir, item))
+    ]
+
+    if not folders:
+        logging.info("No release folders found.")
+        return
 
-    if not os.path.exists(BASE_DIR):
-        raise Exception(f"Base directory not found: {BASE_DIR}")
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(folders))
 
-    # Step 1: Import key automatically
-    import_public_key()
+    logging.info(f"Packaging {len(folders)} folder(s) with {workers} worker(s)")
+    logging.info(f"Compression: {compression['policy']} (level {compression['level']})")
 
-    # Step 2: Validate fingerprint
-    validate_key()
+    results = []
 
-    logging.info(f"Processing release folders inside: {BASE_DIR}")
+    if workers == 1:
+        for folder in folders:
+            result = package_folder(folder, keep_zip, key_sha256, compression, force)
+            _replay(result)
+            results.append(result)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(package_folder, folder, keep_zip, key_sha256, compression, force) for folder in folders]
+            for future in as_completed(futures):
+                result = future.result()
+                _replay(result)
+                results.append(result)
 
-    for item in os.listdir(BASE_DIR):
-        item_path = os.path.join(BASE_DIR, item)
+    _log_summary(results)
 
-        # Only process directories
-        if os.path.isdir(item_path):
-            logging.info(f"Processing directory: {item_path}")
-            zip_file = zip_folder(item_path)
-            pgp_encrypt(zip_file)
+    reused = [r["folder"] for r in results if r["status"] == "REUSED"]
+    rebuilt = [r["folder"] for r in results if r["status"] == "REBUILT"]
+    logging.info(f"Reused: {', '.join(reused) or '-'}")
+    logging.info(f"Rebuilt: {', '.join(rebuilt) or '-'}")
+
+    failed = [r["folder"] for r in results if r["status"] == "FAILED"]
+    if failed:
+        raise Exception(f"{len(failed)} folder(s) failed: {', '.join(failed)}")
 
     logging.info("All folders zipped and encrypted successfully.")
 
+# ============================================================
+# COMPRESSION BENCHMARK
+# ============================================================
+# python automate_release.py benchmark <SAMPLE_FOLDER>
+# Packages one sample folder with each policy and reports output
+# size, ratio and throughput, to pick the fastest acceptable setting.
+
+BENCHMARK_POLICIES = ("store", "auto:1", "auto:6", "auto:9", "deflate:6")
+
+
+class _CountingSink:
+    """Write-only stream that keeps nothing but the byte count."""
+
+    def __init__(self):
+        self.size = 0
+
+    def write(self, data):
+        self.size += len(data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+
+def _parse_policy(spec):
+    policy, _, level = spec.strip().partition(":")
+    return compression_settings(policy, int(level) if level else None)
+
+
+def _benchmark_once(folder_path, compression, encrypt):
+    started = time.perf_counter()
+    if encrypt:
+        with tempfile.TemporaryDirectory() as tmp:
+            pgp_file, _ = zip_and_encrypt(folder_path, compression=compression, pgp_file=os.path.join(tmp, "sample.pgp"))
+            size = os.path.getsize(pgp_file)
+    else:
+        sink = _CountingSink()
+        _write_zip(folder_path, sink, compression)
+        size = sink.size
+    return time.perf_counter() - started, size
+
+
+def run_benchmark(folder_path, specs, repeat=3, encrypt=False):
+    if not os.path.isdir(folder_path):
+        raise Exception(f"Sample folder not found: {folder_path}")
+
+    policies = [(spec.strip(), _parse_policy(spec)) for spec in specs if spec.strip()]
+    if encrypt:
+        load_release_key()
+
+    # Warm the page cache so the first policy isn't charged for disk reads
+    raw_size = 0
+    for root, _, files in os.walk(folder_path):
+        for name in files:
+            path = os.path.join(root, name)
+            raw_size += os.path.getsize(path)
+            _sha256_file(path)
+
+    logging.info(f"Benchmark sample: {folder_path} ({raw_size:,} bytes), best of {repeat}")
+
+    rows = []
+    for spec, compression in policies:
+        elapsed, size = min(_benchmark_once(folder_path, compression, encrypt) for _ in range(max(1, repeat)))
+        rows.append((spec, size, elapsed))
+
+    width = max([len("Policy")] + [len(r[0]) for r in rows])
+    logging.info(f"  {'Policy':<{width}}  {'Output':>14}  {'Ratio':>6}  {'Time (s)':>8}  {'MB/s':>8}")
+    for spec, size, elapsed in rows:
+        ratio = raw_size / size if size else 0
+        throughput = raw_size / elapsed / (1024 * 1024) if elapsed else 0
+        logging.info(f"  {spec:<{width}}  {size:>14,}  {ratio:>6.2f}  {elapsed:>8.2f}  {throughput:>8.1f}")
+
 # ============================================================
 # ENTRY POINT
 # ============================================================
 
 if __name__ == "__main__":
+    if sys.argv[1:2] == ["benchmark"]:
+        bench_args = parse_benchmark_args(sys.argv[2:])
+        setup_logging()
+        try:
+            run_benchmark(
+                bench_args.sample_folder,
+                bench_args.policies.split(","),
+                repeat=bench_args.repeat,
+                encrypt=bench_args.encrypt,
+            )
+        except Exception as e:
+            logging.exception("Compression benchmark failed")
+            sys.exit(1)
+        sys.exit(0)
+
+    args = parse_args()
+    setup_logging()
+
+    logging.info("========== ZIP + PGP Release Automation Started ==========")
+    logging.info(f"Release Version: {args.release_version}")
+    logging.info(f"Base Directory: {args.base_dir}")
+    logging.info(f"Keep plaintext ZIP: {args.keep_zip}")
+
     try:
-        process_release()
+        process_release(
+            args.base_dir,
+            keep_zip=args.keep_zip,
+            workers=args.workers,
+            force=args.force,
+            compression=compression_settings(args.compression, args.level),
+        )
         logging.info("========== ZIP + PGP Completed Successfully ==========")
     except Exception as e:
         logging.exception("ZIP + PGP Failed")
@@ -0,0 +1,270 @@
+import argparse
+import random
+import re
+import sys
+import time
+
+# ============================================================
+# DEPLOYMENT SECTIONS
+# ============================================================
+# Which deployment-document sections (2.1 - 2.12) a commit touches,
+# from its message and, when known, the files it changed.
+
+SECTION_ORDER = [
+    "2.1 Web server Changes",
+    "2.2 Maven Deployment Changes",
+    "2.3 App Server Changes",
+    "2.4 DB Changes- Environment Specific Changes",
+    "2.5 Queue Configuration Scripts",
+    "2.6 Scheduler jobs",
+    "2.7 Migration Scripts",
+    "2.8 Shell Script changes",
+    "2.9 Sql Script change",
+    "2.10 Cron Job changes",
+    "2.11 Keycloak Configuration changes",
+    "2.12 Scheduler Server changes",
+]
+
+SECTION_KEYWORDS = {
+    "2.1 Web server Changes": ["web", "nginx", "apache"],
+    "2.2 Maven Deployment Changes": ["maven", "pom.xml"],
+    "2.3 App Server Changes": ["ear", "war", "weblogic", "app server"],
+    "2.4 DB Changes- Environment Specific Changes": ["db", "ddl", "dml", "database"],
+    "2.5 Queue Configuration Scripts": ["queue", "jms", "mq"],
+    "2.6 Scheduler jobs": ["scheduler", "job"],
+    "2.7 Migration Scripts": ["migration", "migrate"],
+    "2.8 Shell Script changes": [".sh", "shell"],
+    "2.9 Sql Script change": [".sql", "sql"],
+    "2.10 Cron Job changes": ["cron"],
+    "2.11 Keycloak Configuration changes": ["keycloak"],
+    "2.12 Scheduler Server changes": ["scheduler server"],
+}
+
+# Changed files that put a commit in a section whatever its message says.
+# Globs match the whole path, case-insensitively; "**/" is any folder depth.
+SECTION_PATHS = {
+    "2.1 Web server Changes": ["**/nginx*.conf", "**/httpd*.conf", "**/.htaccess"],
+    "2.2 Maven Deployment Changes": ["**/pom.xml"],
+    "2.3 App Server Changes": ["**/weblogic*.xml", "**/application.xml"],
+    "2.5 Queue Configuration Scripts": ["**/*jms*.xml", "**/*queue*.xml"],
+    "2.7 Migration Scripts": ["**/migration/**", "**/migrations/**", "**/V*__*.sql"],
+    "2.8 Shell Script changes": ["**/*.sh"],
+    "2.9 Sql Script change": ["**/*.sql"],
+    "2.10 Cron Job changes": ["**/crontab*", "**/*.cron"],
+    "2.11 Keycloak Configuration changes": ["**/keycloak/**", "**/*realm*.json"],
+}
+
+# Marker commits only bump the version
+MARKER_PREFIX = "build.properties ->"
+
+# ============================================================
+# COMPILED MATCHERS
+# ============================================================
+# The keywords are compiled into an index of words ({word: sections})
+# and phrases ({(word, word): sections}). A message is split into
+# words by one regex and matched against the index with one set
+# intersection, so the cost does not grow with the number of keywords.
+# Keywords match whole words (plus plural / past-tense endings): "db"
+# no longer matches "feedback", nor "war" "software". Every keyword in
+# the message counts.
+
+# A word keeps the dot before it: "deploy.sh" is "deploy" ".sh", so an
+# extension keyword matches only as an extension
+_WORD = re.compile(r"\.?[a-z0-9]+")
+
+_INFLECTIONS = ("", "s", "es", "d", "ed", "ing")
+
+
+def _compile_keywords(section_keywords):
+    words = {}
+    phrases = {}
+
+    for section, keywords in section_keywords.items():
+        for keyword in keywords:
+            *head, last = _WORD.findall(keyword.lower())
+            endings = ("",) if last.startswith(".") else _INFLECTIONS
+            for ending in endings:
+                if head:
+                    phrases.setdefault((*head, last + ending), set()).add(section)
+                    continue
+                words.setdefault(last + ending, set()).add(section)
+                # "config.web" still mentions "web"
+                if not last.startswith("."):
+                    words.setdefault(f".{last}{ending}", set()).add(section)
+
+    freeze = lambda index: {key: frozenset(sections) for key, sections in index.items()}
+    return freeze(words), freeze(phrases)
+
+
+def _glob_pattern(glob):
+    parts = []
+    i = 0
+    while i < len(glob):
+        if glob.startswith("**/", i):
+            parts.append(r"(?:.*/)?")
+            i += 3
+        elif glob.startswith("**", i):
+            parts.append(r".*")
+            i += 2
+        elif glob[i] == "*":
+            parts.append(r"[^/]*")
+            i += 1
+        elif glob[i] == "?":
+            parts.append(r"[^/]")
+            i += 1
+        else:
+            parts.append(re.escape(glob[i]))
+            i += 1
+    return "".join(parts)
+
+
+def _compile_paths(section_paths):
+    return [
+        (section, re.compile("|".join(f"(?:{_glob_pattern(g)})" for g in globs) + r"\Z", re.IGNORECASE))
+        for section, globs in section_paths.items()
+    ]
+
+
+class Classifier:
+    """Message keywords and path rules compiled once; classify() per commit."""
+
+    def __init__(self, section_keywords=SECTION_KEYWORDS, section_paths=SECTION_PATHS, order=SECTION_ORDER):
+        self.order = order
+        self.words, self.phrases = _compile_keywords(section_keywords)
+        self.word_keys = frozenset(self.words)
+        self.phrase_heads = frozenset(phrase[0] for phrase in self.phrases)
+        self.phrase_lengths = sorted({len(phrase) for phrase in self.phrases})
+        self.paths = _compile_paths(section_paths)
+        self._path_cache = {}
+
+    def message_sections(self, message):
+        words = _WORD.findall(message.lower())
+        sections = set()
+
+        for word in self.word_keys.intersection(words):
+            sections |= self.words[word]
+
+        # Phrases are rare: walk the words only when one may start here
+        if not self.phrase_heads.isdisjoint(words):
+            for length in self.phrase_lengths:
+                for i in range(len(words) - length + 1):
+                    found = self.phrases.get(tuple(words[i:i + length]))
+                    if found:
+                        sections |= found
+        return sections
+
+    def path_sections(self, path):
+        path = path.replace("\\", "/")
+        sections = self._path_cache.get(path)
+        if sections is None:
+            sections = frozenset(section for section, rule in self.paths if rule.match(path))
+            self._path_cache[path] = sections
+        return sections
+
+    def classify(self, message, paths=()):
+        """Sections of one commit, in document order. Release marker commits have none."""
+        if message.lstrip().lower().startswith(MARKER_PREFIX):
+            return []
+        sections = self.message_sections(message)
+        for path in paths:
+            sections |= self.path_sections(path)
+        return [section for section in self.order if section in sections]
+
+
+_default = None
+
+
+def classify(message, paths=()):
+    """classify() of a shared Classifier with the standard sections."""
+    global _default
+    if _default is None:
+        _default = Classifier()
+    return _default.classify(message, paths)
+
+# ============================================================
+# BENCHMARK
+# ============================================================
+# python commit_classifier.py --benchmark [--commits N]
+# python commit_classifier.py --benchmark --repo-path PATH --range BASE..TARGET
+#
+# Times the classification stage of Generate-CommitSummary.ps1 (every
+# section x every keyword with a substring "-like" test, results
+# collected with "+=", which copies the array on every add) against
+# this classifier, on N synthetic messages or the subjects of a real
+# commit range.
+
+_WORDS = (
+    "fix update add remove refactor feedback software forward jobs queue db nginx config "
+    "keycloak realm migration sql shell script pom.xml weblogic apache cron scheduler server "
+    "ui angular dto service controller test logging null pointer release build"
+).split()
+
+
+def _legacy_stage(messages):
+    summary = []
+    details = {section: [] for section in SECTION_ORDER}
+    for message in messages:
+        summary = summary + [message]
+        if message.lower().startswith(MARKER_PREFIX):
+            continue
+        lower = message.lower()
+        for section in SECTION_ORDER:
+            for keyword in SECTION_KEYWORDS[section]:
+                if keyword in lower:
+                    details[section] = details[section] + [message]
+                    break
+    return details
+
+
+def _compiled_stage(messages, classifier):
+    summary = []
+    details = {section: [] for section in SECTION_ORDER}
+    for message in messages:
+        summary.append(message)
+        for section in classifier.classify(message):
+            details[section].append(message)
+    return details
+
+
+def _synthetic_messages(commits, seed=7):
+    rng = random.Random(seed)
+    return [
+        f"ABC-{rng.randint(1, 99999)} " + " ".join(rng.choice(_WORDS) for _ in range(rng.randint(3, 14)))
+        for _ in range(commits)
+    ]
+
+
+def benchmark(messages):
+    classifier = Classifier()
+    stages = (
+        ("PS keyword loop (ported)", _legacy_stage),
+        ("compiled classifier", lambda m: _compiled_stage(m, classifier)),
+    )
+    for name, stage in stages:
+        start = time.perf_counter()
+        details = stage(messages)
+        elapsed = time.perf_counter() - start
+        hits = sum(len(entries) for entries in details.values())
+        print(f"{name:26s}: {elapsed:7.3f}s for {len(messages)} commits ({hits} section entries)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--benchmark", action="store_true", help="Time against the PS keyword loop")
+    parser.add_argument("--commits", type=int, default=50000, help="Synthetic messages to benchmark on")
+    parser.add_argument("--repo-path", help="Benchmark on the commit subjects of --range in this repository")
+    parser.add_argument("--range", help="Commit range, e.g. BASE^..TARGET")
+    parser.add_argument("messages", nargs="*", help="Commit messages to classify")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        if args.repo_path:
+            from git_engine import git
+            messages = git(args.repo_path, "log", "--format=%s", args.range or "HEAD").splitlines()
+        else:
+            messages = _synthetic_messages(args.commits)
+        benchmark(messages)
+        sys.exit(0)
+
+    for message in args.messages or (line.rstrip("\n") for line in sys.stdin):
+        print(f"{message} -> {', '.join(classify(message)) or '-'}")
@@ -0,0 +1,257 @@
+import argparse
+import json
+import os
+import re
+import shutil
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from commit_classifier import SECTION_ORDER, Classifier
+from generate_incrementals import DEFAULT_APP_NAME, DEFAULT_REPO_PATH, REPORT_ROOT, STATUS_NAMES, resolve_markers
+from git_engine import DEFAULT_MARKER_REF, DEFAULT_REPO_JOBS, GitError, finish, git_stream, map_repositories, records, repositories
+
+# ============================================================
+# PROJECT PATH RESOLUTION
+# ============================================================
+# Same outputs as Generate-CommitSummary.ps1, for one repository or
+# several: Report-output/<App>_<Variant>/<Target> is the release root,
+# the TXT and JSON go to <Target>_<APP>_Deployment_Document next to
+# it and are copied to the report generator's json_files folder.
+
+BASE_PROJECT_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+
+JSON_COPY_FOLDER = os.path.join(BASE_PROJECT_DIR, "python", "release-report-generator", "json_files")
+LOG_FILE = os.path.join(BASE_PROJECT_DIR, "logs", "deployment_doc_generator.log")
+
+
+def write_log(message, level="INFO"):
+    os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    with open(LOG_FILE, "a", encoding="utf-8") as f:
+        f.write(f"[{timestamp}] [{level}] {message}\n")
+
+# ============================================================
+# ARGUMENTS (called from pipeline runner)
+# ============================================================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        usage=(
+            "python generate_commit_summary.py --base-release R --target-release R --jira-ref REF"
+            " [--repo-path [NAME=]PATH ...] [--ref REF] [--jobs N] [--app-name NAME] [--app-variant VARIANT]"
+        )
+    )
+    parser.add_argument(
+        "--repo-path", action="append",
+        help='Repository, repeatable or ";"-separated; NAME= labels its commits in the merged JSON',
+    )
+    parser.add_argument("--ref", default=DEFAULT_MARKER_REF, help="Branch or tag whose history holds the release markers")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_REPO_JOBS, help="Repositories processed at once")
+    parser.add_argument("--base-release", required=True)
+    parser.add_argument("--target-release", required=True)
+    parser.add_argument("--jira-ref", required=True)
+    parser.add_argument("--app-name", default=DEFAULT_APP_NAME)
+    parser.add_argument("--app-variant", default="DEV")
+    return parser.parse_args(argv)
+
+ISSUE = re.compile(r"[A-Z]+-\d+")
+
+# ============================================================
+# COMMITS
+# ============================================================
+# One "git log -z --raw --numstat" over the ancestry path gives every
+# commit with its changed files: the --raw entries carry the status
+# (and both paths of a rename), the --numstat entries the lines added
+# and deleted. The stream is NUL-separated, so paths need no
+# unquoting; each commit header starts with \x1e and its fields are
+# separated by \x1f, so an author or subject containing "|" stays whole.
+
+HEADER = "\x1e"
+FIELD = "\x1f"
+
+
+def _parse_log(tokens, repo_name):
+    """Yield commitSummary entries from the NUL-separated tokens of the log."""
+    commit = None
+    files = {}
+
+    for token in tokens:
+        token = token.lstrip("\n")
+        if token.startswith(HEADER):
+            if commit:
+                yield commit
+            commit_id, author, date, message = token[1:].split(FIELD, 3)
+            files = {}
+            commit = {
+                "commitId": commit_id,
+                "author": author,
+                "date": date,
+                "issues": ", ".join(ISSUE.findall(message)),
+                "message": message,
+                "repository": repo_name,
+                "files": [],
+            }
+            continue
+
+        if token.startswith(":"):
+            # ":100644 100644 <old> <new> R086" then the path, or old and new path
+            status = token.split(" ")[-1]
+            paths = [next(tokens)]
+            if status[0] in "RC":
+                paths.append(next(tokens))
+            entry = {
+                "path": paths[-1],
+                "status": STATUS_NAMES.get(status[0], "Changed"),
+                "insertions": None,
+                "deletions": None,
+            }
+            if len(paths) == 2:
+                entry["oldPath"] = paths[0]
+            files[paths[-1]] = entry
+            commit["files"].append(entry)
+            continue
+
+        if token:
+            # "<added>\t<deleted>\t<path>", or "...\t" then old and new path; "-" for binary files
+            added, deleted, path = token.split("\t", 2)
+            if not path:
+                next(tokens)
+                path = next(tokens)
+            entry = files.get(path)
+            if entry is not None and added != "-":
+                entry["insertions"] = int(added)
+                entry["deletions"] = int(deleted)
+
+    if commit:
+        yield commit
+
+
+def repository_commits(repo, base_commit, target_commit):
+    """The commits from base (inclusive) to target along the ancestry path, with their changed files."""
+    process = git_stream(
+        repo.path, "log", "-z", "--raw", "--numstat", "--ancestry-path",
+        f"{base_commit}^..{target_commit}",
+        f"--format={HEADER}%h{FIELD}%an{FIELD}%ad{FIELD}%s", "--date=format:%d-%b-%Y",
+    )
+    try:
+        commits = list(_parse_log(records(process.stdout), repo.name))
+    finally:
+        finish(process, "log")
+    return commits
+
+
+def summarize(repo, base_release, target_release, ref):
+    base_commit, target_commit = resolve_markers(repo, base_release, target_release, ref)
+    write_log(f"[{repo.name}] Extracting commits between {base_commit} and {target_commit}")
+    return base_commit, target_commit, repository_commits(repo, base_commit, target_commit)
+
+# ============================================================
+# OUTPUT
+# ============================================================
+
+def generate_commit_summary(repos, base_release, target_release, jira_ref, app_name, app_variant="DEV",
+                            jobs=DEFAULT_REPO_JOBS, ref=DEFAULT_MARKER_REF):
+    """Returns (release root, txt path, json path)."""
+    multi = len(repos) > 1
+    app_variant = re.sub(r"[^A-Z0-9_]", "", (app_variant or "DEV").upper())
+
+    release_root = Path(REPORT_ROOT) / f"{app_name}_{app_variant}" / target_release
+    reports_root = release_root.parent / f"{release_root.name}_{app_name[:3].upper()}_Deployment_Document"
+
+    write_log("========== Deployment Document Generator Started ==========")
+    write_log(
+        f"Inputs | Repo={';'.join(repo.path for repo in repos)} | Base={base_release}"
+        f" | Target={target_release} | App={app_name} | Jira={jira_ref}"
+    )
+
+    # ---------- markers and commits, one job per repository ----------
+    print(f"Locating release markers for Base: {base_release} and Target: {target_release}...")
+    try:
+        results = map_repositories(repos, lambda repo: summarize(repo, base_release, target_release, ref), jobs)
+    except GitError as e:
+        write_log(str(e), "ERROR")
+        raise
+
+    reports_root.mkdir(parents=True, exist_ok=True)
+    print(f"Reports Root: {reports_root}")
+
+    classifier = Classifier()
+    commit_summary = []
+    deployment_details = {section: [] for section in SECTION_ORDER}
+
+    header = "CommitId | Author | CommitDate | Issues | Message"
+    txt_lines = [f"Repository | {header}" if multi else header, "-" * 50]
+
+    for repo, (base_commit, target_commit, commits) in zip(repos, results):
+        label = f"[{repo.name}] " if multi else ""
+        print(f"{label}Base Commit   : {base_commit}")
+        print(f"{label}Target Commit : {target_commit}")
+
+        for commit in commits:
+            fields = [commit["commitId"], commit["author"], commit["date"], commit["issues"], commit["message"]]
+            txt_lines.append(" | ".join([repo.name, *fields] if multi else fields))
+            commit_summary.append(commit)
+
+            paths = [changed["path"] for changed in commit["files"]]
+            for section in classifier.classify(commit["message"], paths):
+                deployment_details[section].append(commit["message"])
+
+    write_log("Commit processing and classification completed")
+
+    final_json = {
+        "release": target_release,
+        "baseRelease": base_release,
+        "targetRelease": target_release,
+        "appName": app_name,
+        "generatedOn": datetime.now().strftime("%d-%b-%Y"),
+        "repositories": [repo.name for repo in repos],
+        "commitSummary": commit_summary,
+        "deploymentDetails": deployment_details,
+    }
+
+    txt_path = reports_root / f"{jira_ref}_{app_name}_DeploymentDetails.txt"
+    json_path = reports_root / f"{jira_ref}_{app_name}_DeploymentDetails.json"
+
+    with open(txt_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(txt_lines) + "\n")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(final_json, f, indent=4, ensure_ascii=False)
+    write_log(f"Generated output files | TXT={txt_path} | JSON={json_path}")
+
+    # ---------- copy to the report generator ----------
+    os.makedirs(JSON_COPY_FOLDER, exist_ok=True)
+    shutil.copy2(json_path, JSON_COPY_FOLDER)
+    shutil.copy2(txt_path, JSON_COPY_FOLDER)
+    print(f"Copied JSON to: {JSON_COPY_FOLDER}")
+    write_log(f"Copied JSON to {JSON_COPY_FOLDER}")
+
+    write_log("========== Deployment Document Generator Completed ==========")
+    return release_root, txt_path, json_path
+
+# ============================================================
+# ENTRY POINT
+# ============================================================
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    try:
+        release_root, txt_path, json_path = generate_commit_summary(
+            repositories(args.repo_path or [DEFAULT_REPO_PATH]),
+            args.base_release, args.target_release,
+            args.jira_ref, args.app_name, args.app_variant, args.jobs, args.ref,
+        )
+    except GitError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print("")
+    print("==============================================")
+    print(" Release Deployment Details Generated")
+    print(f"RELEASE_ROOT={release_root}")
+    print(f" TXT  : {txt_path}")
+    print(f" JSON : {json_path}")
+    print("==============================================")
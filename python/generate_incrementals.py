@@ -0,0 +1,279 @@
+import argparse
+import csv
+import os
+import re
+import sys
+from collections import namedtuple
+from pathlib import Path, PureWindowsPath
+
+from git_engine import (
+    COPY_CHUNK_BYTES, DEFAULT_MARKER_REF, DEFAULT_REPO_JOBS, CatFile, GitError, check_repository, finish, git_stream,
+    map_repositories, repositories, unquote_path,
+)
+from release_markers import lookup
+
+# ============================================================
+# PROJECT PATH RESOLUTION
+# ============================================================
+
+BASE_PROJECT_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+
+REPORT_ROOT = os.path.join(BASE_PROJECT_DIR, "Report-output")
+
+# Same defaults as run_release.ps1
+DEFAULT_REPO_PATH = os.environ.get("RELEASE_REPO_PATH", r"C:\Codebases\bnpp_csc_so_ST")
+DEFAULT_APP_NAME = "BNPP_CSC_SO"
+
+# ============================================================
+# ARGUMENTS (called from pipeline runner)
+# ============================================================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        usage=(
+            "python generate_incrementals.py --base-release R --target-release R --jira-ref REF"
+            " [--repo-path [NAME=]PATH ...] [--ref REF] [--jobs N] [--app-name NAME] [--output-folder LABEL]"
+        )
+    )
+    parser.add_argument(
+        "--repo-path", action="append",
+        help='Repository, repeatable or ";"-separated; NAME= labels it in the merged CSV',
+    )
+    parser.add_argument("--ref", default=DEFAULT_MARKER_REF, help="Branch or tag whose history holds the release markers")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_REPO_JOBS, help="Repositories processed at once")
+    parser.add_argument("--base-release", required=True)
+    parser.add_argument("--target-release", required=True)
+    parser.add_argument("--output-folder", default="", help="Optional label appended to the release folder name")
+    parser.add_argument("--jira-ref", required=True)
+    parser.add_argument("--app-name", default=DEFAULT_APP_NAME)
+    return parser.parse_args(argv)
+
+# ============================================================
+# RELEASE OUTPUT STRUCTURE
+# ============================================================
+# Report-output/<AppName>/<Target>[_<Label>] is the release root;
+# the Incrementals / Source_Code / Code_Diff folders sit next to it.
+# Same layout as Generate-Incrementals-SourceCode-CodeDiff.ps1.
+
+ReleaseLayout = namedtuple("ReleaseLayout", "release_root incrementals source_code code_diff")
+
+
+def release_layout(app_name, target_release, output_folder=""):
+    # The backend may send a path like .\release_R26.0.10; keep only a clean label
+    label = ""
+    if output_folder and output_folder.strip():
+        label = PureWindowsPath(output_folder).name
+        label = re.sub(r"^release_", "", label)
+        label = re.sub(r"[^a-zA-Z0-9._-]", "", label)
+        if label == target_release:
+            label = ""
+
+    release_name = f"{target_release}_{label}" if label.strip() else target_release
+    release_root = Path(REPORT_ROOT) / app_name / release_name
+
+    prefix = f"{release_name}_{app_name[:3].upper()}"
+    parent = release_root.parent
+    return ReleaseLayout(
+        release_root,
+        parent / f"{prefix}_Incrementals",
+        parent / f"{prefix}_Source_Code",
+        parent / f"{prefix}_Code_Diff",
+    )
+
+# ============================================================
+# SINGLE-PASS DIFF
+# ============================================================
+# One "git diff --raw --patch" gives both the name-status list
+# (with full blob ids, from --raw) and the patch. The raw lines are
+# turned into CSV rows as they arrive; the patch that follows is
+# copied to the .diff file untouched.
+
+CSV_COLUMNS = ["S. NO.", "File Name", "Status", "JIRA / Release Reference"]
+
+STATUS_NAMES = {"A": "Added", "M": "Modified", "D": "Deleted", "R": "Renamed"}
+
+# Statuses whose new version is exported to the Source_Code folder
+EXPORTED_STATUSES = ("Added", "Modified", "Renamed")
+
+# Submodule entries point at a commit in another repository, not a blob
+GITLINK_MODE = "160000"
+
+DiffEntry = namedtuple("DiffEntry", "path status blob mode")
+
+
+def _parse_raw(line):
+    # ":100644 100644 <old blob> <new blob> R086\told path\tnew path"
+    meta, *paths = line.rstrip("\n").split("\t")
+    _, new_mode, _, new_blob, status_code = meta[1:].split(" ")
+    return DiffEntry(
+        unquote_path(paths[-1]),
+        STATUS_NAMES.get(status_code[0], "Changed"),
+        new_blob,
+        new_mode,
+    )
+
+
+def diff_entries(stdout, patch_out):
+    """Yield DiffEntry per changed file, copying the patch part of the stream to patch_out."""
+    for line in stdout:
+        if line.startswith(b":"):
+            yield _parse_raw(line.decode("utf-8", "replace"))
+            continue
+
+        # End of the raw section: git separates it from the patch with a blank line
+        if line.strip():
+            patch_out.write(line)
+        for chunk in iter(lambda: stdout.read1(COPY_CHUNK_BYTES), b""):
+            patch_out.write(chunk)
+        return
+
+# ============================================================
+# INCREMENTALS
+# ============================================================
+# Each repository is diffed on its own (own markers, own patch file,
+# own Source_Code subfolder when there are several); the rows merge
+# into one CSV with a Repository column.
+
+RepoDiff = namedtuple("RepoDiff", "repo base_commit target_commit entries diff_path exported")
+
+
+def export_blobs(repo_path, entries, destination):
+    """Write each entry's blob from the object database (not the working tree) under destination."""
+    count = 0
+    with CatFile(repo_path) as objects:
+        for entry in entries:
+            target = destination / entry.path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with open(target, "wb") as out:
+                objects.copy_blob(entry.blob, out)
+            count += 1
+    return count
+
+
+def resolve_markers(repo, base_release, target_release, ref=DEFAULT_MARKER_REF):
+    """(base commit, target commit) of one repository, both from ref's history."""
+    if not os.path.isdir(repo.path):
+        raise GitError(f"Repository path does not exist: {repo.path}")
+    check_repository(repo.path)
+
+    markers = lookup(repo.path, [base_release, target_release], ref)
+    missing = [r for r in (base_release, target_release) if r not in markers]
+    if missing:
+        raise GitError(f"Release marker not found for: {', '.join(missing)}")
+    return markers[base_release], markers[target_release]
+
+
+def diff_repository(repo, base_commit, target_commit, diff_path, source_code):
+    """One diff: entries collected, patch copied to diff_path, changed files exported under source_code."""
+    entries = []
+    exports = []
+
+    process = git_stream(
+        repo.path, "diff", "--raw", "--patch", "--no-abbrev", "--no-color",
+        base_commit, target_commit,
+    )
+    try:
+        with open(diff_path, "wb") as patch_out:
+            for entry in diff_entries(process.stdout, patch_out):
+                entries.append(entry)
+                if entry.status in EXPORTED_STATUSES and entry.mode != GITLINK_MODE:
+                    exports.append(entry)
+    finally:
+        finish(process, "diff")
+
+    if not entries:
+        diff_path.unlink()
+        return RepoDiff(repo, base_commit, target_commit, entries, None, 0)
+
+    # ---------- changed files, straight from the target commit ----------
+    exported = export_blobs(repo.path, exports, source_code)
+    return RepoDiff(repo, base_commit, target_commit, entries, diff_path, exported)
+
+
+def generate_incrementals(repos, base_release, target_release, jira_ref, app_name, output_folder="",
+                          jobs=DEFAULT_REPO_JOBS, ref=DEFAULT_MARKER_REF):
+    """Returns (release root, csv path or None when nothing changed, [diff paths])."""
+    multi = len(repos) > 1
+
+    # ---------- release markers, from each repository's index ----------
+    print("Locating release markers...")
+    markers = map_repositories(repos, lambda repo: resolve_markers(repo, base_release, target_release, ref), jobs)
+    for repo, (base_commit, target_commit) in zip(repos, markers):
+        label = f"[{repo.name}] " if multi else ""
+        print(f"{label}Base Commit   : {base_commit}")
+        print(f"{label}Target Commit : {target_commit}")
+
+    layout = release_layout(app_name, target_release, output_folder)
+    for folder in layout[1:]:
+        folder.mkdir(parents=True, exist_ok=True)
+    print(f"Release Root: {layout.release_root}")
+
+    # ---------- one diff per repository, in parallel ----------
+    commits = dict(zip(repos, markers))
+
+    def run(repo):
+        base_commit, target_commit = commits[repo]
+        if not multi:
+            return diff_repository(
+                repo, base_commit, target_commit,
+                layout.code_diff / f"{jira_ref}_{app_name}_CodeDiff.diff", layout.source_code,
+            )
+        return diff_repository(
+            repo, base_commit, target_commit,
+            layout.code_diff / f"{jira_ref}_{app_name}_{repo.name}_CodeDiff.diff", layout.source_code / repo.name,
+        )
+
+    diffs = map_repositories(repos, run, jobs)
+
+    rows = sum(len(diff.entries) for diff in diffs)
+    if not rows:
+        print("No changes found between releases.")
+        return layout.release_root, None, []
+
+    # ---------- merged CSV, repositories in the order given ----------
+    csv_path = layout.incrementals / f"{jira_ref}_Incrementals.csv"
+    with open(csv_path, "w", encoding="utf-8", newline="") as csv_file:
+        writer = csv.writer(csv_file, quoting=csv.QUOTE_ALL)
+        writer.writerow(CSV_COLUMNS[:1] + ["Repository"] + CSV_COLUMNS[1:] if multi else CSV_COLUMNS)
+
+        number = 0
+        for diff in diffs:
+            for entry in diff.entries:
+                number += 1
+                row = [entry.path, entry.status, jira_ref]
+                writer.writerow([number, diff.repo.name, *row] if multi else [number, *row])
+
+    for diff in diffs:
+        label = f"[{diff.repo.name}] " if multi else ""
+        print(f"{label}Files changed : {len(diff.entries)}")
+        print(f"{label}Files exported: {diff.exported}")
+    return layout.release_root, csv_path, [diff.diff_path for diff in diffs if diff.diff_path]
+
+# ============================================================
+# ENTRY POINT
+# ============================================================
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    try:
+        release_root, csv_path, diff_paths = generate_incrementals(
+            repositories(args.repo_path or [DEFAULT_REPO_PATH]),
+            args.base_release, args.target_release,
+            args.jira_ref, args.app_name, args.output_folder, args.jobs, args.ref,
+        )
+    except GitError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print("")
+    print("==============================================")
+    print(" Incrementals & CodeDiff Generated Successfully")
+    print(f"RELEASE_ROOT={release_root}")
+    if csv_path:
+        print(f" CSV  : {csv_path}")
+        for diff_path in diff_paths:
+            print(f" DIFF : {diff_path}")
+    print("==============================================")
@@ -0,0 +1,285 @@
+import os
+import re
+import subprocess
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# ============================================================
+# GIT PROCESS HELPERS
+# ============================================================
+# Thin wrappers over the git CLI shared by the release steps. Every
+# call streams: output is consumed line by line (or blob by blob)
+# as git produces it, never collected into one string first.
+
+COPY_CHUNK_BYTES = 1024 * 1024
+
+# Paths print as-is instead of "\303\251"-style escapes
+GIT = ["git", "-c", "core.quotePath=false"]
+
+
+class GitError(Exception):
+    pass
+
+
+def git(repo_path, *args):
+    """Run one git command and return its stdout as text."""
+    result = subprocess.run(
+        [*GIT, "-C", repo_path, *args],
+        capture_output=True, text=True, encoding="utf-8", errors="replace",
+    )
+    if result.returncode != 0:
+        raise GitError(f"git {args[0]} failed: {result.stderr.strip()}")
+    return result.stdout
+
+
+def git_stream(repo_path, *args):
+    """Start a git command with its stdout as a binary pipe."""
+    return subprocess.Popen(
+        [*GIT, "-C", repo_path, *args],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+    )
+
+
+def finish(process, what, stopped_early=False):
+    """Wait for a git_stream process; raise on failure unless we closed it on purpose."""
+    if stopped_early:
+        process.kill()
+    process.stdout.close()
+    stderr = process.stderr.read().decode("utf-8", "replace").strip()
+    process.stderr.close()
+    process.wait()
+    if process.returncode != 0 and not stopped_early:
+        raise GitError(f"git {what} failed: {stderr}")
+
+
+def check_repository(repo_path):
+    git(repo_path, "rev-parse", "--is-inside-work-tree")
+
+
+_ESCAPES = {"a": 7, "b": 8, "t": 9, "n": 10, "v": 11, "f": 12, "r": 13, '"': 34, "\\": 92}
+
+
+def unquote_path(path):
+    """Undo git's C-style quoting of paths with tabs, newlines, quotes or backslashes."""
+    if not (path.startswith('"') and path.endswith('"')):
+        return path
+
+    raw = bytearray()
+    body = path[1:-1].encode("utf-8")
+    i = 0
+    while i < len(body):
+        char = body[i]
+        if char != 0x5C:            # backslash
+            raw.append(char)
+            i += 1
+            continue
+        following = chr(body[i + 1])
+        if following in "01234567":
+            raw.append(int(body[i + 1:i + 4], 8))
+            i += 4
+        else:
+            raw.append(_ESCAPES.get(following, ord(following)))
+            i += 2
+    return raw.decode("utf-8", "replace")
+
+# ============================================================
+# RELEASE MARKERS
+# ============================================================
+# A release is marked by the commit whose message records the
+# version bump, e.g. "build.properties -> R26.0.10". As with the
+# original "git log --grep ... -n 1", only the history of one ref
+# (HEAD by default) is searched and the first marker git lists wins:
+# the same version can be marked on several branches (_DEV is merged
+# into _ST), and base and target must come from the same history for
+# "diff base target" and "--ancestry-path" to mean anything.
+# release_markers.py keeps the results in a persistent index.
+
+# A regex, as in the original "git log --grep": the "." matches any
+# character, and real markers are written both "build.properties -> R..."
+# and "build properties -> R..."
+MARKER_GREP = "build.properties -> "
+DEFAULT_MARKER_REF = "HEAD"
+MARKER = re.compile(r"build.properties -> ([A-Za-z0-9][A-Za-z0-9._-]*[A-Za-z0-9])")
+
+
+def marker_releases(message):
+    """Release versions a commit message marks."""
+    return MARKER.findall(message)
+
+
+def scan_markers(repo_path, revisions):
+    """
+    Yield (release, commit sha, commit time) for every marker commit
+    in the given revisions ("sha" to include, "^sha" to exclude), in
+    git log order. git does the filtering (--grep); revisions
+    go through stdin, so any number of refs fits.
+    """
+    process = subprocess.Popen(
+        [*GIT, "-C", repo_path, "log", "--stdin", "-z", "--format=%H%n%ct%n%B",
+         f"--grep={MARKER_GREP}"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+    )
+    # git reads every revision before it prints anything, so this cannot block
+    process.stdin.write("".join(f"{rev}\n" for rev in revisions).encode("ascii"))
+    process.stdin.close()
+
+    stopped_early = True
+    try:
+        for record in records(process.stdout):
+            sha, _, rest = record.partition("\n")
+            commit_time, _, message = rest.partition("\n")
+            for release in marker_releases(message):
+                yield release, sha, int(commit_time)
+        stopped_early = False
+    finally:
+        finish(process, "log", stopped_early)
+
+
+def resolve_ref(repo_path, ref):
+    """Commit sha a ref (branch, tag, HEAD, sha) points to."""
+    return git(repo_path, "rev-parse", "--verify", "--end-of-options", f"{ref}^{{commit}}").strip()
+
+
+def is_ancestor(repo_path, ancestor, descendant):
+    """True when ancestor is in descendant's history (False also when it no longer exists)."""
+    result = subprocess.run(
+        [*GIT, "-C", repo_path, "merge-base", "--is-ancestor", ancestor, descendant],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    return result.returncode == 0
+
+
+def missing_objects(repo_path, object_ids):
+    """The ids among object_ids that are not in the repository (any more)."""
+    if not object_ids:
+        return []
+    result = subprocess.run(
+        [*GIT, "-C", repo_path, "cat-file", "--batch-check"],
+        input="".join(f"{oid}\n" for oid in object_ids),
+        capture_output=True, text=True, encoding="utf-8",
+    )
+    return [line.split()[0] for line in result.stdout.splitlines() if line.endswith(" missing")]
+
+
+def git_dir(repo_path):
+    """The repository's (common) .git directory, shared by all worktrees."""
+    path = git(repo_path, "rev-parse", "--git-common-dir").strip()
+    return os.path.join(repo_path, path) if not os.path.isabs(path) else path
+
+
+def records(stream, separator=b"\0"):
+    """Split a -z git stream into text records without reading it all."""
+    pending = b""
+    for chunk in iter(lambda: stream.read1(COPY_CHUNK_BYTES), b""):
+        pending += chunk
+        *complete, pending = pending.split(separator)
+        for record in complete:
+            yield record.decode("utf-8", "replace")
+    if pending.strip():
+        yield pending.decode("utf-8", "replace")
+
+# ============================================================
+# OBJECT DATABASE
+# ============================================================
+
+class CatFile:
+    """
+    One long-running "git cat-file --batch" serving blobs by id, so
+    exporting N files costs one process instead of N copies or
+    N "git show" calls.
+    """
+
+    def __init__(self, repo_path):
+        self.process = subprocess.Popen(
+            [*GIT, "-C", repo_path, "cat-file", "--batch"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        )
+
+    def copy_blob(self, object_id, out):
+        """Write the blob's bytes to the binary file out; returns its size."""
+        self.process.stdin.write(object_id.encode("ascii") + b"\n")
+        self.process.stdin.flush()
+
+        header = self.process.stdout.readline().decode("utf-8", "replace").split()
+        if len(header) != 3 or header[1] != "blob":
+            raise GitError(f"not a blob: {object_id} ({' '.join(header) or 'no reply'})")
+
+        size = remaining = int(header[2])
+        while remaining:
+            chunk = self.process.stdout.read(min(remaining, COPY_CHUNK_BYTES))
+            if not chunk:
+                raise GitError(f"cat-file ended inside {object_id}")
+            out.write(chunk)
+            remaining -= len(chunk)
+        self.process.stdout.read(1)     # the newline after the contents
+        return size
+
+    def close(self):
+        self.process.stdin.close()
+        self.process.stdout.close()
+        self.process.wait()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# ============================================================
+# MULTI-REPOSITORY RELEASES
+# ============================================================
+# A release spans one repository per module (OLDUX, CR, ORM, API,
+# Keycloak...). The steps take a list of repositories and run the
+# per-repository work on a small thread pool; each job spends its
+# time waiting on git processes, so threads are enough.
+
+DEFAULT_REPO_JOBS = 4
+
+Repository = namedtuple("Repository", "name path")
+
+
+def repositories(values):
+    """
+    Parse --repo-path values: "PATH" or "NAME=PATH", several per value
+    separated by ";". NAME defaults to the repository folder name and
+    labels the repository's rows in the merged outputs.
+    """
+    repos = []
+    for value in values:
+        for item in value.split(";"):
+            item = item.strip()
+            if not item:
+                continue
+            name, separator, path = item.partition("=")
+            if not separator:
+                name, path = os.path.basename(os.path.normpath(item)), item
+            repos.append(Repository(name.strip(), path.strip()))
+
+    if not repos:
+        raise GitError("No repository given")
+    names = [repo.name for repo in repos]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise GitError(f"Repository names must be unique, name them with NAME=PATH: {', '.join(duplicates)}")
+    return repos
+
+
+def map_repositories(repos, work, jobs=DEFAULT_REPO_JOBS):
+    """
+    Return [work(repo) for repo in repos], running at most `jobs` at a
+    time. Every repository runs to the end; their GitErrors are then
+    raised together as one.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(repos)))) as pool:
+        futures = [pool.submit(work, repo) for repo in repos]
+
+    results = []
+    errors = []
+    for repo, future in zip(repos, futures):
+        try:
+            results.append(future.result())
+        except GitError as e:
+            errors.append(f"{repo.name}: {e}")
+    if errors:
+        raise GitError("; ".join(errors))
+    return results
@@ -1,4 +1,3 @@
-import glob
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent   # release-report-generator
@@ -6,23 +5,11 @@ PROJECT_ROOT = BASE_DIR.parent.parent              # Release-Automation
 
 # JSON directory (inside release-report-generator)
 JSON_DIR = BASE_DIR / "json_files"
-JSON_DIR.mkdir(parents=True, exist_ok=True)
-
-# ============================================================
-# Auto-detect latest *_ORM_Reports folder
-# ============================================================
 
 REPORT_ROOT = PROJECT_ROOT / "Report-output"
-report_folders = glob.glob(str(REPORT_ROOT / "*" / "*_ORM_Reports"))
 
-if not report_folders:
-    raise Exception("No *_ORM_Reports folder found. Run Commit Summary first.")
-
-# Pick newest report folder
-OUTPUT_DIR = Path(max(report_folders, key=lambda p: Path(p).stat().st_mtime))
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
-print(f"Release document will be created inside: {OUTPUT_DIR}")
+# Report-output/<App>_<Variant>/<Release>_ORM_Reports
+REPORT_FOLDER_SUFFIX = "_ORM_Reports"
 
 # Logos directory
 LOGOS_DIR = BASE_DIR / "logos"
@@ -30,3 +17,100 @@ LOGOS_DIR = BASE_DIR / "logos"
 BNP_LOGO = LOGOS_DIR / "bnp_paribas.png"
 ORACLE_LOGO = LOGOS_DIR / "oracle.png"
 FOOTER_LINE = LOGOS_DIR / "footer_line.png"
+
+# ============================================================
+# Output folder resolution
+# ============================================================
+# Nothing here touches the filesystem at import time. The
+# Report-output tree is scanned once, on first use, into an index
+# keyed by (app_variant, release); an explicit output dir skips
+# the scan entirely.
+
+class PathResolver:
+
+    def __init__(self, report_root=REPORT_ROOT):
+        self.report_root = Path(report_root)
+        self._override = None
+        self._newest = None
+        self._index = None
+
+    def set_output_dir(self, path):
+        """Use this folder instead of auto-detecting one."""
+        self._override = Path(path)
+
+    def report_index(self):
+        """{(APP_VARIANT, release): folder} for every *_ORM_Reports folder."""
+        if self._index is None:
+            index = {}
+            if self.report_root.is_dir():
+                for folder in self.report_root.glob(f"*/*{REPORT_FOLDER_SUFFIX}"):
+                    if folder.is_dir():
+                        release = folder.name[:-len(REPORT_FOLDER_SUFFIX)]
+                        index[(folder.parent.name.upper(), release)] = folder
+            self._index = index
+        return self._index
+
+    def find_report_folder(self, app=None, variant=None, release=None):
+        """
+        Newest report folder matching the given app / variant / release
+        (any of which may be omitted). Raises if nothing matches.
+        """
+        app = app.upper() if app else None
+        variant = variant.upper() if variant else None
+
+        candidates = []
+        for (group, folder_release), folder in self.report_index().items():
+            if release and folder_release != release:
+                continue
+            if app and variant and group != f"{app}_{variant}":
+                continue
+            if app and not (group == app or group.startswith(f"{app}_")):
+                continue
+            if variant and not group.endswith(f"_{variant}"):
+                continue
+            candidates.append(folder)
+
+        if not candidates:
+            wanted = ", ".join(
+                f"{name}={value}" for name, value in
+                (("app", app), ("variant", variant), ("release", release)) if value
+            )
+            raise Exception(
+                f"No *{REPORT_FOLDER_SUFFIX} folder found"
+                + (f" for {wanted}" if wanted else "")
+                + ". Run Commit Summary first."
+            )
+
+        # Only the matches are stat'ed, not the whole tree
+        return max(candidates, key=lambda p: p.stat().st_mtime)
+
+    def output_dir_for(self, app=None, variant=None, release=None):
+        """The override when set, else the newest matching report folder."""
+        if self._override is None and (app or variant or release):
+            folder = self.find_report_folder(app, variant, release)
+            folder.mkdir(parents=True, exist_ok=True)
+            return folder
+        return self.output_dir
+
+    @property
+    def output_dir(self):
+        if self._override is not None:
+            folder = self._override
+        else:
+            if self._newest is None:
+                self._newest = self.find_report_folder()
+                print(f"Release document will be created inside: {self._newest}")
+            folder = self._newest
+
+        folder.mkdir(parents=True, exist_ok=True)
+        return folder
+
+
+paths = PathResolver()
+
+
+def __getattr__(name):
+    # Keeps "from config.paths import OUTPUT_DIR" working, resolved on demand
+    if name == "OUTPUT_DIR":
+        return paths.output_dir
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
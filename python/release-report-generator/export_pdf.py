@@ -0,0 +1,213 @@
+import argparse
+import hashlib
+import json
+import os
+import queue
+import sys
+import threading
+import zipfile
+from pathlib import Path
+
+from config.paths import paths
+from utils.office import OfficeWorker, find_office
+
+# ============================================================
+# PDF EXPORT
+# ============================================================
+# Converts generated .docx documents to PDF next to them through a
+# pool of warm headless LibreOffice workers: each worker starts
+# soffice once and takes job after job off a shared queue, with a
+# timeout per document. A document whose content still matches the
+# one its PDF was made from is not converted again.
+#
+#   python export_pdf.py [DOCUMENT ...] [--output-dir DIR] [--workers N]
+#
+# Without documents, every .docx in the report folder is exported.
+
+DEFAULT_WORKERS = 2
+DEFAULT_TIMEOUT = 300       # seconds per document
+
+# <report folder>/.pdf_export.json: {document name: content hash, PDF size}
+CACHE_FILE = ".pdf_export.json"
+CACHE_VERSION = 1
+
+HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def content_hash(docx_path):
+    """
+    sha256 over the part names and contents of a .docx. The file bytes
+    themselves change on every save (zip entry timestamps), the parts
+    only when the document does.
+    """
+    digest = hashlib.sha256()
+    with zipfile.ZipFile(docx_path) as package:
+        for info in sorted(package.infolist(), key=lambda i: i.filename):
+            digest.update(info.filename.encode("utf-8") + b"\0")
+            with package.open(info) as part:
+                for chunk in iter(lambda: part.read(HASH_CHUNK_BYTES), b""):
+                    digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _load_cache(folder):
+    try:
+        with open(folder / CACHE_FILE, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache.get("version") == CACHE_VERSION:
+            return cache
+    except (OSError, ValueError):
+        pass
+    return {"version": CACHE_VERSION, "documents": {}}
+
+
+def _save_cache(folder, cache):
+    path = folder / CACHE_FILE
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def _is_current(entry, digest, target):
+    return (
+        entry is not None
+        and entry.get("sha256") == digest
+        and target.exists()
+        and target.stat().st_size == entry.get("pdfSize")
+    )
+
+# ============================================================
+# WORKER POOL
+# ============================================================
+
+def _convert_all(jobs, soffice, workers, timeout):
+    """
+    Yield (job, error) for every (source, target, digest) job as it
+    finishes; error is None on success.
+    """
+    pending = queue.Queue()
+    for job in jobs:
+        pending.put(job)
+    results = queue.Queue()
+
+    def run():
+        worker = OfficeWorker(soffice)
+        try:
+            while True:
+                try:
+                    job = pending.get_nowait()
+                except queue.Empty:
+                    return
+
+                source, target, _ = job
+                # Written aside and moved into place, so a killed export never leaves half a PDF
+                tmp_target = target.with_name(f"{target.stem}.{os.getpid()}.{threading.get_ident()}.tmp.pdf")
+                try:
+                    worker.convert(source, tmp_target, timeout)
+                    os.replace(tmp_target, target)
+                    results.put((job, None))
+                except Exception as e:
+                    tmp_target.unlink(missing_ok=True)
+                    results.put((job, f"{type(e).__name__}: {' '.join(str(e).split())}"))
+        finally:
+            worker.stop()
+
+    threads = [threading.Thread(target=run, daemon=True) for _ in range(max(1, min(workers, len(jobs))))]
+    for thread in threads:
+        thread.start()
+
+    for _ in jobs:
+        yield results.get()
+
+    for thread in threads:
+        thread.join()
+
+
+def _documents(names, folder):
+    if not names:
+        # "~$..." are Word's lock files for documents open in Word
+        return sorted(p for p in folder.glob("*.docx") if not p.name.startswith("~$"))
+
+    documents = []
+    for name in names:
+        path = Path(name)
+        if not path.is_absolute() and not path.exists():
+            path = folder / path
+        documents.append(path)
+    return documents
+
+
+def export_pdfs(names, folder, workers=DEFAULT_WORKERS, timeout=DEFAULT_TIMEOUT, force=False):
+    """
+    Export the named documents (default: every .docx in folder) to PDF.
+    Prints SUCCESS::<pdf name> or FAILED::<document>::<error> per
+    document. Returns the number of failed documents.
+    """
+    caches = {}
+    jobs = []
+    failed = unchanged = converted = 0
+
+    for source in _documents(names, folder):
+        try:
+            digest = content_hash(source)
+        except (OSError, zipfile.BadZipFile) as e:
+            print(f"FAILED::{source.name}::{type(e).__name__}: {' '.join(str(e).split())}", flush=True)
+            failed += 1
+            continue
+
+        target = source.with_suffix(".pdf")
+        cache = caches.setdefault(source.parent, _load_cache(source.parent))
+
+        if not force and _is_current(cache["documents"].get(source.name), digest, target):
+            print(f"SUCCESS::{target.name}", flush=True)
+            unchanged += 1
+            continue
+
+        jobs.append((source, target, digest))
+
+    soffice = find_office() if jobs else None
+    if jobs and soffice is None:
+        for source, _, _ in jobs:
+            print(f"FAILED::{source.name}::no LibreOffice found (set RELEASE_DOC_SOFFICE)", flush=True)
+        failed += len(jobs)
+        jobs = []
+
+    for (source, target, digest), error in _convert_all(jobs, soffice, workers, timeout):
+        if error:
+            print(f"FAILED::{source.name}::{error}", flush=True)
+            failed += 1
+            continue
+
+        cache = caches[source.parent]
+        cache["documents"][source.name] = {"sha256": digest, "pdfSize": target.stat().st_size}
+        _save_cache(source.parent, cache)
+        print(f"SUCCESS::{target.name}", flush=True)
+        converted += 1
+
+    print(f"PDF export complete: {converted} converted, {unchanged} unchanged, {failed} failed")
+    return failed
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("documents", nargs="*", help="Documents to export (default: every .docx in the report folder)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help=f"Warm LibreOffice workers (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--timeout", type=int, default=DEFAULT_TIMEOUT, help=f"Seconds allowed per document (default: {DEFAULT_TIMEOUT})")
+    parser.add_argument("--force", action="store_true", help="Convert even documents whose PDF is up to date")
+    parser.add_argument("--output-dir", help="Report folder holding the documents (default: the newest *_ORM_Reports folder)")
+    parser.add_argument("--app", help="Pick the report folder of this app (Report-output/<App>_<Variant>)")
+    parser.add_argument("--variant", help="Pick the report folder of this variant")
+    parser.add_argument("--target-release", help="Pick the <Release>_ORM_Reports folder of this release")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    if args.output_dir:
+        paths.set_output_dir(args.output_dir)
+
+    folder = paths.output_dir_for(args.app, args.variant, args.target_release)
+    failed = export_pdfs(args.documents, folder, workers=args.workers, timeout=args.timeout, force=args.force)
+    sys.exit(1 if failed else 0)
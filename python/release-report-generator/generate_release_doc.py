@@ -1,65 +1,179 @@
 import argparse
-from docx import Document
-from config.paths import OUTPUT_DIR
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from config.paths import paths
 from utils.json_loader import load_json
-from utils.word_helpers import add_page_border
-from pages.header_footer import add_header, add_footer
-from pages.title_page import build_title_page
-from pages.document_control_page import build_document_control_page
-from pages.toc_page import build_toc_page
-from pages.deployment_details_page_1 import build_deployment_details_page_1
-from pages.deployment_details_page_2 import build_deployment_details_page_2
-from pages.deployment_details_page_3 import build_deployment_details_page_3
-from pages.deployment_details_page_4 import build_deployment_details_page_4
-from pages.deployment_details_page_5 import build_deployment_details_page_5
-from pages.deployment_details_page_6 import build_deployment_details_page_6
-from pages.introduction_page_1 import build_introduction_page_1
-from pages.introduction_page_2 import build_introduction_page_2
-
-parser = argparse.ArgumentParser()
-parser.add_argument("--json", required=True)
-parser.add_argument("--title", required=True)
-parser.add_argument("--release", required=True)
-parser.add_argument("--subtitle", required=True)
-parser.add_argument("--version", required=True)
-parser.add_argument("--date", required=True)
-
-args = parser.parse_args()
-
-json_file = args.json
-title = args.title
-release = args.release
-subtitle = args.subtitle
-version_no = args.version
-version_date = args.date
-
-data = load_json(json_file)
-
-doc_name = f"BNPP_{release}_Release_Deployment_Documents.docx"
-output_doc = OUTPUT_DIR / doc_name
-
-doc = Document()
-section = doc.sections[0]
-
-add_page_border(section)
-add_header(section)
-
-build_title_page(doc, title, release, subtitle, version_no, version_date)
-build_document_control_page(doc, version_no)
-build_toc_page(doc)
-
-doc.add_page_break()
-build_introduction_page_1(doc)
-build_introduction_page_2(doc)
-build_deployment_details_page_1(doc, data)
-build_deployment_details_page_2(doc, data)
-build_deployment_details_page_3(doc, data)
-build_deployment_details_page_4(doc, data)
-build_deployment_details_page_5(doc, data)
-build_deployment_details_page_6(doc, data)
-
-add_footer(section, doc_name)
-
-doc.save(output_doc)
-
-print(f"SUCCESS::{doc_name}")
+from utils.template_cache import load_base_template
+from utils.toc_layout import update_toc
+from pages.deployment_details_page import build_deployment_details_page
+
+# Keys of one batch manifest entry, same names as the single-document flags
+DOCUMENT_FIELDS = ("json", "title", "release", "subtitle", "version", "date")
+
+
+def generate_release_doc(json_file, title, release, subtitle, version_no, version_date, output_dir=None, office_toc=None):
+    """
+    Render one release document into output_dir (default: the resolved
+    report folder). TOC page numbers not cached are measured with
+    headless LibreOffice when it is installed (office_toc None), always
+    tried (True) or never (False). Returns the document name.
+    """
+    data = load_json(json_file)
+
+    doc_name = f"BNPP_{release}_Release_Deployment_Documents.docx"
+    output_doc = (output_dir or paths.output_dir) / doc_name
+
+    # Static pages, header and footer come from the cached base template
+    doc = load_base_template({
+        "title": title,
+        "release": release,
+        "subtitle": subtitle,
+        "version_no": version_no,
+        "version_date": version_date,
+        "doc_name": doc_name,
+    })
+
+    build_deployment_details_page(doc, data)
+
+    # TOC entries come from the headings rendered above
+    update_toc(doc, use_office=office_toc)
+
+    doc.save(output_doc)
+
+    return doc_name
+
+
+# ============================================================
+# BATCH MODE
+# ============================================================
+# --batch <manifest.json> renders every entry of a JSON list of
+# {"json", "title", "release", "subtitle", "version", "date"}
+# objects in this one process (or a pool of warm workers), so the
+# imports, path lookup and base template load are paid once.
+# Entries may add "app" / "variant" / "targetRelease" to pick
+# their report folder; otherwise they go to the run's output dir.
+
+def load_manifest(manifest_path):
+    with open(manifest_path, "r", encoding="utf-8-sig") as f:
+        entries = json.load(f)
+
+    if not isinstance(entries, list):
+        raise ValueError("Batch manifest must be a JSON list of documents")
+
+    for i, entry in enumerate(entries):
+        missing = [field for field in DOCUMENT_FIELDS if not entry.get(field)]
+        if missing:
+            raise ValueError(f"Manifest entry {i} is missing: {', '.join(missing)}")
+
+    return entries
+
+
+def _render_entry(entry, office_toc=None):
+    """Never raises: returns (entry, document name, error)."""
+    try:
+        output_dir = paths.output_dir_for(
+            entry.get("app"), entry.get("variant"), entry.get("targetRelease")
+        )
+        doc_name = generate_release_doc(
+            entry["json"], entry["title"], entry["release"],
+            entry["subtitle"], entry["version"], entry["date"],
+            output_dir=output_dir, office_toc=office_toc,
+        )
+        return entry, doc_name, None
+    except Exception as e:
+        # One line per document, whatever the exception text looks like
+        return entry, None, f"{type(e).__name__}: {' '.join(str(e).split())}"
+
+
+def _init_worker(output_dir):
+    if output_dir:
+        paths.set_output_dir(output_dir)
+
+
+def _report(entry, doc_name, error):
+    if error:
+        print(f"FAILED::{entry['json']}::{error}", flush=True)
+    else:
+        print(f"SUCCESS::{doc_name}", flush=True)
+
+
+def run_batch(entries, workers=1, output_dir=None, office_toc=None):
+    """Render all entries; returns the number of failed documents."""
+    failed = 0
+
+    if workers <= 1:
+        results = (_render_entry(entry, office_toc) for entry in entries)
+        for entry, doc_name, error in results:
+            _report(entry, doc_name, error)
+            failed += error is not None
+    else:
+        # Workers resolve paths on their own; pass the override along
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(output_dir,)) as pool:
+            futures = [pool.submit(_render_entry, entry, office_toc) for entry in entries]
+            for future in as_completed(futures):
+                entry, doc_name, error = future.result()
+                _report(entry, doc_name, error)
+                failed += error is not None
+
+    print(f"Batch complete: {len(entries) - failed} succeeded, {failed} failed")
+    return failed
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--json")
+    parser.add_argument("--title")
+    parser.add_argument("--release")
+    parser.add_argument("--subtitle")
+    parser.add_argument("--version")
+    parser.add_argument("--date")
+    parser.add_argument("--batch", help="JSON manifest of documents to render in one run")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for --batch (default: 1)")
+    parser.add_argument("--output-dir", help="Write documents here instead of the newest *_ORM_Reports folder")
+    parser.add_argument("--app", help="Pick the report folder of this app (Report-output/<App>_<Variant>)")
+    parser.add_argument("--variant", help="Pick the report folder of this variant")
+    parser.add_argument("--target-release", help="Pick the <Release>_ORM_Reports folder of this release")
+    office_toc = os.environ.get("RELEASE_DOC_OFFICE_TOC", "").lower()
+    parser.add_argument(
+        "--office-toc", action="store_const", const=True,
+        default=True if office_toc in ("1", "true", "yes") else False if office_toc in ("0", "false", "no") else None,
+        help="Measure TOC page numbers with headless LibreOffice, warning when none is found"
+             " (default: whenever one is found; cached per template and content)",
+    )
+    parser.add_argument(
+        "--no-office-toc", dest="office_toc", action="store_const", const=False,
+        help="Never run LibreOffice; estimate TOC page numbers and let Word update them on open",
+    )
+
+    args = parser.parse_args(argv)
+
+    if not args.batch:
+        missing = [f"--{field}" for field in DOCUMENT_FIELDS if getattr(args, field) is None]
+        if missing:
+            parser.error(f"the following arguments are required: {', '.join(missing)}")
+
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    if args.output_dir:
+        paths.set_output_dir(args.output_dir)
+
+    if args.batch:
+        failed = run_batch(
+            load_manifest(args.batch), workers=args.workers,
+            output_dir=args.output_dir, office_toc=args.office_toc,
+        )
+        sys.exit(1 if failed else 0)
+
+    doc_name = generate_release_doc(
+        args.json, args.title, args.release, args.subtitle, args.version, args.date,
+        output_dir=paths.output_dir_for(args.app, args.variant, args.target_release),
+        office_toc=args.office_toc,
+    )
+
+    print(f"SUCCESS::{doc_name}")
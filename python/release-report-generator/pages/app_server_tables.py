@@ -0,0 +1,95 @@
+from docx.shared import Inches
+from utils.styles import (
+    add_styled_paragraph, add_table, shade_cell, Column,
+    BODY_TEXT, TABLE_CENTER, LINK_TEXT, BLUE_TEXT, YELLOW,
+)
+
+# ==================================================
+# 2.3 APP SERVER CHANGES – BUILD VERSION TABLES
+# ==================================================
+def build_app_server_tables(doc, data, releases):
+    """
+    Module/version tables shown under the 2.3 section bar, ahead of
+    its per-release notes. Versions matching the latest release in
+    ``releases`` are highlighted.
+    """
+    latest = releases[-1] if releases else None
+
+    intro = add_styled_paragraph(doc, "Please find the application build version details:", BODY_TEXT)
+    intro.runs[0].bold = True
+
+    # --------------------------------------------------
+    # TABLE 1 – MODULE VS VERSION
+    # --------------------------------------------------
+    modules = [
+        "OLDUX MyBatis Hibernate",
+        "NEWUX-Angular",
+        "CR Hibernate",
+        "ORM",
+        "API",
+        "SUPPLIER ONBOARDING",
+        "CSC App Hibernate",
+        "Marketing Web Page",
+        "CSC INT API",
+        "Keycloak",
+    ]
+
+    versions = data.app_server_build_versions
+
+    table1 = add_table(
+        doc,
+        [
+            Column("Application Module", Inches(3.2), char_style=LINK_TEXT),
+            Column("Latest Release Build version", Inches(1.8), char_style=BLUE_TEXT),
+        ],
+        [(m, versions.get(m, "")) for m in modules],
+        row_height=430,
+    )
+
+    # Highlight modules shipped in the latest release
+    for row, m in zip(table1.rows[1:], modules):
+        if latest and versions.get(m, "") == latest:
+            shade_cell(row.cells[1], YELLOW)
+
+    doc.add_paragraph("")
+
+    # --------------------------------------------------
+    # TABLE 2 – RELEASE WISE MODULES (Sr No FIXED)
+    # --------------------------------------------------
+    releases = data.release_wise_modules
+
+    if not releases:
+        releases = [
+            {"release": "Release FO R26.1.0.1", "modules": ["CR - clientreg-ear.ear, DB Script"]},
+            {"release": "Release FO R26.1.0.2", "modules": ["CSCSO - cscsoapp.war"]},
+            {"release": "Release FO R26.1.0.3", "modules": [
+                "OldUX – bnppng.war, db Scripts",
+                "MDP – bnp_middleware_mdp.war",
+                "Scheduler libs",
+                "NewUX – bnppngux-ear.ear",
+                "CR – clientreg-ear.ear"
+            ]},
+            {"release": "Release FO R26.1.0.4", "modules": [
+                "ORM – ear, DB Scripts",
+                "CR – clientreg-ear.ear"
+            ]},
+            {"release": "Release FO R26.1.0.5", "modules": [
+                "ORM – ear, DB Scripts",
+                "CR – clientreg-ear.ear",
+                "CSCSO – cscsoapp.war, DB Scripts"
+            ]},
+        ]
+
+    # 🔥 ULTRA-NARROW Sr No + EXTRA SPACE TO MODULES
+    add_table(
+        doc,
+        [
+            Column("Sr No.", Inches(0.18), TABLE_CENTER),   # Sr No (tight)
+            Column("Release Build No.", Inches(1.9)),      # Release Build No
+            Column("Application Modules", Inches(3.4)),    # Application Modules (wide)
+        ],
+        [
+            (str(idx), rel["release"], rel["modules"])
+            for idx, rel in enumerate(releases, start=1)
+        ],
+    )
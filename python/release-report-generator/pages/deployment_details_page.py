@@ -1,23 +1,132 @@
-from utils.word_helpers import add_colored_bar
-
-ORDERED_SECTIONS = [
-    "2.1 Web server Changes",
-    "2.2 Maven Deployment Changes",
-    "2.3 App Server Changes",
-    "2.4 DB Changes- Environment Specific Changes",
-    "2.5 Queue Configuration Scripts",
-    "2.6 Scheduler jobs",
-    "2.7 Migration Scripts",
-    "2.8 Shell Script changes",
-    "2.9 Sql Script change",
-    "2.10 Cron Job changes",
-    "2.11 Keycloak Configuration changes"
+import re
+
+from utils.styles import ensure_styles, chapter_bar, section_bar, release_block
+from pages.app_server_tables import build_app_server_tables
+
+# ==================================================
+# SECTIONS
+# ==================================================
+# Display titles for the sections Generate-CommitSummary.ps1 emits.
+# JSON keys are matched on their number ("2.9 Sql Script change"
+# -> "2.9"); sections the JSON adds beyond these are rendered too,
+# after these, under their JSON title.
+
+SECTIONS = [
+    ("2.1", "2.1 Web server Changes"),
+    ("2.2", "2.2 Maven Deployment Changes"),
+    ("2.3", "2.3 App Server Changes"),
+    ("2.4", "2.4 DB Changes- Environment Specific Changes"),
+    ("2.5", "2.5 Queue Configuration Scripts"),
+    ("2.6", "2.6 Scheduler jobs"),
+    ("2.7", "2.7 Migration Scripts"),
+    ("2.8", "2.8 Shell Script changes"),
+    ("2.9", "2.9 SQL Script change"),
+    ("2.10", "2.10 Cron Job changes"),
+    ("2.11", "2.11 Keycloak Configuration changes"),
+    ("2.12", "2.12 Scheduler Server changes"),
 ]
 
+# Extra content rendered under a section bar, before its release notes
+SECTION_HOOKS = {
+    "2.3": build_app_server_tables,
+}
+
+SECTION_NUMBER = re.compile(r"^\s*(\d+(?:\.\d+)*)")
+RELEASE_ID = re.compile(r"\bR\d+(?:\.\d+)+\b")
+
+
+def _section_number(title):
+    m = SECTION_NUMBER.match(title)
+    return m.group(1) if m else title
+
+
+def _number_key(number):
+    return tuple(int(part) if part.isdigit() else 0 for part in re.split(r"\D+", number) if part)
+
+
+# ==================================================
+# RELEASE INDEX
+# ==================================================
+
+def index_deployment_details(data):
+    """
+    One pass over deploymentDetails. Returns (titles, index):
+    titles is {section number: display title} in render order,
+    index is {(section number, release id): [instruction, ...]}.
+
+    A list entry is filed under every release id it mentions, or
+    under targetRelease when it mentions none (the commit summary
+    only covers commits up to the target). A {release: text}
+    section is taken as is.
+    """
+    details = data.deployment_details
+    target = data.target_release or data.release
+
+    titles = {number: title for number, title in SECTIONS}
+    index = {}
+
+    for key, entries in details.items():
+        number = _section_number(key)
+        titles.setdefault(number, key)
+
+        if isinstance(entries, dict):
+            for release, text in entries.items():
+                if text:
+                    index.setdefault((number, release), []).append(text)
+            continue
+
+        if isinstance(entries, str):
+            entries = [entries]
+
+        for entry in entries or []:
+            releases = set(RELEASE_ID.findall(entry)) or ({target} if target else set())
+            for release in releases:
+                index.setdefault((number, release), []).append(entry)
+
+    ordered = dict(sorted(titles.items(), key=lambda item: _number_key(item[0])))
+    return ordered, index
+
+
+def releases_in_scope(data, index):
+    """
+    Releases to list under every section: the JSON's "releases" when
+    given, else every release that has instructions plus the target.
+    """
+    if data.releases:
+        return list(data.releases)
+
+    releases = {release for _, release in index}
+    target = data.target_release or data.release
+    if target:
+        releases.add(target)
+
+    return sorted(releases, key=lambda r: _number_key(r))
+
+
+# ==================================================
+# RENDERER
+# ==================================================
+
 def build_deployment_details_page(doc, data):
-    add_colored_bar(doc, "2. Deployment Details", "FF0000", size=13)
+    """
+    2. Deployment Details: every section, and under each one every
+    release in scope with its instructions (or "No special
+    instructions"). Work is proportional to entries + sections x
+    releases, with no per-release scan of the section entries.
+    """
+    ensure_styles(doc)
+
+    titles, index = index_deployment_details(data)
+    releases = releases_in_scope(data, index)
+
+    chapter_bar(doc, "2.  Deployment Details")
+
+    for number, title in titles.items():
+        section_bar(doc, title)
+
+        hook = SECTION_HOOKS.get(number)
+        if hook:
+            hook(doc, data, releases)
 
-    for sec in ORDERED_SECTIONS:
-        add_colored_bar(doc, sec, "D9D9D9", italic=True, size=10.5)
-        vals = data["deploymentDetails"].get(sec, [])
-        doc.add_paragraph("No special instructions" if not vals else "\n".join(vals))
+        for release in releases:
+            release_block(doc, release, "\n".join(index.get((number, release), [])))
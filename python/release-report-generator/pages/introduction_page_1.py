@@ -1,57 +1,9 @@
 from docx.shared import Pt, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml import OxmlElement, ns
 
-
-RED = "FF0000"
-GREY = "D9D9D9"
-BLACK = RGBColor(0, 0, 0)
+from utils.styles import ensure_styles, chapter_bar, section_bar
 
 
-def _colored_bar(doc, text, bg_color, bold=True, italic=False, size=11, center=False, add_borders=False):
-    """
-    Full-width colored bar (used for section headers)
-    """
-    p = doc.add_paragraph()
-    p.paragraph_format.space_before = Pt(6)
-    p.paragraph_format.space_after = Pt(6)
-    
-    # Center alignment if requested
-    if center:
-        p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-    run = p.add_run(text)
-    run.bold = bold
-    run.italic = italic
-    run.font.size = Pt(size)
-    run.font.color.rgb = BLACK
-
-    pPr = p._p.get_or_add_pPr()
-    shd = OxmlElement("w:shd")
-    shd.set(ns.qn("w:fill"), bg_color)
-    pPr.append(shd)
-    
-    # Add borders if requested
-    if add_borders:
-        pBdr = OxmlElement("w:pBdr")
-        
-        # Top border
-        top = OxmlElement("w:top")
-        top.set(ns.qn("w:val"), "single")
-        top.set(ns.qn("w:sz"), "12")  # Border width
-        top.set(ns.qn("w:space"), "1")
-        top.set(ns.qn("w:color"), "000000")  # Black border
-        pBdr.append(top)
-        
-        # Bottom border
-        bottom = OxmlElement("w:bottom")
-        bottom.set(ns.qn("w:val"), "single")
-        bottom.set(ns.qn("w:sz"), "12")  # Border width
-        bottom.set(ns.qn("w:space"), "1")
-        bottom.set(ns.qn("w:color"), "000000")  # Black border
-        pBdr.append(bottom)
-        
-        pPr.append(pBdr)
+BLACK = RGBColor(0, 0, 0)
 
 
 def _body_paragraph(doc, text):
@@ -76,16 +28,17 @@ def build_introduction_page_1(doc):
     1.5 CSC CR
     1.6 CSC FO
     """
+    ensure_styles(doc)
 
     # ============================
     # 1. INTRODUCTION (RED BAR) - CENTERED WITH BORDERS
     # ============================
-    _colored_bar(doc, "1.  Introduction", RED, bold=True, size=13, center=True, add_borders=True)
+    chapter_bar(doc, "1.  Introduction")
 
     # ============================
     # 1.1 Purpose
     # ============================
-    _colored_bar(doc, "1.1 Purpose", GREY, italic=True, size=11)
+    section_bar(doc, "1.1 Purpose")
 
     _body_paragraph(
         doc,
@@ -97,7 +50,7 @@ def build_introduction_page_1(doc):
     # ============================
     # 1.2 CSC INT API
     # ============================
-    _colored_bar(doc, "1.2 CSC INT API", GREY, italic=True, size=11)
+    section_bar(doc, "1.2 CSC INT API")
 
     _body_paragraph(
         doc,
@@ -108,7 +61,7 @@ def build_introduction_page_1(doc):
     # ============================
     # 1.3 Marketing WEB PAGE
     # ============================
-    _colored_bar(doc, "1.3 Marketing WEB PAGE", GREY, italic=True, size=11)
+    section_bar(doc, "1.3 Marketing WEB PAGE")
 
     _body_paragraph(
         doc,
@@ -119,7 +72,7 @@ def build_introduction_page_1(doc):
     # ============================
     # 1.4 Supplier Onboarding
     # ============================
-    _colored_bar(doc, "1.4 Supplier Onboarding", GREY, italic=True, size=11)
+    section_bar(doc, "1.4 Supplier Onboarding")
 
     _body_paragraph(
         doc,
@@ -134,7 +87,7 @@ def build_introduction_page_1(doc):
     # ============================
     # 1.5 CSC CR
     # ============================
-    _colored_bar(doc, "1.5 CSC CR", GREY, italic=True, size=11)
+    section_bar(doc, "1.5 CSC CR")
 
     _body_paragraph(
         doc,
@@ -148,7 +101,7 @@ def build_introduction_page_1(doc):
     # ============================
     # 1.6 CSC FO
     # ============================
-    _colored_bar(doc, "1.6 CSC FO", GREY, italic=True, size=11)
+    section_bar(doc, "1.6 CSC FO")
 
     _body_paragraph(
         doc,
@@ -1,14 +1,20 @@
 """
 Table of Contents Page Builder for Word Documents
 
-This module creates professional, properly formatted table of contents pages
-with dynamic leader dots that keep page numbers perfectly aligned to the right.
+This module creates the table of contents page as a real Word TOC field.
+Entries are collected from the chapter / section bar styles the page
+builders emit and laid out by right-aligned dot-leader tab stops in the
+"toc 1" / "toc 2" styles, so no leader dots are counted by hand.
 """
 
-from docx.shared import Pt, RGBColor, Inches
+from xml.sax.saxutils import escape, quoteattr
+
+from docx.shared import Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.ns import nsdecls, qn
+
+from utils.styles import ensure_styles, style_id, TOC_LEVELS, TOC_1, TOC_2
 
 
 # ============================================================================
@@ -23,8 +29,6 @@ BLACK = RGBColor(0, 0, 0)
 # ============================================================================
 TITLE_FONT_SIZE = Pt(14)
 TOC_HEADING_FONT_SIZE = Pt(12)
-SECTION_FONT_SIZE = Pt(11)
-ITEM_FONT_SIZE = Pt(10)
 
 
 # ============================================================================
@@ -32,19 +36,23 @@ ITEM_FONT_SIZE = Pt(10)
 # ============================================================================
 TITLE_SPACE_AFTER = Pt(12)
 TOC_HEADING_SPACE_AFTER = Pt(16)
-SECTION_SPACE_BEFORE = Pt(8)
-ITEM_LINE_SPACING = 1.15
 
 
 # ============================================================================
-# LAYOUT CONSTANTS
+# FIELD CONSTANTS
 # ============================================================================
-# Approximate character width for dot calculation (adjust based on font)
-CHAR_WIDTH_SECTION = 0.07  # Inches per character for section items
-CHAR_WIDTH_ITEM = 0.06     # Inches per character for sub-items
-PAGE_WIDTH = 6.5           # Usable page width in inches (8.5" - margins)
-SECTION_INDENT = 0.25      # Left indent for sections
-ITEM_INDENT = 0.5          # Left indent for items
+# \t collects paragraphs by style name and level, \h makes entries links,
+# \z hides the page numbers in web layout
+TOC_INSTRUCTION = ' TOC \\h \\z \\t "{}" '.format(
+    ",".join(f"{name},{level}" for name, level in TOC_LEVELS.items())
+)
+
+ENTRY_STYLES = {1: TOC_1, 2: TOC_2}
+
+# Shown until the entries are filled in by fill_toc()
+EMPTY_TOC_TEXT = "Right-click and choose Update Field to build the table of contents."
+
+BOOKMARK_PREFIX = "_Toc"
 
 
 # ============================================================================
@@ -52,15 +60,20 @@ ITEM_INDENT = 0.5          # Left indent for items
 # ============================================================================
 def build_toc_page(doc):
     """
-    Build a complete professional Table of Contents page.
-    
+    Build the Table of Contents page with an empty TOC field.
+
+    The entries depend on the pages rendered after this one, so they are
+    written by fill_toc() once the document is complete.
+
     Args:
         doc: A python-docx Document object
     """
+    ensure_styles(doc)
+
     _add_document_title(doc)
     _add_horizontal_line(doc)
     _add_toc_heading(doc)
-    _add_toc_content(doc)
+    _add_toc_field(doc)
 
 
 # ============================================================================
@@ -69,7 +82,7 @@ def build_toc_page(doc):
 def _add_document_title(doc):
     """
     Add the main document title with centered alignment and blue color.
-    
+
     Args:
         doc: A python-docx Document object
     """
@@ -77,7 +90,7 @@ def _add_document_title(doc):
     title.alignment = WD_ALIGN_PARAGRAPH.CENTER
     title.paragraph_format.space_after = TITLE_SPACE_AFTER
     title.paragraph_format.space_before = Pt(0)
-    
+
     run = title.add_run("Release Deployment Document")
     run.bold = True
     run.font.size = TITLE_FONT_SIZE
@@ -87,7 +100,7 @@ def _add_document_title(doc):
 def _add_horizontal_line(doc):
     """
     Add a horizontal line separator below the title.
-    
+
     Args:
         doc: A python-docx Document object
     """
@@ -95,17 +108,17 @@ def _add_horizontal_line(doc):
     line_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
     line_paragraph.paragraph_format.space_after = Pt(16)
     line_paragraph.paragraph_format.space_before = Pt(0)
-    
+
     # Add bottom border to create a professional line
     pPr = line_paragraph._p.get_or_add_pPr()
     pBdr = OxmlElement('w:pBdr')
-    
+
     bottom = OxmlElement('w:bottom')
     bottom.set(qn('w:val'), 'single')
     bottom.set(qn('w:sz'), '12')
     bottom.set(qn('w:space'), '1')
     bottom.set(qn('w:color'), '000000')
-    
+
     pBdr.append(bottom)
     pPr.append(pBdr)
 
@@ -113,7 +126,7 @@ def _add_horizontal_line(doc):
 def _add_toc_heading(doc):
     """
     Add the 'Table of Contents' heading.
-    
+
     Args:
         doc: A python-docx Document object
     """
@@ -121,7 +134,7 @@ def _add_toc_heading(doc):
     toc_heading.alignment = WD_ALIGN_PARAGRAPH.CENTER
     toc_heading.paragraph_format.space_after = TOC_HEADING_SPACE_AFTER
     toc_heading.paragraph_format.space_before = Pt(0)
-    
+
     run = toc_heading.add_run("Table of Contents")
     run.bold = True
     run.font.size = TOC_HEADING_FONT_SIZE
@@ -129,183 +142,163 @@ def _add_toc_heading(doc):
 
 
 # ============================================================================
-# CONTENT BUILDER FUNCTION
+# TOC FIELD
 # ============================================================================
-def _add_toc_content(doc):
+# The field spans one paragraph per entry: the first one opens it
+# (begin, instruction, separate), the last one closes it (end). Each
+# entry links to a bookmark on its heading and takes its page number
+# from a PAGEREF field, the same shape Word itself writes.
+
+def _field_begin():
+    return (
+        '<w:r><w:fldChar w:fldCharType="begin" w:dirty="true"/></w:r>'
+        f'<w:r><w:instrText xml:space="preserve">{escape(TOC_INSTRUCTION)}</w:instrText></w:r>'
+        '<w:r><w:fldChar w:fldCharType="separate"/></w:r>'
+    )
+
+
+def _field_end():
+    return '<w:r><w:fldChar w:fldCharType="end"/></w:r>'
+
+
+def _add_toc_field(doc):
     """
-    Add all TOC sections and items.
-    
+    Add the TOC field with placeholder text as its result.
+
     Args:
         doc: A python-docx Document object
     """
-    # Section 1: INTRODUCTION
-    _add_toc_section(doc, "1.", "INTRODUCTION", "4")
-    
-    introduction_items = [
-        ("1.1", "PURPOSE", "4"),
-        ("1.2", "CSC INT API", "4"),
-        ("1.3", "MARKETING WEB PAGE", "4"),
-        ("1.4", "SUPPLIER ONBOARDING", "4"),
-        ("1.5", "CSC CR", "4"),
-        ("1.6", "CSC FO", "4"),
-        ("1.7", "CSC ORM", "5"),
-        ("1.8", "NEWUX", "5"),
-        ("1.9", "CSCAPP", "5"),
-        ("1.10", "CSC FO SCHEDULER", "5"),
-    ]
-    
-    for number, title, page in introduction_items:
-        _add_toc_item(doc, number, title, page)
-    
-    # Section 2: DEPLOYMENT DETAILS
-    _add_toc_section(doc, "2.", "DEPLOYMENT DETAILS", "6", add_space_before=True)
-    
-    deployment_items = [
-        ("2.1", "WEB SERVER CHANGES", "6"),
-        ("2.2", "MAVEN DEPLOYMENT CHANGES", "6"),
-        ("2.3", "APP SERVER CHANGES", "7"),
-        ("2.4", "DB CHANGES- ENVIRONMENT SPECIFIC CHANGES", "8"),
-        ("2.5", "QUEUE CONFIGURATION SCRIPTS", "8"),
-        ("2.6", "SCHEDULER JOBS", "9"),
-        ("2.7", "MIGRATION SCRIPTS", "9"),
-        ("2.8", "SHELL SCRIPT CHANGES", "9"),
-        ("2.9", "SQL SCRIPT CHANGE", "10"),
-        ("2.10", "CRON JOB CHANGES", "10"),
-        ("2.11", "KEYCLOAK CONFIGURATION CHANGES", "10"),
-        ("2.12", "SCHEDULER SERVER CHANGES", "11"),
-    ]
-    
-    for number, title, page in deployment_items:
-        _add_toc_item(doc, number, title, page)
+    p = parse_xml(
+        f'<w:p {nsdecls("w")}><w:pPr><w:pStyle w:val="{style_id(TOC_1)}"/></w:pPr>'
+        f'{_field_begin()}<w:r><w:t>{escape(EMPTY_TOC_TEXT)}</w:t></w:r>{_field_end()}</w:p>'
+    )
+    doc.element.body._insert_p(p)
 
 
-# ============================================================================
-# HELPER FUNCTION FOR DYNAMIC DOT CALCULATION
-# ============================================================================
-def _calculate_dots_needed(text_length, char_width, indent):
-    """
-    Calculate the number of dots needed to push page numbers to the right edge.
-    
-    Args:
-        text_length: Total character count of number + title
-        char_width: Approximate width per character in inches
-        indent: Left indent in inches
-    
-    Returns:
-        Number of dots needed
-    """
-    # Calculate space used by text
-    text_width = text_length * char_width
-    
-    # Calculate remaining space (page width - indent - text width - space for page number)
-    remaining_width = PAGE_WIDTH - indent - text_width - 0.5  # 0.5" for page number
-    
-    # Calculate dots needed
-    dots_needed = int(remaining_width / (char_width * 0.8))  # Dots are slightly narrower
-    dots_needed = dots_needed + 10
-    # Ensure minimum dots for readability
-    return max(dots_needed, 10)
+def _toc_paragraphs(body):
+    """The body paragraphs from the TOC field's begin to its end."""
+    paragraphs = []
+    depth = 0       # nesting of fields opened since the TOC began
+    for p in body.iterchildren(qn("w:p")):
+        if not paragraphs:
+            instructions = "".join(t.text or "" for t in p.iter(qn("w:instrText")))
+            if not instructions.strip().startswith("TOC "):
+                continue
+        paragraphs.append(p)
 
+        for fld_char in p.iter(qn("w:fldChar")):
+            kind = fld_char.get(qn("w:fldCharType"))
+            if kind == "begin":
+                depth += 1
+            elif kind == "end":
+                depth -= 1
+                if depth == 0:
+                    return paragraphs
+    return paragraphs
 
-# ============================================================================
-# TOC ITEM FORMATTING FUNCTIONS
-# ============================================================================
-def _add_toc_section(doc, number, title, page, add_space_before=False):
+
+def toc_headings(doc):
     """
-    Add a major TOC section heading (bold, larger text) with dynamic dots.
-    
+    Every chapter / section bar in body order as (level, text, w:p).
+
     Args:
         doc: A python-docx Document object
-        number: Section number (e.g., "1.")
-        title: Section title
-        page: Page number
-        add_space_before: Whether to add extra space before this section
     """
-    paragraph = doc.add_paragraph()
-    paragraph.paragraph_format.left_indent = Inches(SECTION_INDENT)
-    paragraph.paragraph_format.space_after = Pt(2)
-    paragraph.paragraph_format.line_spacing = ITEM_LINE_SPACING
-    
-    if add_space_before:
-        paragraph.paragraph_format.space_before = SECTION_SPACE_BEFORE
+    levels = {style_id(name): level for name, level in TOC_LEVELS.items()}
+
+    headings = []
+    for p in doc.element.body.iterchildren(qn("w:p")):
+        level = levels.get(p.style)
+        if level:
+            text = "".join(t.text or "" for t in p.iter(qn("w:t"))).strip()
+            if text:
+                headings.append((level, text, p))
+    return headings
+
+
+def _bookmark(p, number):
+    """Bookmark the heading paragraph (once) and return the bookmark name."""
+    existing = p.find(qn("w:bookmarkStart"))
+    if existing is not None:
+        return existing.get(qn("w:name"))
+
+    name = f"{BOOKMARK_PREFIX}{number:08d}"
+    start = OxmlElement("w:bookmarkStart")
+    start.set(qn("w:id"), str(number))
+    start.set(qn("w:name"), name)
+    end = OxmlElement("w:bookmarkEnd")
+    end.set(qn("w:id"), str(number))
+
+    pPr = p.find(qn("w:pPr"))
+    if pPr is not None:
+        pPr.addnext(start)
     else:
-        paragraph.paragraph_format.space_before = Pt(0)
-    
-    # Format number and title
-    formatted_number = f"{number:<6}"
-    formatted_title = f"{title} "
-    
-    # Calculate dots needed based on content length
-    total_text_length = len(formatted_number) + len(formatted_title)
-    dots_count = _calculate_dots_needed(total_text_length, CHAR_WIDTH_SECTION, SECTION_INDENT)
-    
-    # Add section number
-    num_run = paragraph.add_run(formatted_number)
-    num_run.bold = True
-    num_run.font.size = SECTION_FONT_SIZE
-    num_run.font.color.rgb = BLUE
-    
-    # Add section title
-    title_run = paragraph.add_run(formatted_title)
-    title_run.bold = True
-    title_run.font.size = SECTION_FONT_SIZE
-    title_run.font.color.rgb = BLUE
-    
-    # Add dynamic leader dots
-    dots_run = paragraph.add_run("." * dots_count)
-    dots_run.font.size = SECTION_FONT_SIZE
-    dots_run.font.color.rgb = BLUE
-    
-    # Add page number
-    page_run = paragraph.add_run(f" {page}")
-    page_run.bold = True
-    page_run.font.size = SECTION_FONT_SIZE
-    page_run.font.color.rgb = BLUE
-
-
-def _add_toc_item(doc, number, title, page):
+        p.insert(0, start)
+    p.append(end)
+    return name
+
+
+def _toc_entry(level, text, bookmark, page, first, last):
+    page_ref = f" PAGEREF {bookmark} \\h "
+    return parse_xml(
+        f'<w:p {nsdecls("w")}><w:pPr><w:pStyle w:val="{style_id(ENTRY_STYLES[level])}"/></w:pPr>'
+        + (_field_begin() if first else "")
+        + f'<w:hyperlink w:anchor={quoteattr(bookmark)} w:history="1">'
+        f'<w:r><w:t xml:space="preserve">{escape(text)}</w:t></w:r>'
+        '<w:r><w:tab/></w:r>'
+        '<w:r><w:fldChar w:fldCharType="begin"/></w:r>'
+        f'<w:r><w:instrText xml:space="preserve">{page_ref}</w:instrText></w:r>'
+        '<w:r><w:fldChar w:fldCharType="separate"/></w:r>'
+        f'<w:r><w:t>{page or ""}</w:t></w:r>'
+        '<w:r><w:fldChar w:fldCharType="end"/></w:r>'
+        '</w:hyperlink>'
+        + (_field_end() if last else "")
+        + '</w:p>'
+    )
+
+
+def fill_toc(doc, page_map=None):
     """
-    Add a TOC item (subsection) with proper indentation and dynamic dots.
-    
+    Write the TOC field result from the document's headings.
+
+    Can be called again (e.g. once page numbers are known); the previous
+    result is replaced.
+
     Args:
         doc: A python-docx Document object
-        number: Item number (e.g., "1.1")
-        title: Item title
-        page: Page number
+        page_map: Optional {heading text: page number}; entries without
+            a page are left for Word to fill in when it updates the field
+
+    Returns:
+        The number of entries written
     """
-    paragraph = doc.add_paragraph()
-    paragraph.paragraph_format.left_indent = Inches(ITEM_INDENT)
-    paragraph.paragraph_format.space_after = Pt(1)
-    paragraph.paragraph_format.space_before = Pt(0)
-    paragraph.paragraph_format.line_spacing = ITEM_LINE_SPACING
-    
-    # Format number and title
-    formatted_number = f"{number:<8}"
-    formatted_title = f"{title} "
-    
-    # Calculate dots needed based on content length
-    total_text_length = len(formatted_number) + len(formatted_title)
-    dots_count = _calculate_dots_needed(total_text_length, CHAR_WIDTH_ITEM, ITEM_INDENT)
-    
-    # Add item number
-    num_run = paragraph.add_run(formatted_number)
-    num_run.font.size = ITEM_FONT_SIZE
-    num_run.font.color.rgb = BLUE
-    
-    # Add item title
-    title_run = paragraph.add_run(formatted_title)
-    title_run.font.size = ITEM_FONT_SIZE
-    title_run.font.color.rgb = BLUE
-    
-    # Add dynamic leader dots
-    dots_run = paragraph.add_run("." * dots_count)
-    dots_run.font.size = ITEM_FONT_SIZE
-    dots_run.font.color.rgb = BLUE
-    
-    # Add page number
-    page_run = paragraph.add_run(f" {page}")
-    page_run.font.size = ITEM_FONT_SIZE
-    page_run.font.color.rgb = BLUE
+    body = doc.element.body
+    old = _toc_paragraphs(body)
+    if not old:
+        return 0
+
+    page_map = page_map or {}
+    headings = toc_headings(doc)
+
+    entries = [
+        _toc_entry(level, text, _bookmark(p, number), page_map.get(text),
+                   first=number == 0, last=number == len(headings) - 1)
+        for number, (level, text, p) in enumerate(headings)
+    ]
+
+    anchor = old[0]
+    for entry in entries:
+        anchor.addprevious(entry)
+    if not entries:
+        anchor.addprevious(parse_xml(
+            f'<w:p {nsdecls("w")}><w:pPr><w:pStyle w:val="{style_id(TOC_1)}"/></w:pPr>'
+            f'{_field_begin()}<w:r><w:t>{escape(EMPTY_TOC_TEXT)}</w:t></w:r>{_field_end()}</w:p>'
+        ))
+
+    for p in old:
+        body.remove(p)
+
+    return len(entries)
 
 
 # ============================================================================
@@ -313,15 +306,18 @@ def _add_toc_item(doc, number, title, page):
 # ============================================================================
 if __name__ == "__main__":
     from docx import Document
-    
+    from utils.styles import chapter_bar, section_bar
+
     # Create a new document
     doc = Document()
-    
-    # Build TOC page
+
+    # Build TOC page and a couple of headings for it to list
     build_toc_page(doc)
-    
+    chapter_bar(doc, "1.  Introduction")
+    section_bar(doc, "1.1 Purpose")
+    fill_toc(doc)
+
     # Save the document
     doc.save("professional_toc_aligned.docx")
-    print("✓ Professional Table of Contents created successfully!")
-    print("✓ Page numbers perfectly aligned to the right!")
-    print("✓ File saved as: professional_toc_aligned.docx")
\ No newline at end of file
+    print("✓ Table of Contents field created successfully!")
+    print("✓ File saved as: professional_toc_aligned.docx")
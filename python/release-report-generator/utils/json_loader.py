@@ -1,4 +1,5 @@
 import json
+import re
 from pathlib import Path
 
 # Get project root dynamically
@@ -7,7 +8,299 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 # Correct JSON folder
 JSON_DIR = BASE_DIR / "json_files"
 
+# ============================================================
+# RECORD TYPES
+# ============================================================
+
+class ReportDataError(ValueError):
+    """The deployment-details JSON is malformed or has the wrong shape."""
+
+
+class ChangedFile:
+
+    __slots__ = ("path", "status", "insertions", "deletions", "old_path")
+
+    def __init__(self, path, status, insertions=None, deletions=None, old_path=None):
+        self.path = path
+        self.status = status
+        self.insertions = insertions    # None for binary files
+        self.deletions = deletions
+        self.old_path = old_path        # renames and copies only
+
+
+class Commit:
+
+    __slots__ = ("commit_id", "author", "date", "issues", "message", "repository", "files")
+
+    def __init__(self, commit_id, author, date, issues, message, repository="", files=()):
+        self.commit_id = commit_id
+        self.author = author
+        self.date = date
+        self.issues = issues
+        self.message = message
+        self.repository = repository
+        self.files = files
+
+
+class ReleaseData:
+    """
+    Everything in a *_DeploymentDetails.json except the commit list,
+    validated. Commits are streamed from the file by commits().
+    """
+
+    __slots__ = (
+        "path", "release", "base_release", "target_release", "app_name",
+        "generated_on", "releases", "repositories", "deployment_details",
+        "app_server_build_versions", "release_wise_modules", "commit_count",
+    )
+
+    def __init__(self, path, header, commit_count):
+        self.path = path
+        self.release = header.get("release")
+        self.base_release = header.get("baseRelease")
+        self.target_release = header.get("targetRelease")
+        self.app_name = header.get("appName")
+        self.generated_on = header.get("generatedOn")
+        self.releases = header.get("releases") or []
+        self.repositories = header.get("repositories") or []
+        self.deployment_details = header.get("deploymentDetails") or {}
+        self.app_server_build_versions = header.get("appServerBuildVersions") or {}
+        self.release_wise_modules = header.get("releaseWiseModules") or []
+        self.commit_count = commit_count
+
+    def commits(self):
+        """Yield the commitSummary entries as Commit records, one at a time."""
+        with open(self.path, "r", encoding="utf-8-sig") as f:
+            stream = _Stream(f, self.path)
+            for key in _members(stream):
+                if key != "commitSummary":
+                    stream.skip()
+                    continue
+                for i, item in enumerate(_items(stream)):
+                    yield _commit(item, i, self.path)
+                return
+
+# ============================================================
+# INCREMENTAL JSON READER
+# ============================================================
+# Walks the top-level object member by member and the
+# commitSummary array item by item, so only one commit is held
+# in memory at a time however long the release diff is.
+
+CHUNK_CHARS = 64 * 1024
+_NON_WHITESPACE = re.compile(r"[^ \t\n\r]")
+_decoder = json.JSONDecoder()
+
+
+class _Stream:
+
+    def __init__(self, f, path):
+        self.f = f
+        self.path = path
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.lines_before = 0   # newlines in text already dropped from buf
+
+    def _fill(self, size=CHUNK_CHARS):
+        if self.eof:
+            return False
+        chunk = self.f.read(max(size, CHUNK_CHARS))
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop what has been consumed so the buffer stays small
+        if self.pos:
+            self.lines_before += self.buf.count("\n", 0, self.pos)
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        self.buf += chunk
+        return True
+
+    def error(self, message, pos=None):
+        pos = self.pos if pos is None else pos
+        line = self.lines_before + self.buf.count("\n", 0, pos) + 1
+        column = pos - (self.buf.rfind("\n", 0, pos) + 1) + 1
+        return ReportDataError(f"{self.path.name}: line {line} column {column}: {message}")
+
+    def peek(self):
+        """Next non-whitespace character, or "" at end of input."""
+        while True:
+            m = _NON_WHITESPACE.search(self.buf, self.pos)
+            if m:
+                self.pos = m.start()
+                return m.group()
+            self.pos = len(self.buf)
+            if not self._fill():
+                return ""
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise self.error(f"expected '{char}'")
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                # Value not complete in the buffer yet: read at least as much again
+                if self._fill(len(self.buf)):
+                    continue
+                raise self.error(e.msg, e.pos)
+            # A number may continue past the end of the buffer
+            if end == len(self.buf) and self._fill():
+                continue
+            self.pos = end
+            return obj
+
+    def skip(self):
+        if self.peek() == "[":
+            for _ in _items(self):
+                pass
+        else:
+            self.value()
+
+
+def _members(stream):
+    """Yield the keys of an object; the caller consumes each value."""
+    stream.expect("{")
+    if stream.peek() == "}":
+        stream.pos += 1
+        return
+    while True:
+        if stream.peek() != '"':
+            raise stream.error("expected a member name")
+        key = stream.value()
+        stream.expect(":")
+        yield key
+        char = stream.peek()
+        stream.pos += 1
+        if char == "}":
+            return
+        if char != ",":
+            raise stream.error("expected ',' or '}'", stream.pos - 1)
+
+
+def _items(stream):
+    stream.expect("[")
+    if stream.peek() == "]":
+        stream.pos += 1
+        return
+    while True:
+        yield stream.value()
+        char = stream.peek()
+        stream.pos += 1
+        if char == "]":
+            return
+        if char != ",":
+            raise stream.error("expected ',' or ']'", stream.pos - 1)
+
+# ============================================================
+# VALIDATION
+# ============================================================
+
+def _fail(path, where, expected, value):
+    return ReportDataError(f"{path.name}: {where}: expected {expected}, got {type(value).__name__}")
+
+
+def _check_str(path, where, value, optional=True):
+    if value is None and optional:
+        return
+    if not isinstance(value, str):
+        raise _fail(path, where, "a string", value)
+
+
+def _check_str_list(path, where, value):
+    if not isinstance(value, list):
+        raise _fail(path, where, "a list of strings", value)
+    for i, item in enumerate(value):
+        _check_str(path, f"{where}[{i}]", item, optional=False)
+
+
+def _check_header(path, header):
+    for key in ("release", "baseRelease", "targetRelease", "appName", "generatedOn"):
+        _check_str(path, key, header.get(key))
+
+    for key in ("releases", "repositories"):
+        if header.get(key) is not None:
+            _check_str_list(path, key, header[key])
+
+    details = header.get("deploymentDetails")
+    if details is not None:
+        if not isinstance(details, dict):
+            raise _fail(path, "deploymentDetails", "an object", details)
+        for section, entries in details.items():
+            where = f"deploymentDetails[{section!r}]"
+            if isinstance(entries, dict):
+                for release, text in entries.items():
+                    _check_str(path, f"{where}[{release!r}]", text)
+            elif entries is not None and not isinstance(entries, str):
+                _check_str_list(path, where, entries)
+
+    versions = header.get("appServerBuildVersions")
+    if versions is not None:
+        if not isinstance(versions, dict):
+            raise _fail(path, "appServerBuildVersions", "an object", versions)
+        for module, version in versions.items():
+            _check_str(path, f"appServerBuildVersions[{module!r}]", version)
+
+    modules = header.get("releaseWiseModules")
+    if modules is not None:
+        if not isinstance(modules, list):
+            raise _fail(path, "releaseWiseModules", "a list", modules)
+        for i, entry in enumerate(modules):
+            where = f"releaseWiseModules[{i}]"
+            if not isinstance(entry, dict):
+                raise _fail(path, where, "an object", entry)
+            _check_str(path, f"{where}.release", entry.get("release"), optional=False)
+            _check_str_list(path, f"{where}.modules", entry.get("modules"))
+
+
+def _commit(item, index, path):
+    where = f"commitSummary[{index}]"
+    if not isinstance(item, dict):
+        raise _fail(path, where, "an object", item)
+    for key in ("commitId", "author", "date", "message"):
+        _check_str(path, f"{where}.{key}", item.get(key), optional=False)
+    _check_str(path, f"{where}.issues", item.get("issues"))
+    _check_str(path, f"{where}.repository", item.get("repository"))
+
+    files = item.get("files")
+    if files is not None and not isinstance(files, list):
+        raise _fail(path, f"{where}.files", "a list", files)
+
+    return Commit(
+        item["commitId"], item["author"], item["date"], item.get("issues") or "", item["message"],
+        item.get("repository") or "",
+        tuple(_changed_file(entry, f"{where}.files[{i}]", path) for i, entry in enumerate(files or ())),
+    )
+
+
+def _changed_file(entry, where, path):
+    if not isinstance(entry, dict):
+        raise _fail(path, where, "an object", entry)
+    for key in ("path", "status"):
+        _check_str(path, f"{where}.{key}", entry.get(key), optional=False)
+    _check_str(path, f"{where}.oldPath", entry.get("oldPath"))
+    for key in ("insertions", "deletions"):
+        value = entry.get(key)
+        if value is not None and (not isinstance(value, int) or isinstance(value, bool)):
+            raise _fail(path, f"{where}.{key}", "a number", value)
+
+    return ChangedFile(entry["path"], entry["status"], entry.get("insertions"), entry.get("deletions"), entry.get("oldPath"))
+
+# ============================================================
+# LOADER
+# ============================================================
+
 def load_json(filename: str):
+    """
+    Validate a deployment-details JSON from json_files/ in one
+    streaming pass and return its ReleaseData. Raises
+    ReportDataError naming the offending field or position.
+    """
     file_path = JSON_DIR / filename
 
     if not file_path.exists():
@@ -17,5 +310,28 @@ def load_json(filename: str):
             f"📄 Available JSON files: {[f.name for f in JSON_DIR.glob('*.json')]}"
         )
 
+    header = {}
+    commit_count = 0
+
     with open(file_path, "r", encoding="utf-8-sig") as f:
-        return json.load(f)
+        stream = _Stream(f, file_path)
+
+        if stream.peek() != "{":
+            raise stream.error("expected a JSON object")
+
+        for key in _members(stream):
+            if key == "commitSummary":
+                if stream.peek() != "[":
+                    raise stream.error("commitSummary: expected a list")
+                # Validated here, then dropped; commits() streams them again on demand
+                for i, item in enumerate(_items(stream)):
+                    _commit(item, i, file_path)
+                    commit_count += 1
+            else:
+                header[key] = stream.value()
+
+        if stream.peek():
+            raise stream.error("unexpected data after the top-level object")
+
+    _check_header(file_path, header)
+    return ReleaseData(file_path, header, commit_count)
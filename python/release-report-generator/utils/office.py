@@ -0,0 +1,160 @@
+import json
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import uuid
+from pathlib import Path
+
+# ============================================================
+# HEADLESS LIBREOFFICE
+# ============================================================
+# Only the stdlib is imported here: the uno scripts next to this
+# module (office_toc_pass.py, office_pdf_worker.py) run under
+# LibreOffice's own python and import it too.
+
+CONNECT_TIMEOUT = 60
+
+UTILS_DIR = Path(__file__).resolve().parent
+PDF_WORKER = UTILS_DIR / "office_pdf_worker.py"
+
+
+def find_office():
+    """soffice from RELEASE_DOC_SOFFICE or the PATH, else None."""
+    configured = os.environ.get("RELEASE_DOC_SOFFICE")
+    if configured:
+        return configured
+    return shutil.which("soffice") or shutil.which("libreoffice")
+
+
+def office_python(soffice):
+    """A python that can import uno: RELEASE_DOC_OFFICE_PYTHON, the bundled one, or python3."""
+    configured = os.environ.get("RELEASE_DOC_OFFICE_PYTHON")
+    if configured:
+        return configured
+
+    # Windows / macOS installs bundle their python next to soffice;
+    # Linux packages use the system python3 with python3-uno
+    program_dir = Path(shutil.which(soffice) or soffice).resolve().parent
+    for name in ("python.exe", "python"):
+        if (program_dir / name).exists():
+            return str(program_dir / name)
+    return shutil.which("python3") or sys.executable
+
+
+def listener_command(soffice, profile_dir, pipe):
+    """soffice listening on a named pipe, with a throwaway profile so it never meets a desktop session."""
+    return [
+        soffice, "--headless", "--invisible", "--nologo", "--norestore", "--nodefault",
+        f"-env:UserInstallation={Path(profile_dir).as_uri()}",
+        f"--accept=pipe,name={pipe};urp;",
+    ]
+
+
+def _stop(process, grace=10):
+    if process is None or process.poll() is not None:
+        return
+    process.terminate()
+    try:
+        process.wait(timeout=grace)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+# ============================================================
+# WARM CONVERTER WORKER
+# ============================================================
+
+class OfficeWorker:
+    """
+    One soffice listener plus the uno worker script talking to it,
+    started on first use and kept warm across conversions. A timed
+    out or crashed conversion kills both; the next one restarts them.
+    """
+
+    def __init__(self, soffice):
+        self.soffice = soffice
+        self._office = None
+        self._worker = None
+        self._replies = None
+        self._profile = None
+
+    def start(self):
+        pipe = f"release_office_{uuid.uuid4().hex}"
+        self._profile = tempfile.TemporaryDirectory(
+            prefix="release_office_profile_", ignore_cleanup_errors=True,
+        )
+
+        self._office = subprocess.Popen(
+            listener_command(self.soffice, self._profile.name, pipe),
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        self._worker = subprocess.Popen(
+            [office_python(self.soffice), str(PDF_WORKER), pipe],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, encoding="utf-8", bufsize=1,
+        )
+
+        # Replies are read on a thread so waiting on one can time out
+        self._replies = queue.Queue()
+        threading.Thread(target=self._read, args=(self._worker, self._replies), daemon=True).start()
+
+        try:
+            self._reply(CONNECT_TIMEOUT + 10, "start")
+        except Exception:
+            self.stop()
+            raise
+
+    @staticmethod
+    def _read(worker, replies):
+        for line in worker.stdout:
+            replies.put(line)
+        replies.put(None)
+
+    def _reply(self, timeout, what):
+        try:
+            line = self._replies.get(timeout=timeout)
+        except queue.Empty:
+            self.stop(graceful=False)
+            raise TimeoutError(f"LibreOffice {what} timed out after {timeout}s")
+
+        if line is None:
+            self.stop()
+            raise RuntimeError(f"LibreOffice worker exited during {what}")
+
+        reply = json.loads(line)
+        if not reply.get("ok"):
+            raise RuntimeError(reply.get("error") or f"LibreOffice {what} failed")
+        return reply
+
+    def convert(self, source, target, timeout):
+        """Export source (.docx) to target (.pdf); raises on failure or timeout."""
+        if self._worker is None:
+            self.start()
+
+        try:
+            self._worker.stdin.write(json.dumps({"source": str(source), "target": str(target)}) + "\n")
+            self._worker.stdin.flush()
+        except OSError:
+            self.stop()
+            raise RuntimeError("LibreOffice worker is gone")
+        self._reply(timeout, f"export of {Path(source).name}")
+
+    def stop(self, graceful=True):
+        if graceful and self._worker is not None and self._worker.poll() is None:
+            try:
+                # End of input lets the worker close its documents and exit
+                self._worker.stdin.close()
+                self._worker.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+        _stop(self._worker)
+        _stop(self._office)
+        self._worker = self._office = self._replies = None
+
+        if self._profile is not None:
+            self._profile.cleanup()
+            self._profile = None
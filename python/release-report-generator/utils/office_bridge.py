@@ -0,0 +1,50 @@
+"""
+uno helpers shared by the scripts that run under LibreOffice's python
+(office_toc_pass.py, office_pdf_worker.py).
+"""
+
+import time
+from pathlib import Path
+
+import uno
+from com.sun.star.beans import PropertyValue
+
+from office import CONNECT_TIMEOUT
+
+
+def property_value(name, value):
+    prop = PropertyValue()
+    prop.Name = name
+    prop.Value = value
+    return prop
+
+
+def connect(pipe, timeout=CONNECT_TIMEOUT):
+    """Component context of the soffice listening on pipe, retrying while it starts."""
+    local = uno.getComponentContext()
+    resolver = local.ServiceManager.createInstanceWithContext("com.sun.star.bridge.UnoUrlResolver", local)
+
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return resolver.resolve(f"uno:pipe,name={pipe};urp;StarOffice.ComponentContext")
+        except Exception:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.5)
+
+
+def load_hidden(ctx, path):
+    desktop = ctx.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", ctx)
+    return desktop.loadComponentFromURL(
+        uno.systemPathToFileUrl(str(Path(path).resolve())), "_blank", 0,
+        (property_value("Hidden", True),),
+    )
+
+
+def refresh_fields(doc):
+    """Rebuild the TOC and other indexes, then every field (PAGEREF, PAGE, ...)."""
+    indexes = doc.getDocumentIndexes()
+    for i in range(indexes.getCount()):
+        indexes.getByIndex(i).update()
+    doc.getTextFields().refresh()
@@ -0,0 +1,62 @@
+"""
+Warm PDF export worker, started by office.OfficeWorker.
+
+Run with a python that has LibreOffice's uno module:
+
+    python office_pdf_worker.py <pipe name>
+
+Connects to the soffice listening on the pipe, answers {"ok": true}
+once ready, then reads one {"source", "target"} job per stdin line and
+answers one {"ok": ...} line per job, until stdin closes.
+"""
+
+import json
+import sys
+
+import uno
+
+from office_bridge import connect, load_hidden, property_value, refresh_fields
+
+
+def export_pdf(ctx, source, target):
+    doc = load_hidden(ctx, source)
+    try:
+        # The TOC page numbers are only final once the fields are updated
+        refresh_fields(doc)
+        doc.storeToURL(
+            uno.systemPathToFileUrl(target),
+            (property_value("FilterName", "writer_pdf_Export"),),
+        )
+    finally:
+        doc.close(True)
+
+
+def _answer(reply):
+    sys.stdout.write(json.dumps(reply) + "\n")
+    sys.stdout.flush()
+
+
+def main(pipe):
+    try:
+        ctx = connect(pipe)
+    except Exception as e:
+        _answer({"ok": False, "error": f"cannot reach soffice: {e}"})
+        return 1
+    _answer({"ok": True})
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            job = json.loads(line)
+            export_pdf(ctx, job["source"], job["target"])
+            _answer({"ok": True})
+        except Exception as e:
+            _answer({"ok": False, "error": " ".join(str(e).split()) or type(e).__name__})
+    return 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit(__doc__)
+    sys.exit(main(sys.argv[1]))
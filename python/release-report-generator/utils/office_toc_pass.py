@@ -0,0 +1,74 @@
+"""
+Headless LibreOffice pass for the report TOC.
+
+Run with a python that has LibreOffice's uno module (the one bundled
+with the office install, or python3 + python3-uno on Linux):
+
+    python office_toc_pass.py <soffice> <document.docx> <pages.json> <heading style>...
+
+Starts a private headless soffice, opens the document hidden, updates
+its indexes and fields, and writes {heading text: page number} for
+every paragraph in one of the heading styles.
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+import uuid
+
+from office import listener_command
+from office_bridge import connect, load_hidden, refresh_fields
+
+
+def page_map(ctx, docx_path, heading_styles):
+    doc = load_hidden(ctx, docx_path)
+    try:
+        # Rebuild the TOC first so the pages after it are laid out at their final length
+        refresh_fields(doc)
+
+        view = doc.getCurrentController().getViewCursor()
+        pages = {}
+
+        paragraphs = doc.getText().createEnumeration()
+        while paragraphs.hasMoreElements():
+            paragraph = paragraphs.nextElement()
+            if not paragraph.supportsService("com.sun.star.text.Paragraph"):
+                continue
+            if paragraph.ParaStyleName not in heading_styles:
+                continue
+            text = paragraph.getString().strip()
+            if text and text not in pages:
+                view.gotoRange(paragraph.getStart(), False)
+                pages[text] = view.getPage()
+
+        return pages
+    finally:
+        doc.close(True)
+
+
+def main(soffice, docx_path, out_path, *heading_styles):
+    pipe = f"release_toc_{uuid.uuid4().hex}"
+
+    with tempfile.TemporaryDirectory(prefix="release_toc_profile_", ignore_cleanup_errors=True) as profile:
+        office = subprocess.Popen(
+            listener_command(soffice, profile, pipe),
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        try:
+            pages = page_map(connect(pipe), docx_path, set(heading_styles))
+        finally:
+            office.terminate()
+            try:
+                office.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                office.kill()
+
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(pages, f, indent=2)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 5:
+        sys.exit(__doc__)
+    main(*sys.argv[1:])
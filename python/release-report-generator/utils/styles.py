@@ -0,0 +1,262 @@
+from collections import namedtuple
+
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.ns import nsdecls, qn
+from docx.table import Table
+
+# ============================================================
+# SHARED DOCUMENT STYLES
+# ============================================================
+# The deployment pages used to give every bar, label and table
+# cell its own run fonts, w:shd and w:tcBorders. The look now
+# lives in named styles, written into styles.xml once per
+# document; paragraphs and cells only reference a style id.
+
+GREY = "D9D9D9"
+RED = "FF0000"
+YELLOW = "FFFF00"
+
+# Paragraph styles
+CHAPTER_BAR = "Release Chapter Bar"           # red "2. Deployment Details" bar
+SECTION_BAR = "Release Section Bar"           # grey "2.x ..." bar
+RELEASE_LABEL = "Release Label"               # underlined release id
+RELEASE_TEXT = "Release Instruction"          # text under a release id
+BODY_TEXT = "Release Body"
+TABLE_TEXT = "Release Table Text"
+TABLE_CENTER = "Release Table Center"
+TABLE_HEADING = "Release Table Heading"
+TABLE_BULLET = "Release Table Bullet"
+
+# Word's own TOC entry styles, used for the field result
+TOC_1 = "toc 1"
+TOC_2 = "toc 2"
+
+# Character styles
+LINK_TEXT = "Release Link"                    # blue, underlined
+BLUE_TEXT = "Release Blue"
+
+# Table style
+GRID = "Release Grid"
+
+# Chapter and section bars carry outline levels 0 and 1; they are
+# the headings the TOC field collects, as TOC levels 1 and 2
+# (see pages/toc_page.py)
+TOC_LEVELS = {CHAPTER_BAR: 1, SECTION_BAR: 2}
+
+# Right edge of the text area of the default page (8.5" less two 1.25" margins)
+TEXT_WIDTH = 8640
+
+# Sizes are half-points (21 = 10.5pt), spacing and indents twips (20 = 1pt)
+_STYLES = [
+    ("paragraph", CHAPTER_BAR, """
+        <w:pPr>
+          <w:pBdr>
+            <w:top w:val="single" w:sz="12" w:space="1" w:color="000000"/>
+            <w:bottom w:val="single" w:sz="12" w:space="1" w:color="000000"/>
+          </w:pBdr>
+          <w:shd w:val="clear" w:color="auto" w:fill="FF0000"/>
+          <w:spacing w:before="120" w:after="120"/>
+          <w:jc w:val="center"/>
+          <w:outlineLvl w:val="0"/>
+        </w:pPr>
+        <w:rPr><w:b/><w:color w:val="000000"/><w:sz w:val="26"/></w:rPr>"""),
+    ("paragraph", SECTION_BAR, """
+        <w:pPr>
+          <w:shd w:val="clear" w:color="auto" w:fill="D9D9D9"/>
+          <w:spacing w:before="160" w:after="120"/>
+          <w:outlineLvl w:val="1"/>
+        </w:pPr>
+        <w:rPr><w:i/><w:color w:val="000000"/><w:sz w:val="22"/></w:rPr>"""),
+    ("paragraph", RELEASE_LABEL, """
+        <w:pPr><w:keepNext/><w:spacing w:before="80" w:after="20"/><w:ind w:left="480"/></w:pPr>
+        <w:rPr><w:b/><w:color w:val="000000"/><w:sz w:val="21"/><w:u w:val="single"/></w:rPr>"""),
+    ("paragraph", RELEASE_TEXT, """
+        <w:pPr><w:spacing w:before="0" w:after="120"/><w:ind w:left="840"/></w:pPr>
+        <w:rPr><w:color w:val="000000"/><w:sz w:val="21"/></w:rPr>"""),
+    ("paragraph", BODY_TEXT, """
+        <w:pPr><w:spacing w:after="120"/></w:pPr>
+        <w:rPr><w:color w:val="000000"/><w:sz w:val="21"/></w:rPr>"""),
+    ("paragraph", TABLE_TEXT, """
+        <w:pPr><w:spacing w:before="0" w:after="0" w:line="240" w:lineRule="auto"/></w:pPr>
+        <w:rPr><w:color w:val="000000"/><w:sz w:val="21"/></w:rPr>"""),
+    ("paragraph", TABLE_CENTER, """
+        <w:basedOn w:val="ReleaseTableText"/>
+        <w:pPr><w:jc w:val="center"/></w:pPr>"""),
+    ("paragraph", TABLE_HEADING, """
+        <w:basedOn w:val="ReleaseTableText"/>
+        <w:pPr><w:jc w:val="center"/></w:pPr>
+        <w:rPr><w:b/></w:rPr>"""),
+    ("paragraph", TABLE_BULLET, """
+        <w:basedOn w:val="ReleaseTableText"/>
+        <w:pPr><w:ind w:left="173"/></w:pPr>"""),
+    ("paragraph", TOC_1, f"""
+        <w:pPr>
+          <w:tabs><w:tab w:val="right" w:leader="dot" w:pos="{TEXT_WIDTH}"/></w:tabs>
+          <w:spacing w:before="160" w:after="40"/><w:ind w:left="360"/>
+        </w:pPr>
+        <w:rPr><w:b/><w:caps/><w:color w:val="0000CC"/><w:sz w:val="22"/></w:rPr>"""),
+    ("paragraph", TOC_2, f"""
+        <w:pPr>
+          <w:tabs><w:tab w:val="right" w:leader="dot" w:pos="{TEXT_WIDTH}"/></w:tabs>
+          <w:spacing w:before="0" w:after="20"/><w:ind w:left="720"/>
+        </w:pPr>
+        <w:rPr><w:caps/><w:color w:val="0000CC"/><w:sz w:val="20"/></w:rPr>"""),
+    ("character", LINK_TEXT, """
+        <w:rPr><w:color w:val="0000FF"/><w:u w:val="single"/></w:rPr>"""),
+    ("character", BLUE_TEXT, """
+        <w:rPr><w:color w:val="0000FF"/></w:rPr>"""),
+    ("table", GRID, """
+        <w:basedOn w:val="TableNormal"/>
+        <w:tblPr>
+          <w:tblBorders>
+            <w:top w:val="single" w:sz="4" w:space="0" w:color="000000"/>
+            <w:left w:val="single" w:sz="4" w:space="0" w:color="000000"/>
+            <w:bottom w:val="single" w:sz="4" w:space="0" w:color="000000"/>
+            <w:right w:val="single" w:sz="4" w:space="0" w:color="000000"/>
+            <w:insideH w:val="single" w:sz="4" w:space="0" w:color="000000"/>
+            <w:insideV w:val="single" w:sz="4" w:space="0" w:color="000000"/>
+          </w:tblBorders>
+          <w:tblCellMar>
+            <w:left w:w="108" w:type="dxa"/>
+            <w:right w:w="108" w:type="dxa"/>
+          </w:tblCellMar>
+        </w:tblPr>
+        <w:tcPr><w:vAlign w:val="center"/></w:tcPr>"""),
+]
+
+
+def style_id(name):
+    if name in (TOC_1, TOC_2):
+        return name.upper().replace(" ", "")     # Word's ids: TOC1, TOC2
+    return name.replace(" ", "")
+
+
+def ensure_styles(doc):
+    """Add the shared styles to doc's styles.xml unless already there."""
+    styles = doc.styles
+    if GRID in styles:
+        return
+
+    for style_type, name, body in _STYLES:
+        # basedOn must precede pPr/rPr; styles without one derive from Normal
+        if "<w:basedOn" not in body and style_type == "paragraph":
+            body = '<w:basedOn w:val="Normal"/>' + body
+        custom = "" if name in (TOC_1, TOC_2) else ' w:customStyle="1"'
+        styles.element.append(parse_xml(
+            f'<w:style {nsdecls("w")} w:type="{style_type}"{custom} w:styleId="{style_id(name)}">'
+            f'<w:name w:val="{name}"/>{body}</w:style>'
+        ))
+
+
+# ============================================================
+# PARAGRAPHS
+# ============================================================
+
+def add_styled_paragraph(doc, text, style):
+    p = doc.add_paragraph()
+    p._p.style = style_id(style)
+    if text:
+        p.add_run(text)
+    return p
+
+
+def chapter_bar(doc, text):
+    return add_styled_paragraph(doc, text, CHAPTER_BAR)
+
+
+def section_bar(doc, text):
+    return add_styled_paragraph(doc, text, SECTION_BAR)
+
+
+def release_block(doc, release, text):
+    """Underlined release id with its instruction text below."""
+    add_styled_paragraph(doc, release, RELEASE_LABEL)
+    add_styled_paragraph(doc, text.strip() if text else "No special instructions", RELEASE_TEXT)
+
+
+def shade_cell(cell, color):
+    """Per-cell fill for the odd highlighted cell; regular shading comes from styles."""
+    tcPr = cell._tc.get_or_add_tcPr()
+    shd = OxmlElement("w:shd")
+    shd.set(qn("w:val"), "clear")
+    shd.set(qn("w:color"), "auto")
+    shd.set(qn("w:fill"), color)
+    tcPr.append(shd)
+
+# ============================================================
+# BULK TABLE BUILDER
+# ============================================================
+# Emits the whole w:tbl tree in one pass from the data instead
+# of growing a python-docx table row by row.
+
+# heading text, width (Length), paragraph style, optional character style
+Column = namedtuple("Column", "heading width style char_style", defaults=(TABLE_TEXT, None))
+
+
+def _sub(parent, tag, **attrs):
+    el = OxmlElement(tag)
+    for key, value in attrs.items():
+        el.set(qn(f"w:{key}"), str(value))
+    parent.append(el)
+    return el
+
+
+def _cell(tr, width, lines, p_style, char_style, fill=None):
+    tc = _sub(tr, "w:tc")
+    tcPr = _sub(tc, "w:tcPr")
+    _sub(tcPr, "w:tcW", w=width, type="dxa")
+    if fill:
+        _sub(tcPr, "w:shd", val="clear", color="auto", fill=fill)
+
+    for line in lines:
+        p = _sub(tc, "w:p")
+        _sub(_sub(p, "w:pPr"), "w:pStyle", val=p_style)
+        if line:
+            r = _sub(p, "w:r")
+            if char_style:
+                _sub(_sub(r, "w:rPr"), "w:rStyle", val=char_style)
+            t = _sub(r, "w:t")
+            t.text = line
+            if line != line.strip():
+                t.set(qn("xml:space"), "preserve")
+
+
+def add_table(doc, columns, rows, row_height=None, style=GRID):
+    """
+    Append a table with a grey heading row and one row per item of
+    ``rows``. A cell value is a string, or a list of strings rendered
+    as bullet lines. Returns the python-docx Table.
+    """
+    widths = [int(c.width.twips) for c in columns]
+    p_styles = [style_id(c.style) for c in columns]
+    char_styles = [style_id(c.char_style) if c.char_style else None for c in columns]
+    bullet = style_id(TABLE_BULLET)
+
+    tbl = OxmlElement("w:tbl")
+    tblPr = _sub(tbl, "w:tblPr")
+    _sub(tblPr, "w:tblStyle", val=style_id(style))
+    _sub(tblPr, "w:tblW", w=sum(widths), type="dxa")
+    _sub(tblPr, "w:tblLayout", type="fixed")
+    _sub(tblPr, "w:tblLook", val="04A0", firstRow=1, lastRow=0, firstColumn=0, lastColumn=0, noHBand=1, noVBand=1)
+
+    grid = _sub(tbl, "w:tblGrid")
+    for width in widths:
+        _sub(grid, "w:gridCol", w=width)
+
+    tr = _sub(tbl, "w:tr")
+    _sub(_sub(tr, "w:trPr"), "w:tblHeader")
+    for column, width in zip(columns, widths):
+        _cell(tr, width, [column.heading], style_id(TABLE_HEADING), None, fill=GREY)
+
+    for row in rows:
+        tr = _sub(tbl, "w:tr")
+        if row_height:
+            _sub(_sub(tr, "w:trPr"), "w:trHeight", val=row_height, hRule="exact")
+        for value, width, p_style, char_style in zip(row, widths, p_styles, char_styles):
+            if isinstance(value, (list, tuple)):
+                _cell(tr, width, [f"• {item}" for item in value] or [""], bullet, char_style)
+            else:
+                _cell(tr, width, [value], p_style, char_style)
+
+    doc.element.body._insert_tbl(tbl)
+    return Table(tbl, doc._body)
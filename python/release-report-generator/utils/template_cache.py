@@ -0,0 +1,134 @@
+import hashlib
+import os
+import sys
+from pathlib import Path
+
+import docx
+from docx import Document
+from docx.oxml.ns import qn
+
+from config.paths import BNP_LOGO, ORACLE_LOGO, FOOTER_LINE
+from utils.word_helpers import add_page_border
+from utils.styles import ensure_styles
+from pages.header_footer import add_header, add_footer
+from pages.title_page import build_title_page
+from pages.document_control_page import build_document_control_page
+from pages.toc_page import build_toc_page
+from pages.introduction_page_1 import build_introduction_page_1
+from pages.introduction_page_2 import build_introduction_page_2
+
+# ============================================================
+# PRECOMPILED BASE TEMPLATE
+# ============================================================
+# Everything before the deployment details - page border, header
+# logos, title page, document control, TOC and the introduction
+# pages - plus the footer is the same for every report except a
+# handful of strings. It is built once with placeholders, saved
+# under template_cache/ and keyed by a hash of its inputs, so a
+# report run only loads it, fills the placeholders and renders
+# the data-driven sections.
+
+TEMPLATE_VERSION = 1
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+CACHE_DIR = BASE_DIR / "template_cache"
+
+PLACEHOLDERS = {
+    "title": "{{TITLE}}",
+    "release": "{{RELEASE}}",
+    "subtitle": "{{SUBTITLE}}",
+    "version_no": "{{VERSION_NO}}",
+    "version_date": "{{VERSION_DATE}}",
+    "doc_name": "{{DOC_NAME}}",
+}
+
+# Builders baked into the template; editing any of them changes the key
+TEMPLATE_BUILDERS = [
+    ensure_styles,
+    add_page_border,
+    add_header,
+    add_footer,
+    build_title_page,
+    build_document_control_page,
+    build_toc_page,
+    build_introduction_page_1,
+    build_introduction_page_2,
+]
+
+
+def _template_inputs():
+    sources = {Path(sys.modules[fn.__module__].__file__) for fn in TEMPLATE_BUILDERS}
+    sources.add(Path(__file__))
+    return sorted(sources) + [BNP_LOGO, ORACLE_LOGO, FOOTER_LINE]
+
+
+def template_key():
+    digest = hashlib.sha256()
+    digest.update(f"{TEMPLATE_VERSION}:{docx.__version__}".encode("utf-8"))
+    for path in _template_inputs():
+        digest.update(path.name.encode("utf-8"))
+        digest.update(Path(path).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def build_base_template(path):
+    p = PLACEHOLDERS
+
+    doc = Document()
+    section = doc.sections[0]
+
+    add_page_border(section)
+    add_header(section)
+
+    build_title_page(doc, p["title"], p["release"], p["subtitle"], p["version_no"], p["version_date"])
+    build_document_control_page(doc, p["version_no"])
+    build_toc_page(doc)
+
+    doc.add_page_break()
+    build_introduction_page_1(doc)
+    build_introduction_page_2(doc)
+
+    add_footer(section, p["doc_name"])
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    doc.save(tmp_path)
+    os.replace(tmp_path, path)
+
+    # Templates built from older inputs are never read again
+    for stale in CACHE_DIR.glob("base_*.docx"):
+        if stale != path:
+            stale.unlink(missing_ok=True)
+
+
+def load_base_template(values):
+    """
+    Return a Document holding the static pages with the placeholders
+    replaced by ``values`` (keys of PLACEHOLDERS). Builds the cached
+    template first if its inputs changed.
+    """
+    path = CACHE_DIR / f"base_{template_key()}.docx"
+    if not path.exists():
+        build_base_template(path)
+
+    doc = Document(str(path))
+    fill_placeholders(doc, values)
+    return doc
+
+
+def fill_placeholders(doc, values):
+    # Each placeholder was written as one run, so it sits whole in one w:t
+    replacements = {PLACEHOLDERS[name]: str(value) for name, value in values.items()}
+
+    roots = [doc.element.body]
+    for section in doc.sections:
+        roots.append(section.header._element)
+        roots.append(section.footer._element)
+
+    for root in roots:
+        for t in root.iter(qn("w:t")):
+            text = t.text
+            if text and "{{" in text:
+                for token, value in replacements.items():
+                    text = text.replace(token, value)
+                t.text = text
@@ -0,0 +1,171 @@
+import hashlib
+import json
+import os
+import subprocess
+import tempfile
+from pathlib import Path
+
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+from lxml import etree
+
+from pages.toc_page import fill_toc, toc_headings
+from utils.office import find_office, office_python
+from utils.styles import TOC_LEVELS
+from utils.template_cache import CACHE_DIR, template_key
+
+# ============================================================
+# TOC PAGE NUMBERS
+# ============================================================
+# python-docx cannot lay out pages. When an office install is found,
+# one headless LibreOffice pass measures the page of every heading;
+# the page map is cached under template_cache/ per template hash and
+# rendered content, so a re-render of the same release never pays for
+# the pass again. Without a measured map the TOC gets estimated pages
+# (the last map measured for the same template, else one page per
+# explicit page break) and Word is asked to update fields on open.
+
+OFFICE_TIMEOUT = 180
+
+# Runs under LibreOffice's own python (it needs the uno module)
+OFFICE_SCRIPT = Path(__file__).resolve().parent / "office_toc_pass.py"
+OFFICE_SCRIPTS = (OFFICE_SCRIPT, OFFICE_SCRIPT.with_name("office_bridge.py"))
+
+
+def layout_key(doc):
+    """Template hash plus a digest of everything that moves the page breaks."""
+    digest = hashlib.sha256()
+    for script in OFFICE_SCRIPTS:
+        digest.update(script.read_bytes())
+    digest.update(etree.tostring(doc.element.body))
+    for section in doc.sections:
+        digest.update(etree.tostring(section.header._element))
+        digest.update(etree.tostring(section.footer._element))
+    return f"{template_key()}_{digest.hexdigest()[:16]}"
+
+
+def _map_path(key):
+    return CACHE_DIR / f"toc_pages_{key}.json"
+
+
+def cached_page_map(key):
+    try:
+        with open(_map_path(key), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def latest_page_map(key):
+    """The most recently measured page map of the same template, for any content."""
+    template = key.split("_")[0]
+    maps = sorted(CACHE_DIR.glob(f"toc_pages_{template}_*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for path in maps:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            continue
+    return None
+
+
+def estimate_page_map(doc, measured=None):
+    """
+    {heading text: page} without laying the document out. A heading
+    keeps its page from measured when listed there; otherwise it counts
+    the explicit page breaks before it. Pages never go backwards.
+    """
+    measured = measured or {}
+    headings = {id(p): text for _, text, p in toc_headings(doc)}
+    page_break = qn("w:br")
+    break_type = qn("w:type")
+
+    page_map = {}
+    page = 1
+    for p in doc.element.body.iterchildren(qn("w:p")):
+        text = headings.get(id(p))
+        if text is not None:
+            page = max(page, measured.get(text, page))
+            page_map.setdefault(text, page)
+        page += sum(1 for br in p.iter(page_break) if br.get(break_type) == "page")
+    return page_map
+
+
+def store_page_map(key, page_map):
+    path = _map_path(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(page_map, indent=2), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+    # Page maps measured against an older template are never read again
+    template = key.split("_")[0]
+    for stale in CACHE_DIR.glob("toc_pages_*.json"):
+        if not stale.name.startswith(f"toc_pages_{template}_"):
+            stale.unlink(missing_ok=True)
+
+# ============================================================
+# HEADLESS OFFICE PASS
+# ============================================================
+
+def measure_pages(doc, soffice):
+    """Save doc to a temp file and return {heading text: page} from LibreOffice."""
+    with tempfile.TemporaryDirectory(prefix="release_toc_") as tmp:
+        docx_path = Path(tmp) / "document.docx"
+        map_path = Path(tmp) / "pages.json"
+        doc.save(docx_path)
+
+        result = subprocess.run(
+            [office_python(soffice), str(OFFICE_SCRIPT), soffice, str(docx_path), str(map_path),
+             *TOC_LEVELS],
+            capture_output=True, text=True, timeout=OFFICE_TIMEOUT,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(" ".join((result.stderr or result.stdout).split()[-40:]))
+
+        with open(map_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+
+def request_field_update(doc):
+    """Have Word refresh all fields (and so the TOC) when the document opens."""
+    settings = doc.settings.element
+    if settings.find(qn("w:updateFields")) is None:
+        settings.append(parse_xml(f'<w:updateFields {nsdecls("w")} w:val="true"/>'))
+
+# ============================================================
+# ENTRY POINT
+# ============================================================
+
+def update_toc(doc, use_office=None):
+    """
+    Fill the TOC field of a fully rendered document. Page numbers come
+    from the cached page map, else from a headless LibreOffice pass
+    (use_office None: when an install is found; False: never), else
+    from an estimate that Word corrects on open. Returns the page map used.
+    """
+    fill_toc(doc)
+
+    key = layout_key(doc)
+    page_map = cached_page_map(key)
+
+    if page_map is None and use_office is not False:
+        soffice = find_office()
+        if soffice is None:
+            if use_office:
+                print("TOC: no LibreOffice found (set RELEASE_DOC_SOFFICE); page numbers are estimated")
+        else:
+            try:
+                page_map = measure_pages(doc, soffice)
+                store_page_map(key, page_map)
+            except (OSError, subprocess.SubprocessError, RuntimeError, ValueError) as e:
+                print(f"TOC: LibreOffice pass failed ({e}); page numbers are estimated")
+
+    headings = toc_headings(doc)
+    measured = page_map is not None and all(text in page_map for _, text, _ in headings)
+    if not measured:
+        page_map = estimate_page_map(doc, page_map or latest_page_map(key))
+        request_field_update(doc)
+
+    fill_toc(doc, page_map)
+    return page_map
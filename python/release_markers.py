@@ -0,0 +1,162 @@
+import argparse
+import json
+import os
+import re
+import sys
+
+from git_engine import (
+    DEFAULT_MARKER_REF, GitError, check_repository, git_dir, is_ancestor, missing_objects, resolve_ref,
+    scan_markers,
+)
+
+# ============================================================
+# RELEASE MARKER INDEX
+# ============================================================
+# Finding a release used to mean a "git log --grep" over the whole
+# history per lookup. The index keeps, per ref searched (HEAD unless
+# --ref says otherwise), every release marker found in that ref's
+# history, in the repository's .git folder, together with the commit
+# the ref pointed to. On the next lookup only the commits added since
+# are scanned; when the ref did not move, nothing is scanned at all.
+# A ref moved to a commit that does not contain the old one (reset,
+# rebase, other branch checked out as HEAD) is scanned again in full.
+#
+#   python release_markers.py lookup [--repo-path PATH] [--ref REF] RELEASE...
+#   python release_markers.py list [--repo-path PATH] [--ref REF]
+#
+# "lookup" prints RELEASE=<commit sha> per release found; "list" prints
+# every known release as JSON, oldest version first.
+
+INDEX_FILE = "release_markers.json"
+INDEX_VERSION = 3
+
+DEFAULT_REPO_PATH = os.environ.get("RELEASE_REPO_PATH", r"C:\Codebases\bnpp_csc_so_ST")
+
+
+def _index_path(repo_path):
+    return os.path.join(git_dir(repo_path), INDEX_FILE)
+
+
+def _load_index(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("version") == INDEX_VERSION:
+            return index
+    except (OSError, ValueError):
+        pass
+    return {"version": INDEX_VERSION, "refs": {}}
+
+
+def _save_index(path, index):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def _scan(repo_path, entry, tip):
+    """Add the markers of the commits reachable from tip but not from the entry's old tip."""
+    revisions = [tip] + ([f"^{entry['tip']}"] if entry["tip"] else [])
+
+    # Same rule as "git log -n 1": the first marker git lists wins. The
+    # new commits come after the indexed ones, so their markers replace them.
+    found = {}
+    for release, sha, commit_time in scan_markers(repo_path, revisions):
+        found.setdefault(release, {"commit": sha, "time": commit_time})
+    entry["markers"].update(found)
+    entry["tip"] = tip
+
+
+def update_index(repo_path, ref=DEFAULT_MARKER_REF, rebuild=False):
+    """Bring the index of ref's history up to date and return {release: {"commit", "time"}}."""
+    path = _index_path(repo_path)
+    index = _load_index(path)
+    tip = resolve_ref(repo_path, ref)
+
+    entry = index["refs"].get(ref)
+    if entry and not rebuild and entry["tip"] == tip:
+        return entry["markers"]
+
+    # Only a fast-forward can be scanned incrementally
+    if rebuild or not entry or not is_ancestor(repo_path, entry["tip"], tip):
+        entry = {"tip": None, "markers": {}}
+
+    _scan(repo_path, entry, tip)
+    index["refs"][ref] = entry
+    _save_index(path, index)
+    return entry["markers"]
+
+
+def lookup(repo_path, releases, ref=DEFAULT_MARKER_REF):
+    """{release: commit sha} for each of the releases that has a marker in ref's history."""
+    markers = update_index(repo_path, ref)
+    found = {r: markers[r]["commit"] for r in releases if r in markers}
+
+    # A marker commit can disappear (history rewrite + gc) while the ref looks unchanged
+    if missing_objects(repo_path, list(found.values())):
+        markers = update_index(repo_path, ref, rebuild=True)
+        found = {r: markers[r]["commit"] for r in releases if r in markers}
+    return found
+
+
+def version_key(release):
+    """Sort R26.0.9 before R26.0.10: digit runs compare as numbers."""
+    return [(0, int(part), "") if part.isdigit() else (1, 0, part) for part in re.findall(r"\d+|\D+", release)]
+
+
+def list_releases(repo_path, ref=DEFAULT_MARKER_REF):
+    """Every release marked in ref's history as {"release", "commit", "time"}, oldest version first."""
+    markers = update_index(repo_path, ref)
+    return [
+        {"release": release, "commit": markers[release]["commit"], "time": markers[release]["time"]}
+        for release in sorted(markers, key=version_key)
+    ]
+
+# ============================================================
+# ENTRY POINT
+# ============================================================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser()
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    lookup_parser = commands.add_parser("lookup", help="Print RELEASE=<commit sha> for each release")
+    lookup_parser.add_argument("releases", nargs="+")
+
+    commands.add_parser("list", help="Print every known release as JSON")
+
+    rebuild_parser = commands.add_parser("rebuild", help="Drop the index and scan the whole history again")
+
+    for command in (lookup_parser, commands.choices["list"], rebuild_parser):
+        command.add_argument("--repo-path", default=DEFAULT_REPO_PATH)
+        command.add_argument("--ref", default=DEFAULT_MARKER_REF, help="Branch or tag whose history is searched")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    try:
+        check_repository(args.repo_path)
+
+        if args.command == "lookup":
+            found = lookup(args.repo_path, args.releases, args.ref)
+            for release in args.releases:
+                if release in found:
+                    print(f"{release}={found[release]}")
+            missing = [r for r in args.releases if r not in found]
+            if missing:
+                print(f"ERROR: Release marker not found for: {', '.join(missing)}", file=sys.stderr)
+                sys.exit(1)
+
+        elif args.command == "list":
+            print(json.dumps(list_releases(args.repo_path, args.ref), indent=2))
+
+        else:
+            markers = update_index(args.repo_path, args.ref, rebuild=True)
+            print(f"Indexed {len(markers)} releases")
+
+    except GitError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
@@ -1,16 +1,27 @@
-import threading
 import os
-from fastapi import FastAPI, Body
-from fastapi.responses import JSONResponse, HTMLResponse, FileResponse
+import json
+import asyncio
+import subprocess
+from typing import Optional
+from fastapi import FastAPI, Body, Request, HTTPException
+from fastapi.responses import JSONResponse, HTMLResponse, FileResponse, StreamingResponse, Response
 from fastapi.staticfiles import StaticFiles
-from services.state_manager import init_state, get_state
+from services.state_manager import init_state, get_state, get_state_snapshot
 from services.pipeline_runner import run_step
+from services.event_bus import subscribe, unsubscribe, format_sse
+from services.log_tail import read_log_chunk
+from services import job_scheduler
+from services import pipeline_manager
+
+# Idle connections get a comment line this often so proxies keep them open
+SSE_KEEPALIVE_SECONDS = 15
 
 app = FastAPI()
 
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 init_state()
+job_scheduler.configure(run_step)
 
 @app.get("/", response_class=HTMLResponse)
 def dashboard():
@@ -23,22 +34,98 @@ def staas_page():
         return f.read()
 
 @app.get("/status")
-def status():
-    return JSONResponse(get_state())
+def status(request: Request):
+    etag, state = get_state_snapshot()
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    return JSONResponse(state, headers=headers)
+
+@app.get("/events")
+async def events(request: Request):
+
+    async def stream():
+        sub = subscribe()
+        try:
+            # Initial snapshot so a fresh page doesn't wait for a transition
+            yield format_sse("snapshot", get_state())
+
+            while not sub.closed:
+                if await request.is_disconnected():
+                    break
+                try:
+                    event, data = await sub.get(SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield format_sse(event, data)
+        finally:
+            unsubscribe(sub)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 @app.post("/run/{step_name}")
 def run_pipeline_step(step_name: str, inputs: dict = Body(default={})):
-    thread = threading.Thread(target=run_step, args=(step_name, inputs))
-    thread.start()
-    return {"message": f"{step_name} started"}
+    try:
+        job, coalesced = job_scheduler.submit(step_name, inputs)
+    except job_scheduler.QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+    if coalesced:
+        message = f"{step_name} already {job.status.lower()} as job {job.id}"
+    else:
+        message = f"{step_name} queued as job {job.id}"
+
+    return {"message": message, "coalesced": coalesced, **job.to_dict()}
+
+@app.post("/pipeline/run")
+def run_pipeline(step_inputs: dict = Body(...)):
+    """Body maps each step to run onto its inputs, e.g. {"commit": {...}, "report": {...}}."""
+    try:
+        run = pipeline_manager.run_full_pipeline(step_inputs)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return run.to_dict()
+
+@app.get("/pipeline/{run_id}")
+def get_pipeline_run(run_id: str):
+    run = pipeline_manager.get_run(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail=f"Pipeline run {run_id} not found")
+    return run.to_dict()
+
+@app.get("/jobs")
+def list_jobs():
+    return job_scheduler.list_jobs()
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: str):
+    job = job_scheduler.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job.to_dict()
+
+@app.post("/jobs/{job_id}/cancel")
+def cancel_job(job_id: str):
+    job = job_scheduler.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job.to_dict()
 
 @app.get("/logs/{step_name}")
-def get_logs(step_name: str):
+def get_logs(step_name: str, offset: Optional[int] = None, generation: Optional[int] = None):
     log_path = f"logs/{step_name}.log"
-    if not os.path.exists(log_path):
-        return {"logs": ""}
-    with open(log_path, "r", encoding="utf-8") as f:
-        return {"logs": f.read()}
+    # Without an offset the whole log comes back in one response, as it always did;
+    # the dashboard polls with ?offset= and gets capped chunks
+    if offset is None:
+        return read_log_chunk(log_path, step_name, 0, generation, limit=None)
+    return read_log_chunk(log_path, step_name, offset, generation)
 
 @app.get("/json-files")
 def get_json_files():
@@ -47,6 +134,21 @@ def get_json_files():
     files = [f for f in os.listdir(folder) if f.endswith(".json")]
     return files
 
+@app.get("/releases")
+def get_releases(repoPath: Optional[str] = None, ref: Optional[str] = None):
+    # Every release with a "build.properties -> <Release>" marker in the history
+    # of ref (default HEAD), from the repository's persistent marker index
+    BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
+    command = ["python", os.path.join(BASE_DIR, "python", "release_markers.py"), "list"]
+    if repoPath:
+        command += ["--repo-path", repoPath]
+    if ref:
+        command += ["--ref", ref]
+    result = subprocess.run(command, capture_output=True, text=True, encoding="utf-8")
+    if result.returncode != 0:
+        raise HTTPException(status_code=400, detail=result.stderr.strip() or "Release lookup failed")
+    return json.loads(result.stdout)
+
 @app.get("/download/{filename}")
 def download_file(filename: str):
     path = f"../python/release-report-generator/output/{filename}"
@@ -0,0 +1,73 @@
+import asyncio
+import json
+import threading
+
+# =========================================================
+# IN-PROCESS EVENT BUS
+# =========================================================
+# Pipeline steps run in worker threads, while the /events
+# endpoint is served from the asyncio event loop. Publishers
+# hand events to each subscriber's loop thread-safely, so an
+# idle dashboard costs nothing until something happens.
+
+_subscribers = set()
+_lock = threading.Lock()
+
+# Per-subscriber backlog. A browser that stops reading is dropped
+# instead of letting its queue grow without bound.
+MAX_QUEUE_SIZE = 1000
+
+
+class Subscription:
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=MAX_QUEUE_SIZE)
+        self.closed = False
+
+    def _put(self, event):
+        if self.closed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.closed = True
+
+    async def get(self, timeout):
+        return await asyncio.wait_for(self.queue.get(), timeout)
+
+
+def subscribe():
+    """Register a subscriber bound to the running event loop."""
+    sub = Subscription(asyncio.get_running_loop())
+    with _lock:
+        _subscribers.add(sub)
+    return sub
+
+
+def unsubscribe(sub):
+    sub.closed = True
+    with _lock:
+        _subscribers.discard(sub)
+
+
+def publish(event, data):
+    """Broadcast an event to every subscriber. Safe to call from any thread."""
+    message = (event, data)
+
+    with _lock:
+        subscribers = list(_subscribers)
+
+    for sub in subscribers:
+        if sub.closed:
+            unsubscribe(sub)
+            continue
+        try:
+            sub.loop.call_soon_threadsafe(sub._put, message)
+        except RuntimeError:
+            # Event loop already shut down
+            unsubscribe(sub)
+
+
+def format_sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
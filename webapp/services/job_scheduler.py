@@ -0,0 +1,311 @@
+import itertools
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from services.state_manager import update_step_status
+
+# =========================================================
+# CONCURRENCY LIMITS
+# =========================================================
+# Upper bound on steps running at once across the whole host
+MAX_WORKERS = int(os.environ.get("RELEASE_MAX_WORKERS", "4"))
+
+# Per step type. Steps not listed here run one at a time, since most
+# of them share a repository checkout or output folder.
+STEP_CONCURRENCY = {
+    "security": 1,
+    "staas": 1,
+    "staas-status": 2,
+    "staas-download": 2,
+}
+DEFAULT_STEP_CONCURRENCY = 1
+
+# Queued jobs beyond this are rejected instead of piling up
+MAX_PENDING = 50
+
+# Finished jobs kept around for /jobs lookups
+MAX_FINISHED_JOBS = 200
+
+# Input keys that identify the release a step runs for, in priority order
+RELEASE_KEYS = (
+    "releaseVersion",
+    "ReleaseVersion",
+    "TargetVersion",
+    "targetRelease",
+    "RemoteReleaseVersion",
+    "release",
+    "scanId",
+)
+
+# Input keys naming the folders / documents a step works on. With the
+# release they tell duplicates apart: two pdf exports of different
+# report folders are different jobs even with no release given.
+TARGET_KEYS = (
+    "outputDir",
+    "baseDir",
+    "manifest",
+    "documents",
+)
+
+QUEUED = "QUEUED"
+RUNNING = "RUNNING"
+CANCELLED = "CANCELLED"
+ACTIVE_STATES = (QUEUED, RUNNING)
+
+
+class QueueFullError(Exception):
+    pass
+
+
+class Job:
+
+    def __init__(self, job_id, step, inputs):
+        self.id = job_id
+        self.step = step
+        self.inputs = inputs
+        self.release = release_key(inputs)
+        self.key = job_key(inputs)
+        self.status = QUEUED
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.cancel_requested = False
+        self.outputs = {}
+        self._cancel_handler = None
+        self._callbacks = []
+
+    def add_done_callback(self, fn):
+        """Call fn(job) once the job finishes (immediately if it already has)."""
+        with _lock:
+            if self.status in ACTIVE_STATES:
+                self._callbacks.append(fn)
+                return
+        fn(self)
+
+    def to_dict(self):
+        return {
+            "jobId": self.id,
+            "step": self.step,
+            "release": self.release,
+            "status": self.status,
+            "created": self.created,
+            "started": self.started,
+            "finished": self.finished,
+            "outputs": self.outputs,
+        }
+
+
+def release_key(inputs):
+    for key in RELEASE_KEYS:
+        value = inputs.get(key)
+        if value:
+            return str(value)
+    return ""
+
+
+def job_key(inputs):
+    """What makes two submissions of the same step the same job."""
+    targets = []
+    for key in TARGET_KEYS:
+        value = inputs.get(key) or ""
+        if isinstance(value, (list, tuple)):
+            value = tuple(sorted(str(v) for v in value))
+        targets.append(value if isinstance(value, tuple) else str(value))
+    return (release_key(inputs), *targets)
+
+
+_jobs = OrderedDict()
+_pending = []
+_running = {}
+_lock = threading.Lock()
+_ids = itertools.count(1)
+_local = threading.local()
+_runner = None
+
+
+def configure(runner):
+    """
+    Set the callable that executes a step: runner(step_name, inputs),
+    returning (status, outputs) of that run.
+    """
+    global _runner
+    _runner = runner
+
+
+# =========================================================
+# CANCELLATION HOOK FOR RUNNING STEPS
+# =========================================================
+
+def set_cancel_handler(handler):
+    """
+    Called from inside a running step with something that stops it
+    (process.kill, ssh_client.close...). No-op outside a scheduled job.
+    """
+    job = getattr(_local, "job", None)
+    if job is None:
+        return
+
+    with _lock:
+        job._cancel_handler = handler
+        cancel_now = job.cancel_requested
+
+    if cancel_now:
+        handler()
+
+
+def is_cancelled():
+    job = getattr(_local, "job", None)
+    return job is not None and job.cancel_requested
+
+
+# =========================================================
+# SUBMIT / QUERY / CANCEL
+# =========================================================
+
+def submit(step, inputs):
+    """
+    Queue a step. Returns (job, coalesced): when the same step is
+    already queued or running for the same release and targets, that
+    job is returned instead of starting a duplicate.
+    """
+    key = job_key(inputs)
+
+    with _lock:
+        for job in _jobs.values():
+            if job.step == step and job.key == key and job.status in ACTIVE_STATES:
+                return job, True
+
+        if len(_pending) >= MAX_PENDING:
+            raise QueueFullError(f"Job queue is full ({MAX_PENDING} pending)")
+
+        job = Job(str(next(_ids)), step, inputs)
+        _jobs[job.id] = job
+        _pending.append(job)
+        _trim_finished()
+        # Don't mask the status of a run of the same step already in progress
+        announce = _running.get(step, 0) == 0
+
+    if announce:
+        update_step_status(step, QUEUED)
+    _dispatch()
+    return job, False
+
+
+def get_job(job_id):
+    with _lock:
+        return _jobs.get(job_id)
+
+
+def list_jobs():
+    with _lock:
+        return [job.to_dict() for job in _jobs.values()]
+
+
+def cancel(job_id):
+    with _lock:
+        job = _jobs.get(job_id)
+        if job is None or job.status not in ACTIVE_STATES:
+            return job
+
+        job.cancel_requested = True
+
+        if job.status == QUEUED:
+            _pending.remove(job)
+            job.status = CANCELLED
+            job.finished = time.time()
+            handler = None
+            callbacks, job._callbacks = job._callbacks, []
+            # The step status belongs to another run of the step, if any
+            announce = not _step_active(job.step)
+        else:
+            handler = job._cancel_handler
+            callbacks = []
+
+    if job.status == CANCELLED:
+        if announce:
+            update_step_status(job.step, CANCELLED)
+        for fn in callbacks:
+            fn(job)
+    elif handler is not None:
+        handler()
+
+    return job
+
+
+# =========================================================
+# DISPATCH
+# =========================================================
+
+def _step_active(step):
+    """Whether a job of step is running or queued. Call with _lock held."""
+    return _running.get(step, 0) > 0 or any(job.step == step for job in _pending)
+
+
+def _limit_for(step):
+    return STEP_CONCURRENCY.get(step, DEFAULT_STEP_CONCURRENCY)
+
+
+def _dispatch():
+    to_start = []
+
+    with _lock:
+        slots = MAX_WORKERS - sum(_running.values())
+
+        for job in list(_pending):
+            if slots <= 0:
+                break
+            if _running.get(job.step, 0) >= _limit_for(job.step):
+                continue
+
+            _pending.remove(job)
+            _running[job.step] = _running.get(job.step, 0) + 1
+            job.status = RUNNING
+            job.started = time.time()
+            slots -= 1
+            to_start.append(job)
+
+    for job in to_start:
+        threading.Thread(target=_run_job, args=(job,), name=f"job-{job.id}-{job.step}", daemon=True).start()
+
+
+def _run_job(job):
+    _local.job = job
+    outputs = None
+    # This run's own result: the shared step status may already belong
+    # to another job of the same step running alongside
+    try:
+        status, outputs = _runner(job.step, job.inputs)
+    except Exception:
+        status = "FAILED"
+        update_step_status(job.step, status)
+    finally:
+        _local.job = None
+
+    # A cancel that arrives after the run succeeded changes nothing
+    if job.cancel_requested and status != "SUCCESS":
+        status = CANCELLED
+
+    with _lock:
+        job.status = status
+        job.outputs = outputs or {}
+        job.finished = time.time()
+        job._cancel_handler = None
+        _running[job.step] -= 1
+        announce = status == CANCELLED and not _step_active(job.step)
+        callbacks, job._callbacks = job._callbacks, []
+
+    if announce:
+        update_step_status(job.step, CANCELLED)
+
+    for fn in callbacks:
+        fn(job)
+
+    _dispatch()
+
+
+def _trim_finished():
+    finished = [jid for jid, job in _jobs.items() if job.status not in ACTIVE_STATES]
+    for jid in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+        del _jobs[jid]
@@ -0,0 +1,76 @@
+import os
+import threading
+
+# Upper bound on bytes returned per /logs?offset= call; clients ask again while
+# "more" is set. /logs without an offset returns the whole file.
+MAX_CHUNK_BYTES = 1024 * 1024
+
+# Bumped every time a step log is truncated and rewritten ("w" mode),
+# so clients holding an offset into the previous contents can tell.
+_generations = {}
+_lock = threading.Lock()
+
+
+def bump_generation(name):
+    with _lock:
+        _generations[name] = _generations.get(name, 0) + 1
+        return _generations[name]
+
+
+def get_generation(name):
+    with _lock:
+        return _generations.get(name, 0)
+
+
+def _complete_utf8(data):
+    """Drop a trailing partial UTF-8 sequence so it's sent whole next time."""
+    for cut in range(0, min(4, len(data) + 1)):
+        try:
+            end = len(data) - cut
+            return data[:end].decode("utf-8"), end
+        except UnicodeDecodeError:
+            continue
+    return data.decode("utf-8", errors="replace"), len(data)
+
+
+def read_log_chunk(log_path, name, offset=0, generation=None, limit=MAX_CHUNK_BYTES):
+    """
+    Return log text written after ``offset``, at most ``limit`` bytes
+    (None: everything).
+
+    ``reset`` tells the client to discard what it has: the file was
+    rewritten since its last read (generation changed) or truncated
+    below its offset.
+    """
+    current_generation = get_generation(name)
+    reset = generation is not None and generation != current_generation
+
+    if not os.path.exists(log_path):
+        return {
+            "logs": "",
+            "offset": 0,
+            "generation": current_generation,
+            "reset": reset or offset > 0,
+            "more": False,
+        }
+
+    size = os.path.getsize(log_path)
+
+    if reset or offset > size or offset < 0:
+        reset = True
+        offset = 0
+
+    with open(log_path, "rb") as f:
+        f.seek(offset)
+        data = f.read(limit)
+
+    text, consumed = _complete_utf8(data)
+    new_offset = offset + consumed
+
+    return {
+        "logs": text,
+        "offset": new_offset,
+        "generation": current_generation,
+        "reset": reset,
+        "more": new_offset < size,
+    }
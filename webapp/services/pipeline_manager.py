@@ -1,23 +1,289 @@
+import itertools
+import json
+import os
 import threading
-from services.executor import run_powershell
-from services.state_manager import update_state
+import time
 
-def run_full_pipeline(release, app):
+from services import job_scheduler
 
-    def target():
-        update_state("RUNNING")
+EXECUTION_STATE_FILE = "execution_state.json"
 
-        process = run_powershell(
-            "../run_release.ps1",
-            ["-RemoteReleaseVersion", release, "-RemoteAppName", app]
-        )
+# =========================================================
+# STEP GRAPH
+# =========================================================
+# step -> steps whose outputs it needs. Steps with no pending
+# dependencies are submitted together and run concurrently,
+# subject to the job scheduler's limits.
 
-        process.wait()
+STEP_GRAPH = {
+    "angular": [],
+    "incrementals": [],
+    "commit": [],
+    "security": [],
+    "staas": [],
+    "report": ["commit"],
+    "pdf": ["report"],
+    "zip": ["incrementals", "report", "security"],
+    "email": ["zip"],
+}
 
-        if process.returncode == 0:
-            update_state("COMPLETED")
-        else:
-            update_state("FAILED")
 
-    thread = threading.Thread(target=target)
-    thread.start()
+def _release_parent(outputs):
+    release_root = outputs.get("incrementals", {}).get("RELEASE_ROOT")
+    return os.path.dirname(release_root) if release_root else None
+
+
+def _report_json(inputs):
+    commit = inputs.get("commit", {})
+    if commit.get("jiraRef") and commit.get("appName"):
+        return f"{commit['jiraRef']}_{commit['appName']}_DeploymentDetails.json"
+    return None
+
+
+def _report_documents(outputs, inputs):
+    # A single report names its document; after a batch, export the whole folder
+    if inputs.get("report", {}).get("manifest"):
+        return None
+    return outputs.get("report", {}).get("DOCUMENT")
+
+
+# Inputs a step can take from earlier steps when the caller didn't set them:
+# step -> {input name: fn(outputs by step, inputs by step)}
+INPUT_BINDINGS = {
+    "report": {
+        "jsonFile": lambda outputs, inputs: _report_json(inputs),
+    },
+    "pdf": {
+        "outputDir": lambda outputs, inputs: inputs.get("report", {}).get("outputDir"),
+        "documents": _report_documents,
+    },
+    "zip": {
+        "baseDir": lambda outputs, inputs: _release_parent(outputs),
+    },
+    "email": {
+        "baseFolder": lambda outputs, inputs: (
+            inputs.get("zip", {}).get("baseDir") or _release_parent(outputs)
+        ),
+    },
+}
+
+
+def resolve_order(steps):
+    """Topologically sort the selected steps; dependencies outside the selection are ignored."""
+    selected = set(steps)
+    order = []
+    visiting = set()
+    done = set()
+
+    def visit(step):
+        if step in done:
+            return
+        if step in visiting:
+            raise ValueError(f"Dependency cycle at step: {step}")
+        visiting.add(step)
+        for dep in STEP_GRAPH.get(step, []):
+            if dep in selected:
+                visit(dep)
+        visiting.discard(step)
+        done.add(step)
+        order.append(step)
+
+    for step in steps:
+        if step not in STEP_GRAPH:
+            raise ValueError(f"Unknown pipeline step: {step}")
+        visit(step)
+
+    return order
+
+
+# =========================================================
+# PIPELINE RUN
+# =========================================================
+
+class PipelineRun:
+
+    def __init__(self, run_id, step_inputs):
+        self.id = run_id
+        self.inputs = {step: dict(values or {}) for step, values in step_inputs.items()}
+        self.order = resolve_order(list(self.inputs))
+        self.deps = {
+            step: [d for d in STEP_GRAPH[step] if d in self.inputs]
+            for step in self.order
+        }
+        self.status = "RUNNING"
+        self.step_status = {step: "PENDING" for step in self.order}
+        self.outputs = {}
+        self.jobs = {}
+        self.started = time.time()
+        self.finished = None
+        self.timings = {}
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+
+    # -----------------------------------------------------
+    # Scheduling
+    # -----------------------------------------------------
+
+    def start(self):
+        _write_execution_state(self.status)
+        self._advance()
+
+    def wait(self, timeout=None):
+        return self._done.wait(timeout)
+
+    def _ready_steps(self):
+        ready = []
+        for step in self.order:
+            if self.step_status[step] != "PENDING":
+                continue
+            dep_states = [self.step_status[d] for d in self.deps[step]]
+            if any(s in ("FAILED", "CANCELLED", "SKIPPED") for s in dep_states):
+                self.step_status[step] = "SKIPPED"
+                continue
+            if all(s == "SUCCESS" for s in dep_states):
+                ready.append(step)
+        return ready
+
+    def _bind_inputs(self, step):
+        inputs = self.inputs[step]
+        for name, resolve in INPUT_BINDINGS.get(step, {}).items():
+            if not inputs.get(name):
+                value = resolve(self.outputs, self.inputs)
+                if value:
+                    inputs[name] = value
+        return inputs
+
+    def _advance(self):
+        with self._lock:
+            # self.order is topological, so skips propagate in one pass
+            ready = self._ready_steps()
+
+            to_submit = []
+            for step in ready:
+                self.step_status[step] = "RUNNING"
+                self.timings[step] = {"queued": time.time()}
+                to_submit.append((step, self._bind_inputs(step)))
+
+            finished = all(
+                s not in ("PENDING", "RUNNING") for s in self.step_status.values()
+            )
+
+        for step, inputs in to_submit:
+            try:
+                job, _ = job_scheduler.submit(step, inputs)
+            except job_scheduler.QueueFullError:
+                self._on_step_done(step, None)
+                continue
+            with self._lock:
+                self.jobs[step] = job.id
+            job.add_done_callback(lambda job, step=step: self._on_step_done(step, job))
+
+        if finished and not to_submit:
+            self._finish()
+
+    def _on_step_done(self, step, job):
+        with self._lock:
+            timing = self.timings[step]
+            if job is not None:
+                timing["started"] = job.started or timing["queued"]
+                timing["finished"] = job.finished or time.time()
+                self.outputs[step] = job.outputs
+                self.step_status[step] = job.status if job.status == "SUCCESS" else (
+                    "CANCELLED" if job.status == "CANCELLED" else "FAILED"
+                )
+            else:
+                timing["started"] = timing["finished"] = time.time()
+                self.step_status[step] = "FAILED"
+
+        self._advance()
+
+    def _finish(self):
+        with self._lock:
+            if self._done.is_set():
+                return
+            ok = all(s == "SUCCESS" for s in self.step_status.values())
+            self.status = "COMPLETED" if ok else "FAILED"
+            self.finished = time.time()
+            self._done.set()
+        _write_execution_state(self.status)
+
+    # -----------------------------------------------------
+    # Reporting
+    # -----------------------------------------------------
+
+    def critical_path(self):
+        """
+        Walk back from the last step to finish, following at each step
+        the dependency that finished last - the chain that bounded
+        end-to-end wall-clock time.
+        """
+        finished = {s: t["finished"] for s, t in self.timings.items() if "finished" in t}
+        if not finished:
+            return []
+
+        path = []
+        step = max(finished, key=finished.get)
+        while step is not None:
+            path.append(step)
+            deps = [d for d in self.deps[step] if d in finished]
+            step = max(deps, key=finished.get) if deps else None
+
+        return list(reversed(path))
+
+    def to_dict(self):
+        with self._lock:
+            steps = {}
+            for step in self.order:
+                t = self.timings.get(step, {})
+                started, ended = t.get("started"), t.get("finished")
+                steps[step] = {
+                    "status": self.step_status[step],
+                    "dependsOn": self.deps[step],
+                    "jobId": self.jobs.get(step),
+                    "startOffset": round(started - self.started, 3) if started else None,
+                    "duration": round(ended - started, 3) if started and ended else None,
+                    "outputs": self.outputs.get(step, {}),
+                }
+            end = self.finished or time.time()
+            status = self.status
+
+        path = self.critical_path()
+        path_time = sum(steps[s]["duration"] or 0 for s in path)
+        serial_time = sum(s["duration"] or 0 for s in steps.values())
+
+        return {
+            "runId": self.id,
+            "status": status,
+            "elapsed": round(end - self.started, 3),
+            "steps": steps,
+            "criticalPath": path,
+            "criticalPathTime": round(path_time, 3),
+            "serialTime": round(serial_time, 3),
+        }
+
+
+def _write_execution_state(status):
+    with open(EXECUTION_STATE_FILE, "w") as f:
+        json.dump({"status": status}, f)
+
+
+_runs = {}
+_run_ids = itertools.count(1)
+_runs_lock = threading.Lock()
+
+
+def run_full_pipeline(step_inputs):
+    """
+    Start a pipeline run over the steps present in ``step_inputs``
+    ({step: inputs}) and return it without waiting for completion.
+    """
+    run = PipelineRun(str(next(_run_ids)), step_inputs)
+    with _runs_lock:
+        _runs[run.id] = run
+    run.start()
+    return run
+
+
+def get_run(run_id):
+    with _runs_lock:
+        return _runs.get(run_id)
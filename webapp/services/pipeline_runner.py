@@ -1,6 +1,14 @@
 import subprocess
 import os
+import re
+import threading
+from collections import namedtuple
 from services.state_manager import update_step_status
+from services.event_bus import publish
+from services.log_tail import bump_generation, get_generation
+from services.job_scheduler import set_cancel_handler
+from services.ssh_pool import pool as ssh_pool, MAX_CHANNELS_PER_CONNECTION
+from services.sftp_sync import sync_tree, DEFAULT_WORKERS as SFTP_DOWNLOAD_WORKERS
 
 LOG_DIR = "logs"
 os.makedirs(LOG_DIR, exist_ok=True)
@@ -8,13 +16,89 @@ os.makedirs(LOG_DIR, exist_ok=True)
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
 BASE_SCRIPT = os.path.join(BASE_DIR, "run_release.ps1")
 
+REMOTE_HOST = "100.76.144.249"
+
+# Scripts announce values for later steps as KEY=VALUE lines (e.g. RELEASE_ROOT=...)
+OUTPUT_LINE = re.compile(r"^([A-Z][A-Z0-9_]*)=(.+)$")
+# generate_release_doc.py prints SUCCESS::<document name>
+DOCUMENT_LINE = re.compile(r"^SUCCESS::(.+)$")
+
+
+StepResult = namedtuple("StepResult", "status outputs")
+
+FINAL_STATES = ("SUCCESS", "FAILED", "CANCELLED")
+
 
 def safe(value):
     """Ensure subprocess never receives None."""
     return value if value is not None else ""
 
 
+class StepLog:
+    """
+    Log file writer that also pushes every chunk to /events
+    subscribers, so dashboards get new lines without polling.
+    """
+
+    def __init__(self, log_file, mode="w"):
+        self.name = os.path.splitext(os.path.basename(log_file))[0]
+        self._file = open(log_file, mode, encoding="utf-8", newline="")
+        self.generation = bump_generation(self.name) if mode == "w" else get_generation(self.name)
+        # Byte offset of the end of the file, matching /logs?offset=N
+        self.offset = self._file.tell()
+
+    def write(self, text):
+        self._file.write(text)
+        self.offset += len(text.encode("utf-8"))
+        publish("log", {
+            "step": self.name,
+            "text": text,
+            "offset": self.offset,
+            "generation": self.generation,
+        })
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_step_log(log_file, mode="w"):
+    log = StepLog(log_file, mode)
+    if mode == "w":
+        publish("log-reset", {"step": log.name, "generation": log.generation})
+    return log
+
+
 def run_step(step_name, inputs=None):
+    """
+    Run one pipeline step. Returns StepResult(status, outputs): the
+    status this run ended with (not the shared per-step state, which a
+    concurrent run of the same step may have overwritten since) and the
+    KEY=VALUE outputs the step printed, for steps that run a local script.
+    """
+    outcome = {}
+
+    def set_status(status):
+        outcome["status"] = status
+        update_step_status(step_name, status)
+
+    outputs = _run_step(step_name, inputs or {}, set_status)
+
+    status = outcome.get("status", "FAILED")
+    if status not in FINAL_STATES:
+        status = "FAILED"
+    return StepResult(status, outputs or {})
+
+
+def _run_step(step_name, inputs, set_status):
 
     base_release = safe(inputs.get("baseRelease"))
     target_release = safe(inputs.get("targetRelease"))
@@ -24,7 +108,7 @@ def run_step(step_name, inputs=None):
     if inputs is None:
         inputs = {}
 
-    update_step_status(step_name, "RUNNING")
+    set_status("RUNNING")
 
     if step_name.startswith("staas"):
         log_file = os.path.join(LOG_DIR, "staas.log")
@@ -61,47 +145,61 @@ def run_step(step_name, inputs=None):
         if not output_folder:
             output_folder = f".\\release_{target_release}"
 
+        # Python git engine: per repository one marker lookup, one diff, blobs from the object database
         command = [
-            "powershell",
-            "-ExecutionPolicy", "Bypass",
-            "-File", BASE_SCRIPT,
-            "-Step", "incrementals",
-            "-RepoPath", safe(inputs.get("RepoPath")),
-            "-AppName", safe(inputs.get("AppName")),
-            "-BaseRelease", safe(inputs.get("BaseVersion")),
-            "-TargetRelease", target_release,
-            "-OutputFolder", output_folder,
-            "-JiraRef", safe(inputs.get("JiraRef")),
+            "python",
+            os.path.join(BASE_DIR, "python", "generate_incrementals.py"),
+            "--base-release", safe(inputs.get("BaseVersion")),
+            "--target-release", target_release,
+            "--output-folder", output_folder,
+            "--jira-ref", safe(inputs.get("JiraRef")),
         ]
 
+        # Unset: the same defaults as run_release.ps1. Several repositories: "A;B" or "NAME=PATH;..."
+        if inputs.get("RepoPath"):
+            command += ["--repo-path", inputs["RepoPath"]]
+        if inputs.get("AppName"):
+            command += ["--app-name", inputs["AppName"]]
+
     # =========================================================
     # COMMIT SUMMARY
     # =========================================================
     elif step_name == "commit":
 
-        output_folder = inputs.get("OutputFolder")
-
-        if not output_folder:
-            output_folder = f".\\release_{target_release}"
-
+        # Python port of Generate-CommitSummary.ps1; several repositories run in parallel
         command = [
-            "powershell",
-            "-ExecutionPolicy", "Bypass",
-            "-File", BASE_SCRIPT,
-            "-Step", "commit",
-            "-RepoPath", safe(inputs.get("repoPath")),
-            "-BaseRelease", safe(inputs.get("baseRelease")),
-            "-TargetRelease", safe(inputs.get("targetRelease")),
-            "-OutputFolder", output_folder,
-            "-JiraRef", safe(inputs.get("jiraRef")),
-            "-AppName", safe(inputs.get("appName")),
-            "-AppVariant", safe(inputs.get("appVariant")),
+            "python",
+            os.path.join(BASE_DIR, "python", "generate_commit_summary.py"),
+            "--base-release", safe(inputs.get("baseRelease")),
+            "--target-release", safe(inputs.get("targetRelease")),
+            "--jira-ref", safe(inputs.get("jiraRef")),
         ]
 
+        # Unset: the same defaults as run_release.ps1
+        if inputs.get("repoPath"):
+            command += ["--repo-path", inputs["repoPath"]]
+        if inputs.get("appName"):
+            command += ["--app-name", inputs["appName"]]
+        if inputs.get("appVariant"):
+            command += ["--app-variant", inputs["appVariant"]]
+
 
     # =========================================================
     # RELEASE REPORT
     # =========================================================
+    elif step_name == "report" and inputs.get("manifest"):
+
+        # Many documents in one warm process
+        command = [
+            "python",
+            os.path.join(BASE_DIR, "python", "release-report-generator", "generate_release_doc.py"),
+            "--batch", safe(inputs.get("manifest")),
+            "--workers", str(inputs.get("workers") or 1),
+        ]
+
+        if inputs.get("outputDir"):
+            command += ["--output-dir", inputs["outputDir"]]
+
     elif step_name == "report":
 
         command = [
@@ -115,6 +213,34 @@ def run_step(step_name, inputs=None):
             "--date", safe(inputs.get("versionDate")),
         ]
 
+        if inputs.get("outputDir"):
+            command += ["--output-dir", inputs["outputDir"]]
+
+
+    # =========================================================
+    # PDF EXPORT
+    # =========================================================
+    elif step_name == "pdf":
+
+        # Warm LibreOffice workers; documents whose PDF is current are skipped
+        command = [
+            "python",
+            os.path.join(BASE_DIR, "python", "release-report-generator", "export_pdf.py"),
+        ]
+
+        if inputs.get("workers"):
+            command += ["--workers", str(inputs["workers"])]
+        if inputs.get("timeout"):
+            command += ["--timeout", str(inputs["timeout"])]
+        if inputs.get("outputDir"):
+            command += ["--output-dir", inputs["outputDir"]]
+
+        # None given: every document in the report folder
+        documents = inputs.get("documents") or []
+        if isinstance(documents, str):
+            documents = [documents]
+        command += ["--", *documents]
+
 
     # =========================================================
     # ZIP + PGP
@@ -125,15 +251,15 @@ def run_step(step_name, inputs=None):
         base_dir = safe(inputs.get("baseDir"))
 
         if not release_version or not base_dir:
-            with open(log_file, "w", encoding="utf-8") as log:
+            with open_step_log(log_file, "w") as log:
                 log.write("Missing releaseVersion or baseDir input.\n")
-            update_step_status(step_name, "FAILED")
+            set_status("FAILED")
             return
 
         if not os.path.exists(base_dir):
-            with open(log_file, "w", encoding="utf-8") as log:
+            with open_step_log(log_file, "w") as log:
                 log.write(f"Base directory not found: {base_dir}\n")
-            update_step_status(step_name, "FAILED")
+            set_status("FAILED")
             return
 
         command = [
@@ -143,6 +269,10 @@ def run_step(step_name, inputs=None):
             base_dir,
         ]
 
+        compression = safe(inputs.get("compression"))
+        if compression:
+            command += ["--compression", compression]
+
     # =========================================================
     # EMAIL GENERATION
     # =========================================================
@@ -163,9 +293,9 @@ def run_step(step_name, inputs=None):
             sign_off_name,
             output_dir
         ]):
-            with open(log_file, "w", encoding="utf-8") as log:
+            with open_step_log(log_file, "w") as log:
                 log.write("Missing required email inputs.\n")
-            update_step_status(step_name, "FAILED")
+            set_status("FAILED")
             return
 
         command = [
@@ -184,16 +314,15 @@ def run_step(step_name, inputs=None):
     # =========================================================
     elif step_name == "security":
 
-        import paramiko
-        from scp import SCPClient
-
-        host = "100.76.144.249"
         username = safe(inputs.get("username"))
         password = safe(inputs.get("password"))
         app = safe(inputs.get("RemoteAppName"))
         release = safe(inputs.get("RemoteReleaseVersion"))
         variant = safe(inputs.get("AppVariant"))
         release_id = safe(inputs.get("ReleaseId"))
+        # The command, the listing SFTP and sha256sum take 2 of the lease's channels
+        download_workers = int(inputs.get("downloadWorkers") or SFTP_DOWNLOAD_WORKERS)
+        download_workers = max(1, min(download_workers, MAX_CHANNELS_PER_CONNECTION - 2))
 
         remote_report_path = f"/scratch/softwares_2/Report-output/{app}_{release.replace('.', '_')}_{variant.upper()}"
         local_report_path = os.path.join(BASE_DIR, "Report-output")
@@ -202,38 +331,49 @@ def run_step(step_name, inputs=None):
 
         remote_command = f"/scratch/softwares_2/run_oscs_sonar_generic.sh {app} {release} {variant} {release_id}"
 
-        with open(log_file, "w", encoding="utf-8") as log:
+        with open_step_log(log_file, "w") as log:
             try:
                 log.write("Connecting to server...\n")
                 log.flush()
 
-                client = paramiko.SSHClient()
-                client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-                client.connect(hostname=host, username=username, password=password)
+                with ssh_pool.session(REMOTE_HOST, username, password, channels=download_workers + 2) as client:
+                    log.write("Connected successfully.\n")
+                    log.flush()
 
-                log.write("Connected successfully.\n")
-                log.flush()
+                    stdin, stdout, stderr = client.exec_command(remote_command, get_pty=True)
+                    set_cancel_handler(stdout.channel.close)
 
-                stdin, stdout, stderr = client.exec_command(remote_command, get_pty=True)
+                    for line in iter(stdout.readline, ""):
+                        log.write(line)
+                        log.flush()
 
-                for line in iter(stdout.readline, ""):
-                    log.write(line)
+                    log.write("\nDownloading reports...\n")
                     log.flush()
 
-                log.write("\nDownloading reports...\n")
-                log.flush()
+                    # The command channel is done; a cancel now has to stop the download
+                    stop_download = threading.Event()
+                    set_cancel_handler(stop_download.set)
 
-                scp = SCPClient(client.get_transport())
-                scp.get(remote_report_path, local_path=local_report_path, recursive=True)
+                    summary = sync_tree(
+                        client,
+                        remote_report_path,
+                        os.path.join(local_report_path, os.path.basename(remote_report_path)),
+                        workers=download_workers,
+                        log=log,
+                        stop=stop_download,
+                    )
 
-                scp.close()
-                client.close()
+                    log.write(
+                        f"Reports synced: {summary['downloaded']} downloaded "
+                        f"({summary['resumed']} resumed, {summary['bytes']} bytes), "
+                        f"{summary['skipped']} unchanged.\n"
+                    )
 
-                update_step_status(step_name, "SUCCESS")
+                set_status("SUCCESS")
 
             except Exception as e:
                 log.write(f"\nERROR: {str(e)}\n")
-                update_step_status(step_name, "FAILED")
+                set_status("FAILED")
 
         return
 
@@ -242,9 +382,6 @@ def run_step(step_name, inputs=None):
     # =========================================================
     elif step_name == "staas":
 
-        import paramiko
-
-        host = "100.76.144.249"
         username = safe(inputs.get("username"))
         password = safe(inputs.get("password"))
 
@@ -272,38 +409,32 @@ def run_step(step_name, inputs=None):
         )
 
 
-        with open(log_file, "a", encoding="utf-8") as log:
+        with open_step_log(log_file, "a") as log:
             try:
                 log.write("Connecting to server...\n")
                 log.flush()
 
-                client = paramiko.SSHClient()
-                client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-                client.connect(hostname=host, username=username, password=password)
-
-                log.write("Connected successfully.\n")
-                log.flush()
+                with ssh_pool.session(REMOTE_HOST, username, password) as client:
+                    log.write("Connected successfully.\n")
+                    log.flush()
 
-                stdin, stdout, stderr = client.exec_command(remote_command, get_pty=True)
+                    stdin, stdout, stderr = client.exec_command(remote_command, get_pty=True)
+                    set_cancel_handler(stdout.channel.close)
 
-                for line in iter(stdout.readline, ""):
-                    log.write(line)
-                    log.flush()
+                    for line in iter(stdout.readline, ""):
+                        log.write(line)
+                        log.flush()
 
-                client.close()
-                update_step_status(step_name, "SUCCESS")
+                set_status("SUCCESS")
 
             except Exception as e:
                 log.write(f"\nERROR: {str(e)}\n")
-                update_step_status(step_name, "FAILED")
+                set_status("FAILED")
 
         return
     
     elif step_name == "staas-status":
 
-        import paramiko
-
-        host = "100.76.144.249"
         username = safe(inputs.get("username"))
         password = safe(inputs.get("password"))
         scanId = safe(inputs.get("scanId"))
@@ -313,33 +444,28 @@ def run_step(step_name, inputs=None):
             f"./staas_status.sh \"{scanId}\""
         )
 
-        with open(log_file, "a", encoding="utf-8") as log:
+        with open_step_log(log_file, "a") as log:
             try:
-                client = paramiko.SSHClient()
-                client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-                client.connect(hostname=host, username=username, password=password)
+                with ssh_pool.session(REMOTE_HOST, username, password) as client:
+                    stdin, stdout, stderr = client.exec_command(remote_command, get_pty=True)
+                    set_cancel_handler(stdout.channel.close)
 
-                stdin, stdout, stderr = client.exec_command(remote_command, get_pty=True)
+                    for line in iter(stdout.readline, ""):
+                        log.write(line)
+                        log.flush()
 
-                for line in iter(stdout.readline, ""):
-                    log.write(line)
-                    log.flush()
-
-                client.close()
-                update_step_status(step_name, "SUCCESS")
+                set_status("SUCCESS")
 
             except Exception as e:
                 log.write(f"\nERROR: {str(e)}\n")
-                update_step_status(step_name, "FAILED")
+                set_status("FAILED")
 
         return
     
     elif step_name == "staas-download":
 
-        import paramiko
         from scp import SCPClient
 
-        host = "100.76.144.249"
         username = safe(inputs.get("username"))
         password = safe(inputs.get("password"))
         scanId = safe(inputs.get("scanId"))
@@ -358,30 +484,27 @@ def run_step(step_name, inputs=None):
         )
 
 
-        with open(log_file, "a", encoding="utf-8") as log:
+        with open_step_log(log_file, "a") as log:
             try:
-                client = paramiko.SSHClient()
-                client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-                client.connect(hostname=host, username=username, password=password)
+                with ssh_pool.session(REMOTE_HOST, username, password) as client:
+                    stdin, stdout, stderr = client.exec_command(remote_command, get_pty=True)
+                    set_cancel_handler(stdout.channel.close)
 
-                stdin, stdout, stderr = client.exec_command(remote_command, get_pty=True)
+                    for line in iter(stdout.readline, ""):
+                        log.write(line)
+                        log.flush()
 
-                for line in iter(stdout.readline, ""):
-                    log.write(line)
-                    log.flush()
+                    # Download generated report
+                    scp = SCPClient(client.get_transport())
+                    scp.get(remote_report_path, local_path=local_report_path)
 
-                # Download generated report
-                scp = SCPClient(client.get_transport())
-                scp.get(remote_report_path, local_path=local_report_path)
+                    scp.close()
 
-                scp.close()
-                client.close()
-
-                update_step_status(step_name, "SUCCESS")
+                set_status("SUCCESS")
 
             except Exception as e:
                 log.write(f"\nERROR: {str(e)}\n")
-                update_step_status(step_name, "FAILED")
+                set_status("FAILED")
 
         return
 
@@ -400,7 +523,7 @@ def run_step(step_name, inputs=None):
     # =========================================================
     # EXECUTE (FIXED WORKING DIRECTORY ISSUE)
     # =========================================================
-    with open(log_file, "w", encoding="utf-8") as log:
+    with open_step_log(log_file, "w") as log:
 
         try:
             process = subprocess.Popen(
@@ -411,19 +534,32 @@ def run_step(step_name, inputs=None):
                 text=True,
                 bufsize=1
             )
+            set_cancel_handler(process.kill)
+
+            outputs = {}
 
             for line in process.stdout:
                 print(line.strip())
                 log.write(line)
                 log.flush()
 
+                stripped = line.strip()
+                match = OUTPUT_LINE.match(stripped)
+                if match:
+                    outputs[match.group(1)] = match.group(2).strip()
+                match = DOCUMENT_LINE.match(stripped)
+                if match:
+                    outputs["DOCUMENT"] = match.group(1).strip()
+
             process.wait()
 
             if process.returncode == 0:
-                update_step_status(step_name, "SUCCESS")
+                set_status("SUCCESS")
             else:
-                update_step_status(step_name, "FAILED")
+                set_status("FAILED")
+
+            return outputs
 
         except Exception as e:
             log.write(f"\nERROR: {str(e)}\n")
-            update_step_status(step_name, "FAILED")
+            set_status("FAILED")
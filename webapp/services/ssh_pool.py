@@ -0,0 +1,202 @@
+import hashlib
+import threading
+import time
+from contextlib import contextmanager
+
+# =========================================================
+# SHARED SSH CONNECTION POOL
+# =========================================================
+# One authenticated transport per (host, port, user, password)
+# is reused by every remote step. Each exec_command / SFTP
+# session is its own channel on that transport, so concurrent
+# status checks and downloads multiplex over one connection
+# instead of paying a TCP + SSH handshake and login each time.
+
+KEEPALIVE_SECONDS = 30
+
+# Connections unused for this long are closed by the reaper
+IDLE_TIMEOUT_SECONDS = 300
+
+# Channels open at once per connection. sshd refuses channels past
+# MaxSessions (10 by default); two are left spare for channels whose
+# close is still in flight. Each lease reserves the number of channels
+# it opens at most at the same time (session(..., channels=N)): 1 for a
+# remote command, 2 + download workers for a report sync (command,
+# listing SFTP, sha256sum, one SFTP per worker).
+MAX_CHANNELS_PER_CONNECTION = 8
+
+# A lease waiting longer than this for free channels gives up. Nothing
+# can cancel the wait, and a long remote command may hold the channels.
+CHANNEL_WAIT_SECONDS = 300
+
+CONNECT_TIMEOUT_SECONDS = 20
+
+
+class _PooledConnection:
+
+    def __init__(self, client):
+        self.client = client
+        self.free_channels = MAX_CHANNELS_PER_CONNECTION
+        self.channels_freed = threading.Condition()
+        self.leases = 0
+        self.last_used = time.time()
+
+    def is_healthy(self):
+        transport = self.client.get_transport()
+        if transport is None or not transport.is_active():
+            return False
+        try:
+            transport.send_ignore()
+        except Exception:
+            return False
+        return True
+
+    @contextmanager
+    def reserve(self, channels):
+        # All at once: a lease never holds part of its channels while waiting for the rest
+        with self.channels_freed:
+            if not self.channels_freed.wait_for(lambda: self.free_channels >= channels, CHANNEL_WAIT_SECONDS):
+                raise TimeoutError(
+                    f"No {channels} free SSH channel(s) after {CHANNEL_WAIT_SECONDS}s; "
+                    "other remote steps on this server are still running"
+                )
+            self.free_channels -= channels
+        try:
+            yield
+        finally:
+            with self.channels_freed:
+                self.free_channels += channels
+                self.channels_freed.notify_all()
+
+    def close(self):
+        try:
+            self.client.close()
+        except Exception:
+            pass
+
+
+class SSHPool:
+
+    def __init__(self):
+        self._connections = {}
+        self._key_locks = {}
+        self._lock = threading.Lock()
+        self._reaper = None
+
+    @staticmethod
+    def _key(host, port, username, password):
+        # The password is part of the key so a wrong password never
+        # rides on a connection someone else authenticated
+        digest = hashlib.sha256(password.encode("utf-8")).hexdigest()
+        return (host, port, username, digest)
+
+    def _connect(self, host, port, username, password):
+        import paramiko
+
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        client.connect(
+            hostname=host,
+            port=port,
+            username=username,
+            password=password,
+            timeout=CONNECT_TIMEOUT_SECONDS,
+        )
+        client.get_transport().set_keepalive(KEEPALIVE_SECONDS)
+        return client
+
+    def _acquire(self, host, port, username, password):
+        key = self._key(host, port, username, password)
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Per-key lock: callers for the same server wait for one
+        # handshake instead of racing to open their own
+        with key_lock:
+            with self._lock:
+                conn = self._connections.get(key)
+
+            if conn is not None and not conn.is_healthy():
+                with self._lock:
+                    if self._connections.get(key) is conn:
+                        del self._connections[key]
+                    # Otherwise the last lease closes it in _release
+                    unused = conn.leases == 0
+                if unused:
+                    conn.close()
+                conn = None
+
+            if conn is None:
+                conn = _PooledConnection(self._connect(host, port, username, password))
+                with self._lock:
+                    self._connections[key] = conn
+                self._ensure_reaper()
+
+            with self._lock:
+                conn.leases += 1
+                conn.last_used = time.time()
+
+        return key, conn
+
+    def _release(self, key, conn):
+        with self._lock:
+            conn.leases -= 1
+            conn.last_used = time.time()
+            stale = self._connections.get(key) is not conn and conn.leases == 0
+        if stale:
+            conn.close()
+
+    @contextmanager
+    def session(self, host, username, password, port=22, channels=1):
+        """
+        Lease the pooled client for (host, user). The caller may open
+        up to `channels` channels / SFTP sessions on it at a time, but
+        must not close it.
+        """
+        if not 1 <= channels <= MAX_CHANNELS_PER_CONNECTION:
+            raise ValueError(f"A lease can hold 1 to {MAX_CHANNELS_PER_CONNECTION} channels, not {channels}")
+
+        key, conn = self._acquire(host, port, username, password)
+        try:
+            with conn.reserve(channels):
+                yield conn.client
+        finally:
+            self._release(key, conn)
+
+    # -----------------------------------------------------
+    # Idle eviction
+    # -----------------------------------------------------
+
+    def _ensure_reaper(self):
+        with self._lock:
+            if self._reaper is None or not self._reaper.is_alive():
+                self._reaper = threading.Thread(target=self._reap_loop, name="ssh-pool-reaper", daemon=True)
+                self._reaper.start()
+
+    def _reap_loop(self):
+        while True:
+            time.sleep(min(IDLE_TIMEOUT_SECONDS, 60))
+            self.evict_idle()
+
+    def evict_idle(self):
+        now = time.time()
+        with self._lock:
+            idle = [
+                key for key, conn in self._connections.items()
+                if conn.leases == 0 and now - conn.last_used > IDLE_TIMEOUT_SECONDS
+            ]
+            evicted = [self._connections.pop(key) for key in idle]
+
+        for conn in evicted:
+            conn.close()
+
+    def close_all(self):
+        with self._lock:
+            conns = list(self._connections.values())
+            self._connections.clear()
+        for conn in conns:
+            conn.close()
+
+
+pool = SSHPool()
@@ -1,5 +1,10 @@
+import atexit
 import json
 import os
+import threading
+import time
+import uuid
+from services.event_bus import publish
 
 STATE_FILE = "pipeline_state.json"
 
@@ -15,18 +20,96 @@ DEFAULT_STATE = {
     "email": "IDLE"
 }
 
+# Updates landing within this window are written to disk together
+PERSIST_DELAY_SECONDS = 0.2
+
+# =========================================================
+# PROCESS-WIDE STATE STORE
+# =========================================================
+# The dict below is the source of truth; pipeline_state.json is
+# only a write-behind copy. Every mutation bumps the version,
+# which doubles as the /status ETag.
+
+_state = dict(DEFAULT_STATE)
+_version = 0
+_lock = threading.Lock()
+
+# Distinguishes ETags across server restarts, when versions start over
+_instance_id = uuid.uuid4().hex[:8]
+
+_dirty = threading.Event()
+# Serialises disk writes so an older snapshot never overwrites a newer one
+_write_lock = threading.Lock()
+_writer = None
+
+
+def _write_atomic(state):
+    tmp_file = f"{STATE_FILE}.tmp"
+    with open(tmp_file, "w") as f:
+        json.dump(state, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, STATE_FILE)
+
+
+def _persist_loop():
+    while True:
+        _dirty.wait()
+        # Coalesce bursts of updates into one write
+        time.sleep(PERSIST_DELAY_SECONDS)
+        flush_state()
+
+
+def _ensure_writer():
+    global _writer
+    with _lock:
+        if _writer is None or not _writer.is_alive():
+            _writer = threading.Thread(target=_persist_loop, name="state-writer", daemon=True)
+            _writer.start()
+
+
+def flush_state():
+    """Write the current state to disk if it changed since the last write."""
+    with _write_lock:
+        with _lock:
+            if not _dirty.is_set():
+                return
+            _dirty.clear()
+            snapshot = dict(_state)
+        _write_atomic(snapshot)
+
+
+atexit.register(flush_state)
+
+
 def init_state():
-    with open(STATE_FILE, "w") as f:
-        json.dump(DEFAULT_STATE, f)
+    global _state, _version
+    with _lock:
+        _state = dict(DEFAULT_STATE)
+        _version += 1
+        _dirty.set()
+    flush_state()
+    _ensure_writer()
+
 
 def get_state():
-    if not os.path.exists(STATE_FILE):
-        return DEFAULT_STATE
-    with open(STATE_FILE, "r") as f:
-        return json.load(f)
+    with _lock:
+        return dict(_state)
+
+
+def get_state_snapshot():
+    """Return (etag, state) taken under the same lock."""
+    with _lock:
+        return f'"{_instance_id}-{_version}"', dict(_state)
+
 
 def update_step_status(step, status):
-    state = get_state()
-    state[step] = status
-    with open(STATE_FILE, "w") as f:
-        json.dump(state, f)
+    global _version
+    with _lock:
+        _state[step] = status
+        _version += 1
+        _dirty.set()
+        # Published under the lock so subscribers get transitions in version
+        # order; publish() only schedules the event on each subscriber's loop
+        publish("status", {"step": step, "status": status, "version": _version})
+    _ensure_writer()
@@ -1,5 +1,11 @@
 let currentLogStep = null;
-let logInterval = null;
+let eventSource = null;
+
+// Position in the current step's log, as returned by /logs?offset=N
+let logOffset = 0;
+let logGeneration = null;
+let logFetchInFlight = false;
+let logEventsMissed = false;
 
 /* ================= GENERIC RUN ================= */
 
@@ -16,51 +22,152 @@ function runStep(step, payload = {}) {
 /* ================= LOG PANEL ================= */
 
 function showLogs(step) {
+    if (step !== currentLogStep) {
+        resetLogs();
+    }
     currentLogStep = step;
     document.getElementById("logTitle").innerText = step.toUpperCase() + " Logs";
     document.getElementById("logsPanel").style.display = "block";
     fetchLogs();
+}
 
-    if (logInterval) clearInterval(logInterval);
-    logInterval = setInterval(fetchLogs, 2000);
+function resetLogs() {
+    logOffset = 0;
+    logGeneration = null;
+    document.getElementById("logsBox").textContent = "";
 }
 
 function fetchLogs() {
-    if (!currentLogStep) return;
+    if (!currentLogStep || logFetchInFlight) return;
 
-    fetch(`/logs/${currentLogStep}`)
+    const step = currentLogStep;
+    let url = `/logs/${step}?offset=${logOffset}`;
+    if (logGeneration !== null) url += `&generation=${logGeneration}`;
+
+    logFetchInFlight = true;
+    fetch(url)
         .then(res => res.json())
         .then(data => {
-            document.getElementById("logsBox").textContent = data.logs;
-        });
+            logFetchInFlight = false;
+            if (step !== currentLogStep) return;
+
+            const missed = logEventsMissed;
+            logEventsMissed = false;
+
+            if (data.reset) {
+                document.getElementById("logsBox").textContent = "";
+            }
+            appendLogs(data.logs);
+            logOffset = data.offset;
+            logGeneration = data.generation;
+
+            if (data.more || missed) fetchLogs();
+        })
+        .catch(() => { logFetchInFlight = false; });
+}
+
+function appendLogs(text) {
+    if (!text) return;
+    const box = document.getElementById("logsBox");
+    if (!box) return;
+    box.textContent += text;
+    box.scrollTop = box.scrollHeight;
+}
+
+function onLogEvent(data) {
+    if (data.step !== currentLogStep) return;
+
+    if (logFetchInFlight) {
+        logEventsMissed = true;
+        return;
+    }
+
+    if (data.generation !== logGeneration) {
+        fetchLogs();
+        return;
+    }
+
+    const start = data.offset - new TextEncoder().encode(data.text).length;
+
+    if (start === logOffset) {
+        appendLogs(data.text);
+        logOffset = data.offset;
+    } else if (data.offset > logOffset) {
+        // Missed a chunk, catch up from the server
+        fetchLogs();
+    }
 }
 
 function closeLogs() {
     document.getElementById("logsPanel").style.display = "none";
     currentLogStep = null;
-    clearInterval(logInterval);
 }
 
 /* ================= STATUS ================= */
 
+function renderStatus(step, status) {
+    let card = document.getElementById(step);
+    if (!card) return;
+
+    let statusSpan = card.querySelector(".status");
+    if (!statusSpan) return;
+
+    statusSpan.innerHTML =
+        status === "SUCCESS" ? "🟢" :
+        status === "FAILED" ? "🔴" :
+        status === "RUNNING" ? "🟡" :
+        status === "QUEUED" ? "⏳" :
+        status === "CANCELLED" ? "⚫" : "⚪";
+}
+
 function refreshStatus() {
     fetch("/status")
         .then(res => res.json())
         .then(data => {
             for (let step in data) {
-                let card = document.getElementById(step);
-                if (!card) continue;
-
-                let statusSpan = card.querySelector(".status");
-
-                statusSpan.innerHTML =
-                    data[step] === "SUCCESS" ? "🟢" :
-                    data[step] === "FAILED" ? "🔴" :
-                    data[step] === "RUNNING" ? "🟡" : "⚪";
+                renderStatus(step, data[step]);
             }
         });
 }
-setInterval(refreshStatus, 2000);
+
+/* ================= LIVE EVENTS ================= */
+
+function connectEvents() {
+    eventSource = new EventSource("/events");
+
+    eventSource.addEventListener("snapshot", e => {
+        const data = JSON.parse(e.data);
+        for (let step in data) {
+            renderStatus(step, data[step]);
+        }
+    });
+
+    eventSource.addEventListener("status", e => {
+        const data = JSON.parse(e.data);
+        renderStatus(data.step, data.status);
+    });
+
+    eventSource.addEventListener("log-reset", e => {
+        const data = JSON.parse(e.data);
+        if (data.step === currentLogStep) {
+            resetLogs();
+            logGeneration = data.generation;
+        }
+    });
+
+    eventSource.addEventListener("log", e => onLogEvent(JSON.parse(e.data)));
+
+    // EventSource reconnects on its own; resync what was missed meanwhile
+    eventSource.onopen = () => fetchLogs();
+}
+
+if (window.EventSource) {
+    connectEvents();
+} else {
+    refreshStatus();
+    setInterval(refreshStatus, 2000);
+    setInterval(fetchLogs, 2000);
+}
 
 /* ================= MODALS ================= */
 